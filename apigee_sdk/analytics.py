@@ -0,0 +1,402 @@
+import hashlib
+import json
+import os
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+from apigee_sdk.concurrency import RateLimiter, run_concurrently
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+TIME_RANGE_FORMAT = "%m/%d/%Y %H:%M"
+
+
+def _as_utc(moment):
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment.astimezone(timezone.utc)
+
+
+def format_time_range(start, end):
+    """
+    Formats two datetimes as an Apigee ``timeRange`` parameter.
+
+    Args:
+        start (datetime): The start of the range. Naive datetimes are treated as UTC.
+        end (datetime): The end of the range. Naive datetimes are treated as UTC.
+
+    Returns:
+        str: The time range, e.g. ``"10/01/2026 00:00~10/02/2026 00:00"``.
+    """
+    return f"{_as_utc(start).strftime(TIME_RANGE_FORMAT)}~{_as_utc(end).strftime(TIME_RANGE_FORMAT)}"
+
+
+def split_time_range(start, end, window):
+    """
+    Splits a time range into consecutive windows aligned to multiples of the window size.
+
+    Aligned windows keep the same boundaries between runs, so their cached results can be reused.
+    The first and last windows are clipped to the requested range.
+
+    Args:
+        start (datetime): The start of the range.
+        end (datetime): The end of the range.
+        window (timedelta): The window size.
+
+    Returns:
+        list: ``(window_start, window_end)`` tuples of UTC datetimes, in chronological order.
+    """
+    start, end = _as_utc(start), _as_utc(end)
+    boundary = EPOCH + ((start - EPOCH) // window) * window
+    windows = []
+    while boundary < end:
+        window_end = boundary + window
+        windows.append((max(boundary, start), min(window_end, end)))
+        boundary = window_end
+    return windows
+
+
+_COMBINE = {"sum": sum, "count": sum, "min": min, "max": max}
+
+
+def _merge_values(metric_name, values):
+    if all(isinstance(value, dict) for value in values):
+        return sorted(values, key=lambda value: value.get("timestamp", 0))
+    combine = _COMBINE.get(metric_name.split("(", 1)[0].strip().lower())
+    if combine is None or len(values) < 2:
+        return values
+    return [str(float(combine(float(value) for value in values)))]
+
+
+def merge_stats(responses):
+    """
+    Merges stats responses for consecutive time windows into a single response.
+
+    Time-series values (queried with a ``timeUnit``) are concatenated per environment, dimension
+    and metric and sorted by timestamp. Without a ``timeUnit``, every window returns a single
+    aggregate value per metric: those of ``sum``, ``count``, ``min`` and ``max`` metrics are
+    combined into one value for the whole range, while other aggregates such as ``avg`` cannot be
+    combined without the underlying counts and keep one value per window, in window order.
+
+    Args:
+        responses (list): The stats responses, in chronological order.
+
+    Returns:
+        dict: A stats response containing the values of every window.
+    """
+    environments = {}
+    meta_data = {}
+    for response in responses:
+        meta_data = response.get("metaData", meta_data)
+        for environment in response.get("environments", []):
+            dimensions = environments.setdefault(environment["name"], {})
+            for dimension in environment.get("dimensions", []):
+                metrics = dimensions.setdefault(dimension["name"], {})
+                for metric in dimension.get("metrics", []):
+                    metrics.setdefault(metric["name"], []).extend(metric.get("values", []))
+    return {
+        "environments": [
+            {
+                "name": env_name,
+                "dimensions": [
+                    {
+                        "name": dimension_name,
+                        "metrics": [
+                            {"name": metric_name, "values": _merge_values(metric_name, values)}
+                            for metric_name, values in metrics.items()
+                        ],
+                    }
+                    for dimension_name, metrics in dimensions.items()
+                ],
+            }
+            for env_name, dimensions in environments.items()
+        ],
+        "metaData": meta_data,
+    }
+
+
+class AnalyticsClient:
+    """
+    Client to query API analytics in Apigee Edge.
+
+    Long time ranges are split into windows that are fetched concurrently and merged in order.
+    When a cache directory is configured, the results of windows that ended more than
+    ``settle_delay`` ago are stored on disk and reused by later queries. Analytics data arrives
+    late, so windows that closed more recently are always fetched again.
+
+    Attributes:
+        base_url (str): The base URL for the Apigee API.
+        token (str): The authorization token for accessing the API.
+        cache_dir (str): Optional directory for cached window results.
+        settle_delay (timedelta): How long after its end a window is considered complete.
+    """
+
+    def __init__(self, base_url, token, cache_dir=None, settle_delay=timedelta(hours=1)):
+        """
+        Initializes the AnalyticsClient with the base URL and authorization token.
+
+        Args:
+            base_url (str): The base URL for the Apigee API.
+            token (str): The authorization token for accessing the API.
+            cache_dir (str): Optional directory for cached window results.
+            settle_delay (timedelta): How long after its end a window is considered complete and
+                may be cached.
+        """
+        self.base_url = base_url
+        self.token = token
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.settle_delay = settle_delay
+
+    def _handle_request_errors(self, response):
+        """
+        Handles common HTTP request errors.
+
+        Args:
+            response (requests.Response): The HTTP response object.
+
+        Raises:
+            Exception: If an HTTP error or other error occurs.
+        """
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as http_err:
+            if response.status_code >= 400 and response.status_code < 500:
+                error_message = response.json().get("message", "Unknown error")
+                raise Exception(f"Error {response.status_code}: {error_message}")
+            raise Exception(f"HTTP error occurred: {http_err}")
+        except Exception as err:
+            raise Exception(f"Failed to process the request: {err}")
+
+    def get_stats(self, org, env, dimension, select, time_range, time_unit=None, filter=None):
+        """
+        Gets analytics stats for a single time range.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            dimension (str): The dimension to group by, e.g. ``"apis"`` or ``"developer_app"``.
+            select (str): The metrics to return, e.g. ``"sum(message_count)"``.
+            time_range (str): The time range, e.g. ``"10/01/2026 00:00~10/02/2026 00:00"``.
+            time_unit (str): Optional aggregation interval, e.g. ``"hour"``.
+            filter (str): Optional filter expression.
+
+        Returns:
+            dict: The response from the API containing the stats.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        url = f"{self.base_url}/v1/organizations/{org}/environments/{env}/stats/{dimension}"
+        headers = {
+            "Authorization": f"Bearer {self.token}"
+        }
+        params = {"select": select, "timeRange": time_range, "timeUnit": time_unit, "filter": filter}
+        params = {name: value for name, value in params.items() if value is not None}
+        response = requests.get(url, headers=headers, params=params)
+        self._handle_request_errors(response)
+        return response.json()
+
+    def _cache_path(self, *key):
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def query_stats(self, org, env, dimension, select, start, end, time_unit="hour", window=timedelta(days=1),
+                    filter=None, max_workers=4, rate=None):
+        """
+        Gets analytics stats for a long time range by fetching windows concurrently.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            dimension (str): The dimension to group by, e.g. ``"apis"``.
+            select (str): The metrics to return, e.g. ``"sum(message_count)"``.
+            start (datetime): The start of the range. Naive datetimes are treated as UTC.
+            end (datetime): The end of the range. Naive datetimes are treated as UTC.
+            time_unit (str): The aggregation interval, e.g. ``"hour"``. With None, every window
+                returns one aggregate value per metric, merged as described in ``merge_stats``.
+            window (timedelta): The size of each fetched window.
+            filter (str): Optional filter expression.
+            max_workers (int): The maximum number of concurrent requests.
+            rate (float): Optional maximum number of requests per second.
+
+        Returns:
+            dict: The merged stats response for the whole range.
+
+        Raises:
+            Exception: If a window could not be fetched.
+        """
+        settled = datetime.now(timezone.utc) - self.settle_delay
+        windows = split_time_range(start, end, window)
+
+        def fetch(window_range):
+            time_range = format_time_range(*window_range)
+            path = None
+            if self.cache_dir and window_range[1] <= settled:
+                path = self._cache_path(org, env, dimension, select, time_unit, filter, time_range)
+                if os.path.exists(path):
+                    with open(path, encoding="utf-8") as cached:
+                        return json.load(cached)
+            result = self.get_stats(org, env, dimension, select, time_range, time_unit=time_unit, filter=filter)
+            if path:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(f"{path}.tmp", "w", encoding="utf-8") as cached:
+                    json.dump(result, cached)
+                os.replace(f"{path}.tmp", path)
+            return result
+
+        results = {}
+        rate_limiter = RateLimiter(rate) if rate else None
+        for outcome in run_concurrently(fetch, windows, max_workers, rate_limiter=rate_limiter):
+            if outcome["error"]:
+                raise Exception(f"Failed to fetch stats for {format_time_range(*outcome['item'])}: {outcome['error']}")
+            results[outcome["item"]] = outcome["result"]
+        return merge_stats([results[window_range] for window_range in windows])
+
+    def submit_query(self, org, env, payload):
+        """
+        Submits an asynchronous analytics query.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            payload (dict): The query definition, e.g. ``{"metrics": [...], "dimensions": [...], "timeRange": ...}``.
+
+        Returns:
+            dict: The response from the API containing the query state and its ``self`` link.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        url = f"{self.base_url}/v1/organizations/{org}/environments/{env}/queries"
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.token}"
+        }
+        response = requests.post(url, headers=headers, json=payload)
+        self._handle_request_errors(response)
+        return response.json()
+
+    def get_query(self, org, env, query_id):
+        """
+        Gets the state of an asynchronous analytics query.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            query_id (str): The query ID.
+
+        Returns:
+            dict: The response from the API containing the query state.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        url = f"{self.base_url}/v1/organizations/{org}/environments/{env}/queries/{query_id}"
+        headers = {
+            "Authorization": f"Bearer {self.token}"
+        }
+        response = requests.get(url, headers=headers)
+        self._handle_request_errors(response)
+        return response.json()
+
+    def wait_for_query(self, org, env, query_id, timeout=3600, poll_interval=2, max_poll_interval=60):
+        """
+        Polls an asynchronous analytics query with exponential backoff until it completes.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            query_id (str): The query ID.
+            timeout (float): The maximum number of seconds to wait.
+            poll_interval (float): The initial number of seconds between polls.
+            max_poll_interval (float): The upper bound of the polling backoff.
+
+        Returns:
+            dict: The final query state.
+
+        Raises:
+            Exception: If the query fails, does not complete in time, or the API request fails.
+        """
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        while True:
+            query = self.get_query(org, env, query_id)
+            state = query.get("state")
+            if state == "completed":
+                return query
+            if state == "failed":
+                raise Exception(f"Analytics query {query_id} failed: {query.get('error', 'Unknown error')}")
+            if time.monotonic() >= deadline:
+                raise Exception(f"Timed out waiting for analytics query {query_id}")
+            time.sleep(min(interval, max(deadline - time.monotonic(), 0)))
+            interval = min(interval * 2, max_poll_interval)
+
+    def stream_query_result(self, org, env, query_id, chunk_size=65536):
+        """
+        Downloads the gzipped result of a completed query and yields its rows incrementally.
+
+        The download is decompressed chunk by chunk, so only one chunk and one partial line are
+        held in memory at a time.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            query_id (str): The query ID.
+            chunk_size (int): The number of bytes read from the network at a time.
+
+        Yields:
+            dict: One result row per newline-delimited JSON line.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        url = f"{self.base_url}/v1/organizations/{org}/environments/{env}/queries/{query_id}/result"
+        headers = {
+            "Authorization": f"Bearer {self.token}"
+        }
+        response = requests.get(url, headers=headers, stream=True)
+        self._handle_request_errors(response)
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        pending = b""
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                while chunk:
+                    pending += decompressor.decompress(chunk)
+                    chunk = b""
+                    if decompressor.eof:
+                        chunk = decompressor.unused_data
+                        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    *lines, pending = pending.split(b"\n")
+                    for line in lines:
+                        if line.strip():
+                            yield json.loads(line)
+            pending += decompressor.flush()
+            for line in pending.split(b"\n"):
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            response.close()
+
+    def run_query(self, org, env, payload, timeout=3600, poll_interval=2, max_poll_interval=60):
+        """
+        Submits an asynchronous analytics query, waits for it, and streams its result rows.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            payload (dict): The query definition.
+            timeout (float): The maximum number of seconds to wait for the query.
+            poll_interval (float): The initial number of seconds between polls.
+            max_poll_interval (float): The upper bound of the polling backoff.
+
+        Yields:
+            dict: One result row at a time.
+
+        Raises:
+            Exception: If the query fails or an API request fails.
+        """
+        submitted = self.submit_query(org, env, payload)
+        query_id = submitted.get("self", "").rstrip("/").rsplit("/", 1)[-1] or submitted.get("name")
+        self.wait_for_query(org, env, query_id, timeout=timeout, poll_interval=poll_interval,
+                            max_poll_interval=max_poll_interval)
+        yield from self.stream_query_result(org, env, query_id)
@@ -0,0 +1,195 @@
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NAN = float("nan")
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
+
+
+class StatsColumns:
+    """
+    Columnar representation of an analytics stats response.
+
+    Every row is one (environment, dimension, timestamp) point. Environment and dimension names
+    are dictionary-encoded as integer codes, and every metric is a float column aligned with the
+    rows; missing values are NaN. Columns are NumPy arrays when NumPy is installed and
+    ``array.array`` buffers otherwise.
+
+    Attributes:
+        timestamps: The row timestamps in milliseconds (0 when the response has no time unit).
+        environment_codes: The row environment codes, indexing ``environments``.
+        dimension_codes: The row dimension codes, indexing ``dimensions``.
+        environments (list): The environment names.
+        dimensions (list): The dimension names, e.g. API proxy names.
+        metrics (dict): A mapping of metric names to float columns.
+    """
+
+    def __init__(self, timestamps, environment_codes, dimension_codes, environments, dimensions, metrics):
+        """
+        Initializes the StatsColumns. Use :meth:`from_response` to build one from a stats response.
+
+        Args:
+            timestamps (list): The row timestamps in milliseconds.
+            environment_codes (list): The row environment codes.
+            dimension_codes (list): The row dimension codes.
+            environments (list): The environment names.
+            dimensions (list): The dimension names.
+            metrics (dict): A mapping of metric names to lists of floats.
+        """
+        if numpy is not None:
+            self.timestamps = numpy.asarray(timestamps, dtype=numpy.int64)
+            self.environment_codes = numpy.asarray(environment_codes, dtype=numpy.int32)
+            self.dimension_codes = numpy.asarray(dimension_codes, dtype=numpy.int32)
+            self.metrics = {name: numpy.asarray(values, dtype=numpy.float64) for name, values in metrics.items()}
+        else:
+            self.timestamps = array("q", timestamps)
+            self.environment_codes = array("i", environment_codes)
+            self.dimension_codes = array("i", dimension_codes)
+            self.metrics = {name: array("d", values) for name, values in metrics.items()}
+        self.environments = environments
+        self.dimensions = dimensions
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    @classmethod
+    def from_response(cls, response):
+        """
+        Converts a stats response, such as one from ``get_api_metrics`` or ``query_stats``, to columns.
+
+        Args:
+            response (dict): The stats response.
+
+        Returns:
+            StatsColumns: The columnar representation of the response.
+        """
+        environments, dimensions, rows, metrics = [], [], {}, {}
+        environment_index, dimension_index = {}, {}
+        timestamps, environment_codes, dimension_codes = [], [], []
+        for environment in response.get("environments", []):
+            env_code = environment_index.setdefault(environment["name"], len(environments))
+            if env_code == len(environments):
+                environments.append(environment["name"])
+            for dimension in environment.get("dimensions", []):
+                dim_code = dimension_index.setdefault(dimension["name"], len(dimensions))
+                if dim_code == len(dimensions):
+                    dimensions.append(dimension["name"])
+                for metric in dimension.get("metrics", []):
+                    column = metrics.setdefault(metric["name"], [])
+                    for value in metric.get("values", []):
+                        if isinstance(value, dict):
+                            timestamp, number = int(value.get("timestamp", 0)), value.get("value")
+                        else:
+                            timestamp, number = 0, value
+                        key = (env_code, dim_code, timestamp)
+                        row = rows.get(key)
+                        if row is None:
+                            row = rows[key] = len(timestamps)
+                            timestamps.append(timestamp)
+                            environment_codes.append(env_code)
+                            dimension_codes.append(dim_code)
+                        column.extend([NAN] * (row + 1 - len(column)))
+                        column[row] = _to_float(number)
+        for column in metrics.values():
+            column.extend([NAN] * (len(timestamps) - len(column)))
+        return cls(timestamps, environment_codes, dimension_codes, environments, dimensions, metrics)
+
+    def to_dataframe(self):
+        """
+        Converts the columns to a pandas DataFrame with categorical environment and dimension columns.
+
+        Returns:
+            pandas.DataFrame: One row per (environment, dimension, timestamp) point.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        import pandas
+
+        return pandas.DataFrame({
+            "timestamp": pandas.to_datetime(self.timestamps, unit="ms", utc=True),
+            "environment": pandas.Categorical.from_codes(self.environment_codes, self.environments),
+            "dimension": pandas.Categorical.from_codes(self.dimension_codes, self.dimensions),
+            **self.metrics,
+        })
+
+    def percentile(self, metric, q):
+        """
+        Computes a percentile of a metric over every row, ignoring missing values.
+
+        Args:
+            metric (str): The metric name.
+            q (float): The percentile, between 0 and 100.
+
+        Returns:
+            float: The percentile value, or None if the metric has no values.
+        """
+        values = self.metrics[metric]
+        if numpy is not None:
+            present = values[~numpy.isnan(values)]
+            return float(numpy.percentile(present, q)) if present.size else None
+        ordered = sorted(value for value in values if value == value)
+        if not ordered:
+            return None
+        rank = (len(ordered) - 1) * q / 100.0
+        lower = int(rank)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+    def rollup(self, metric, interval_ms):
+        """
+        Sums a metric into coarser time buckets across every environment and dimension.
+
+        Args:
+            metric (str): The metric name.
+            interval_ms (int): The bucket size in milliseconds, e.g. ``86400000`` for days.
+
+        Returns:
+            list: ``(bucket_timestamp, total)`` tuples in chronological order.
+        """
+        values = self.metrics[metric]
+        if numpy is not None:
+            present = ~numpy.isnan(values)
+            buckets = (self.timestamps[present] // interval_ms) * interval_ms
+            keys, inverse = numpy.unique(buckets, return_inverse=True)
+            totals = numpy.bincount(inverse, weights=values[present], minlength=len(keys))
+            return [(int(key), float(total)) for key, total in zip(keys, totals)]
+        totals = {}
+        for timestamp, value in zip(self.timestamps, values):
+            if value == value:
+                bucket = (timestamp // interval_ms) * interval_ms
+                totals[bucket] = totals.get(bucket, 0.0) + value
+        return sorted(totals.items())
+
+    def top_n(self, metric, n=10):
+        """
+        Returns the dimensions with the highest total of a metric.
+
+        Args:
+            metric (str): The metric name.
+            n (int): The number of dimensions to return.
+
+        Returns:
+            list: ``(dimension, total)`` tuples, highest total first.
+        """
+        values = self.metrics[metric]
+        if numpy is not None:
+            present = ~numpy.isnan(values)
+            totals = numpy.bincount(self.dimension_codes[present], weights=values[present], minlength=len(self.dimensions))
+            order = numpy.argsort(-totals, kind="stable")[:n]
+            return [(self.dimensions[code], float(totals[code])) for code in order]
+        totals = [0.0] * len(self.dimensions)
+        for code, value in zip(self.dimension_codes, values):
+            if value == value:
+                totals[code] += value
+        order = sorted(range(len(totals)), key=lambda code: -totals[code])[:n]
+        return [(self.dimensions[code], totals[code]) for code in order]
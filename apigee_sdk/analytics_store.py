@@ -0,0 +1,204 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+from apigee_sdk.analytics import EPOCH
+
+
+def _to_millis(moment):
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int((moment - EPOCH) / timedelta(milliseconds=1))
+
+
+def _from_millis(millis):
+    return EPOCH + timedelta(milliseconds=millis)
+
+
+def _bucket_start(moment, time_unit):
+    moment = moment.astimezone(timezone.utc) if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+    if time_unit == "minute":
+        return moment.replace(second=0, microsecond=0)
+    if time_unit == "hour":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if time_unit == "week":
+        return day - timedelta(days=day.weekday())
+    if time_unit == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _selection(select):
+    return ",".join(sorted({part.strip() for part in select.split(",") if part.strip()}))
+
+
+class AnalyticsStore:
+    """
+    Local, append-only SQLite store for analytics stats.
+
+    Points are keyed by environment, stats dimension (e.g. ``"apis"``), dimension value
+    (e.g. an API proxy name), metric and timestamp. A high-water mark is kept per environment,
+    stats dimension and selection of metrics, so a sync only fetches data newer than what is
+    already stored for the same metrics, and a newly synced metric starts from its own history.
+    A sync moves the mark to the start of the last settled bucket of the queried range, whether
+    or not any points came back, so idle environments are not fetched again from the start.
+
+    Attributes:
+        path (str): The path of the SQLite database.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the AnalyticsStore, creating the database if needed.
+
+        Args:
+            path (str): The path of the SQLite database.
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS points ("
+                "environment TEXT, dimension TEXT, dimension_value TEXT, metric TEXT, timestamp INTEGER, value REAL, "
+                "PRIMARY KEY (environment, dimension, metric, dimension_value, timestamp)) WITHOUT ROWID"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks (environment TEXT, dimension TEXT, selection TEXT, "
+                "high_water INTEGER, PRIMARY KEY (environment, dimension, selection))"
+            )
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
+
+    def high_water_mark(self, env, dimension, select):
+        """
+        Returns where the next sync of a selection of metrics starts.
+
+        Args:
+            env (str): The environment name.
+            dimension (str): The stats dimension, e.g. ``"apis"``.
+            select (str): The metrics, e.g. ``"sum(message_count),avg(total_response_time)"``. The
+                order of the metrics does not matter.
+
+        Returns:
+            datetime: The high-water mark in UTC, or None if nothing was stored or synced yet.
+        """
+        row = self.connection.execute(
+            "SELECT high_water FROM watermarks WHERE environment = ? AND dimension = ? AND selection = ?",
+            (env, dimension, _selection(select)),
+        ).fetchone()
+        return _from_millis(row[0]) if row else None
+
+    def _advance(self, env, dimension, selection, timestamp):
+        self.connection.execute(
+            "INSERT INTO watermarks VALUES (?, ?, ?, ?) ON CONFLICT (environment, dimension, selection) "
+            "DO UPDATE SET high_water = MAX(high_water, excluded.high_water)",
+            (env, dimension, selection, timestamp),
+        )
+
+    def write(self, dimension, response, select=None, advance=True):
+        """
+        Stores the points of a stats response and advances the high-water marks.
+
+        Points that are already stored are replaced, so partial buckets are updated on the next sync.
+
+        Args:
+            dimension (str): The stats dimension the response was queried for.
+            response (dict): The stats response, e.g. from ``AnalyticsClient.query_stats``.
+            select (str): The metrics the response was queried for. Defaults to the metric names
+                found in the response.
+            advance (bool): Whether to advance the high-water marks to the newest timestamp of
+                every environment in the response.
+
+        Returns:
+            int: The number of points written.
+        """
+        rows = []
+        newest = {}
+        metrics = set()
+        for environment in response.get("environments", []):
+            env = environment["name"]
+            for dimension_entry in environment.get("dimensions", []):
+                for metric in dimension_entry.get("metrics", []):
+                    metrics.add(metric["name"])
+                    for value in metric.get("values", []):
+                        if not isinstance(value, dict):
+                            continue
+                        timestamp = int(value["timestamp"])
+                        rows.append((env, dimension, dimension_entry["name"], metric["name"], timestamp, float(value["value"])))
+                        newest[env] = max(newest.get(env, timestamp), timestamp)
+        selection = _selection(select if select is not None else ",".join(metrics))
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?, ?, ?)", rows)
+            for env, timestamp in newest.items() if advance else ():
+                self._advance(env, dimension, selection, timestamp)
+        return len(rows)
+
+    def sync(self, client, org, env, dimension, select, since, until=None, time_unit="hour",
+             window=timedelta(days=1), max_workers=4, rate=None, settle_delay=timedelta(hours=1)):
+        """
+        Fetches the stats newer than the high-water mark and stores them.
+
+        The high-water mark then moves to the start of the bucket that contains
+        ``until - settle_delay``, even if no points came back, so the next sync fetches that
+        possibly incomplete bucket and everything after it again, but nothing older.
+
+        Args:
+            client (AnalyticsClient): The client used to query the stats.
+            org (str): The organization name.
+            env (str): The environment name.
+            dimension (str): The stats dimension, e.g. ``"apis"``.
+            select (str): The metrics to fetch, e.g. ``"sum(message_count)"``.
+            since (datetime): Where to start when nothing is stored yet.
+            until (datetime): The end of the range to fetch. Defaults to now.
+            time_unit (str): The aggregation interval, e.g. ``"hour"``.
+            window (timedelta): The size of each fetched window.
+            max_workers (int): The maximum number of concurrent requests.
+            rate (float): Optional maximum number of requests per second.
+            settle_delay (timedelta): How long after its end a bucket is considered complete.
+
+        Returns:
+            int: The number of points written.
+        """
+        until = until or datetime.now(timezone.utc)
+        start = self.high_water_mark(env, dimension, select) or since
+        if _to_millis(start) >= _to_millis(until):
+            return 0
+        response = client.query_stats(org, env, dimension, select, start, until, time_unit=time_unit,
+                                      window=window, max_workers=max_workers, rate=rate)
+        written = self.write(dimension, response, select=select, advance=False)
+        settled = _bucket_start(until - settle_delay, time_unit)
+        with self.connection:
+            self._advance(env, dimension, _selection(select), _to_millis(max(settled, _bucket_start(start, time_unit))))
+        return written
+
+    def query(self, env, dimension, metric, start, end, dimension_value=None):
+        """
+        Reads stored points for a time range.
+
+        Args:
+            env (str): The environment name.
+            dimension (str): The stats dimension, e.g. ``"apis"``.
+            metric (str): The metric name, e.g. ``"sum(message_count)"``.
+            start (datetime): The inclusive start of the range.
+            end (datetime): The exclusive end of the range.
+            dimension_value (str): Optional dimension value, e.g. an API proxy name.
+
+        Returns:
+            list: ``(dimension_value, timestamp_ms, value)`` tuples ordered by dimension value and time.
+        """
+        sql = ("SELECT dimension_value, timestamp, value FROM points "
+               "WHERE environment = ? AND dimension = ? AND metric = ? AND timestamp >= ? AND timestamp < ?")
+        params = [env, dimension, metric, _to_millis(start), _to_millis(end)]
+        if dimension_value is not None:
+            sql += " AND dimension_value = ?"
+            params.append(dimension_value)
+        sql += " ORDER BY dimension_value, timestamp"
+        return self.connection.execute(sql, params).fetchall()
@@ -1,3 +1,5 @@
+from urllib.parse import urlencode
+
 import requests
 
 class CachesClient:
@@ -10,18 +12,21 @@ class CachesClient:
     Attributes:
         base_url (str): The base URL for the Apigee API.
         headers (dict): The headers used for API requests, including the authorization token.
+        session: The ``requests.Session`` or the ``requests`` module used to send requests.
     """
 
-    def __init__(self, base_url, token):
+    def __init__(self, base_url, token, session=None):
         """
         Initializes the CachesClient with the base URL and authorization token.
 
         Args:
             base_url (str): The base URL for the Apigee API.
             token (str): The authorization token for accessing the API.
+            session (requests.Session): Optional session whose connection pool is used for every request.
         """
         self.base_url = base_url
         self.headers = {"Authorization": f"Bearer {token}"}
+        self.session = session or requests
 
     def create_cache(self, payload):
         """
@@ -36,7 +41,7 @@ class CachesClient:
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/caches",
             headers={"Content-Type": "application/json", **self.headers},
             json=payload
@@ -57,7 +62,7 @@ class CachesClient:
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.delete(
+        response = self.session.delete(
             f"{self.base_url}/caches/{cache_id}",
             headers=self.headers
         )
@@ -77,7 +82,7 @@ class CachesClient:
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/caches/{cache_id}",
             headers=self.headers
         )
@@ -94,7 +99,7 @@ class CachesClient:
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/caches",
             headers=self.headers
         )
@@ -115,10 +120,31 @@ class CachesClient:
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.put(
+        response = self.session.put(
             f"{self.base_url}/caches/{cache_id}",
             headers={"Content-Type": "application/json", **self.headers},
             json=payload
         )
         response.raise_for_status()
-        return response.json()
\ No newline at end of file
+        return response.json()
+
+    def clear_entries(self, cache_id, prefix=None):
+        """
+        Clears the entries of a cache.
+
+        Args:
+            cache_id (str): The ID of the cache to clear.
+            prefix (str): Optional key prefix; only entries whose keys start with it are cleared.
+
+        Returns:
+            dict: The response from the API, or an empty dict if it has no body.
+
+        Raises:
+            HTTPError: If the API request fails.
+        """
+        params = {"action": "clear"}
+        if prefix is not None:
+            params["prefix"] = prefix
+        response = self.session.post(f"{self.base_url}/caches/{cache_id}/entries?{urlencode(params)}", headers=self.headers)
+        response.raise_for_status()
+        return response.json() if response.content else {}
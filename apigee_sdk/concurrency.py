@@ -0,0 +1,86 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that limits how many calls are started per second.
+
+    Attributes:
+        rate (float): The number of calls allowed per second.
+        burst (int): The number of calls that may be started at once after an idle period.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Initializes the RateLimiter.
+
+        Args:
+            rate (float): The number of calls allowed per second.
+            burst (int): The bucket size. Defaults to ``max(1, int(rate))``.
+        """
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a call may be started.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+
+def run_concurrently(func, items, max_workers=8, rate_limiter=None):
+    """
+    Calls a function for every item using a pool of worker threads.
+
+    At most ``max_workers * 2`` calls are in flight at any time, so large item
+    iterables are consumed lazily instead of being submitted all at once.
+
+    Args:
+        func (callable): The function to call with each item.
+        items (iterable): The items to process.
+        max_workers (int): The maximum number of concurrent calls.
+        rate_limiter (RateLimiter): Optional limiter acquired before every call.
+
+    Yields:
+        dict: One result per item, in completion order, with the keys ``item``,
+            ``result``, ``error`` (the raised exception or None) and ``elapsed``
+            (the duration of the call in seconds).
+    """
+    def timed_call(item):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        started = time.monotonic()
+        try:
+            return {"item": item, "result": func(item), "error": None, "elapsed": time.monotonic() - started}
+        except Exception as err:
+            return {"item": item, "result": None, "error": err, "elapsed": time.monotonic() - started}
+
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_workers * 2:
+                try:
+                    pending.add(executor.submit(timed_call, next(iterator)))
+                except StopIteration:
+                    exhausted = True
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,173 @@
+import json
+import os
+import threading
+import time
+
+
+class DeploymentJournal:
+    """
+    Local, append-only journal of the proxy deployments performed through the SDK.
+
+    Every deployment and rollback is appended to a JSON Lines file, and the revision history
+    of each (organization, environment, API proxy) is kept in memory so the last-known-good
+    revision can be found without calling the management API.
+
+    Attributes:
+        path (str): The path of the journal file.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the DeploymentJournal and replays the existing journal file.
+
+        Args:
+            path (str): The path of the journal file. It is created on the first write.
+        """
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._proxy_locks = {}
+        self._history = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as journal_file:
+                for line in journal_file:
+                    if line.strip():
+                        self._apply(json.loads(line))
+
+    def _apply(self, entry):
+        history = self._history.setdefault((entry["org"], entry["environment"], entry["api"]), [])
+        if entry["action"] == "rollback":
+            if history:
+                history.pop()
+        elif not history or history[-1] != entry["revision"]:
+            history.append(entry["revision"])
+
+    def _append(self, entry):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as journal_file:
+            journal_file.write(json.dumps(entry) + "\n")
+        self._apply(entry)
+        return entry
+
+    def locked(self, org, env, api):
+        """
+        Returns the lock that serializes deployments and rollbacks of one API proxy.
+
+        Hold it around the management API calls and the journal update of a deployment or rollback,
+        so concurrent changes to the same proxy cannot interleave. Different proxies do not block
+        each other.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+
+        Returns:
+            threading.Lock: The lock of the API proxy in the environment.
+        """
+        with self._lock:
+            return self._proxy_locks.setdefault((org, env, api), threading.Lock())
+
+    def revisions(self, org, env, api):
+        """
+        Returns the current and previous revisions, read together.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+
+        Returns:
+            tuple: ``(current, previous)`` revisions; either is None if not recorded.
+        """
+        with self._lock:
+            history = self._history.get((org, env, api)) or []
+            return (history[-1] if history else None, history[-2] if len(history) > 1 else None)
+
+    def current_revision(self, org, env, api):
+        """
+        Returns the revision most recently deployed through the SDK.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+
+        Returns:
+            str: The current revision, or None if no deployment was recorded.
+        """
+        with self._lock:
+            history = self._history.get((org, env, api))
+            return history[-1] if history else None
+
+    def previous_revision(self, org, env, api):
+        """
+        Returns the revision that was deployed before the current one.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+
+        Returns:
+            str: The previous revision, or None if there is nothing to roll back to.
+        """
+        with self._lock:
+            history = self._history.get((org, env, api))
+            return history[-2] if history and len(history) > 1 else None
+
+    def record_deployment(self, org, env, api, revision):
+        """
+        Records a deployment of a revision.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+            revision (str): The deployed revision number.
+
+        Returns:
+            dict: The journal entry that was written.
+        """
+        with self._lock:
+            history = self._history.get((org, env, api))
+            return self._append({
+                "action": "deploy",
+                "org": org,
+                "environment": env,
+                "api": api,
+                "revision": str(revision),
+                "previous_revision": history[-1] if history else None,
+                "timestamp": time.time(),
+            })
+
+    def record_rollback(self, org, env, api, undeploy_error=None):
+        """
+        Records a rollback from the current revision to the previous one.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+            undeploy_error (str): Optional error of a partial rollback, where the previous revision
+                was redeployed but the rolled-back revision could not be undeployed.
+
+        Returns:
+            dict: The journal entry that was written. A partial rollback has ``"partial": True``
+                and the ``undeploy_error``.
+        """
+        with self._lock:
+            history = self._history.get((org, env, api)) or []
+            entry = {
+                "action": "rollback",
+                "org": org,
+                "environment": env,
+                "api": api,
+                "revision": history[-2] if len(history) > 1 else None,
+                "previous_revision": history[-1] if history else None,
+                "timestamp": time.time(),
+            }
+            if undeploy_error is not None:
+                entry.update(partial=True, undeploy_error=undeploy_error)
+            return self._append(entry)
@@ -1,5 +1,8 @@
 import requests
 
+from apigee_sdk.concurrency import RateLimiter, run_concurrently
+from apigee_sdk.pagination import iter_listing, listing_url
+
 class DeveloperAppClient:
     """
     Client to manage developer apps in Apigee Edge.
@@ -151,17 +154,22 @@ class DeveloperAppClient:
         self._handle_request_errors(response)
         return response.json()
 
-    def list_apps(self):
+    def list_apps(self, expand=False, count=None, start_key=None):
         """
         Lists all developer apps.
 
+        Args:
+            expand (bool): Whether to return full app objects instead of app IDs.
+            count (int): Optional maximum number of apps to return.
+            start_key (str): Optional ID of the first app to return.
+
         Returns:
             dict: The response from the API containing a list of developer apps.
 
         Raises:
             Exception: If the API request fails.
         """
-        url = f"{self.base_url}/apps"
+        url = listing_url(f"{self.base_url}/apps", expand, count, start_key, count_param="rows")
         headers = {
             "Authorization": f"Bearer {self.token}"
         }
@@ -169,6 +177,137 @@ class DeveloperAppClient:
         self._handle_request_errors(response)
         return response.json()
 
+    def iter_apps(self, page_size=1000):
+        """
+        Yields every developer app using expanded, paginated listing calls.
+
+        Args:
+            page_size (int): The number of apps per listing call.
+
+        Yields:
+            The details of one developer app, or its ID if the API does not expand the listing.
+
+        Raises:
+            Exception: If an API request fails.
+        """
+        yield from iter_listing(self.list_apps, ("app", "apps"), "appId", page_size)
+
+    def iter_app_details(self, max_workers=8):
+        """
+        Yields the full details of every developer app.
+
+        The details come from the expanded listing; they are only fetched one app at a time when
+        the API returns app IDs instead.
+
+        Args:
+            max_workers (int): The maximum number of concurrent detail requests.
+
+        Yields:
+            dict: The details of one developer app.
+
+        Raises:
+            Exception: If an API request fails.
+        """
+        app_ids = []
+        for entry in self.iter_apps():
+            if isinstance(entry, dict):
+                yield entry
+            else:
+                app_ids.append(entry)
+        for outcome in run_concurrently(self.fetch_app_details, app_ids, max_workers):
+            if outcome["error"]:
+                raise outcome["error"]
+            yield outcome["result"]
+
+    def select_api_keys(self, developer=None, product=None, attribute=None, status=None, max_workers=8):
+        """
+        Selects API keys by developer, API product, app attribute and/or key status.
+
+        Args:
+            developer (str): Optional developer ID the app must belong to.
+            product (str): Optional API product the key must be associated with.
+            attribute (tuple): Optional ``(name, value)`` app attribute the app must have.
+            status (str): Optional key status, e.g. ``"approved"``.
+            max_workers (int): The maximum number of concurrent detail requests.
+
+        Returns:
+            list: ``(app_id, api_key_id)`` tuples of the matching keys.
+
+        Raises:
+            Exception: If an API request fails.
+        """
+        keys = []
+        for app in self.iter_app_details(max_workers=max_workers):
+            if developer is not None and app.get("developerId") != developer:
+                continue
+            if attribute is not None:
+                attributes = {item.get("name"): item.get("value") for item in app.get("attributes", [])}
+                if attributes.get(attribute[0]) != attribute[1]:
+                    continue
+            for credential in app.get("credentials", []):
+                if status is not None and credential.get("status") != status:
+                    continue
+                products = [item.get("apiproduct") for item in credential.get("apiProducts", [])]
+                if product is not None and product not in products:
+                    continue
+                keys.append((app.get("appId"), credential.get("consumerKey")))
+        return keys
+
+    def bulk_api_key_action(self, action, keys, payload=None, max_workers=16, rate=None):
+        """
+        Approves, revokes or rotates many API keys concurrently.
+
+        Args:
+            action (str): ``"approve"``, ``"revoke"`` or ``"rotate"``. Rotating adds a new key to the
+                app and then revokes the old one; if only the revoke fails, the outcome still carries
+                the new key as its ``result`` so it is not issued again.
+            keys (iterable): ``(app_id, api_key_id)`` tuples, e.g. from :meth:`select_api_keys`.
+            payload (dict): The payload for the new key when rotating.
+            max_workers (int): The maximum number of concurrent key operations.
+            rate (float): Optional maximum number of key operations started per second.
+
+        Yields:
+            dict: One outcome per key as it completes, with the keys ``app_id``, ``api_key_id``,
+                ``action``, ``phase`` (the action, or ``"add"`` or ``"revoke"`` when rotating),
+                ``status`` (``"ok"`` or ``"failed"``), ``result``, ``error`` and ``elapsed``.
+
+        Raises:
+            ValueError: If the action is not supported.
+        """
+        if action not in ("approve", "revoke", "rotate"):
+            raise ValueError(f"Unsupported API key action: {action}")
+
+        def apply(key):
+            app_id, api_key_id = key
+            if action == "approve":
+                return action, self.approve_api_key(app_id, api_key_id), None
+            if action == "revoke":
+                return action, self.revoke_api_key(app_id, api_key_id), None
+            added = self.add_api_key(app_id, payload or {})
+            try:
+                self.revoke_api_key(app_id, api_key_id)
+            except Exception as error:
+                return "revoke", added, error
+            return "revoke", added, None
+
+        rate_limiter = RateLimiter(rate) if rate else None
+        for outcome in run_concurrently(apply, keys, max_workers, rate_limiter=rate_limiter):
+            app_id, api_key_id = outcome["item"]
+            if outcome["error"]:
+                phase, result, error = "add" if action == "rotate" else action, None, outcome["error"]
+            else:
+                phase, result, error = outcome["result"]
+            yield {
+                "app_id": app_id,
+                "api_key_id": api_key_id,
+                "action": action,
+                "phase": phase,
+                "status": "failed" if error else "ok",
+                "result": result,
+                "error": str(error) if error else None,
+                "elapsed": outcome["elapsed"],
+            }
+
     def revoke_api_key(self, app_id, api_key_id):
         """
         Revokes an API key for a developer app.
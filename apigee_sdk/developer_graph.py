@@ -0,0 +1,150 @@
+from apigee_sdk.concurrency import run_concurrently
+from apigee_sdk.key_verifier import credential_expired
+
+
+class DeveloperGraph:
+    """
+    In-memory graph of developers, their apps, the apps' keys and the keys' API products.
+
+    Nodes are kept in dictionaries keyed by developer ID, app ID, consumer key and product name.
+    Edges are kept as adjacency sets in both directions, and the developer/product reachability
+    is precomputed, so questions such as "which developers have access to product X" are a
+    single dictionary lookup.
+
+    Attributes:
+        developers (dict): Developer objects by developer ID.
+        apps (dict): App objects by app ID.
+        keys (dict): Credential objects by consumer key.
+        products (dict): API product objects by product name.
+        developer_apps (dict): App IDs by developer ID.
+        app_developer (dict): Developer ID by app ID.
+        app_keys (dict): Consumer keys by app ID.
+        key_app (dict): App ID by consumer key.
+        key_products (dict): Product names by consumer key, for approved product associations.
+        product_keys (dict): Consumer keys by product name, for approved product associations.
+        developer_products (dict): Product names reachable from each developer through approved, unexpired keys.
+        product_developers (dict): Developer IDs with an approved, unexpired key for each product.
+        errors (list): The lookups that failed, as dicts with ``developer_id`` or ``product`` and ``error``.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty DeveloperGraph. Use :func:`fetch_graph` to build one.
+        """
+        self.developers, self.apps, self.keys, self.products = {}, {}, {}, {}
+        self.developer_apps, self.app_developer = {}, {}
+        self.app_keys, self.key_app = {}, {}
+        self.key_products, self.product_keys = {}, {}
+        self.developer_products, self.product_developers = {}, {}
+        self.errors = []
+
+    def add_developer(self, developer_id, developer, apps):
+        """
+        Adds a developer with their expanded apps, indexing the apps' credentials.
+
+        Only approved credentials that have not expired grant access to their approved products.
+
+        Args:
+            developer_id (str): The developer ID.
+            developer (dict): The developer object.
+            apps (list): The developer's app objects, including their ``credentials``.
+        """
+        self.developers[developer_id] = developer
+        self.developer_apps.setdefault(developer_id, set())
+        self.developer_products.setdefault(developer_id, set())
+        for app in apps:
+            app_id = app.get("appId") or app.get("name")
+            self.apps[app_id] = app
+            self.developer_apps[developer_id].add(app_id)
+            self.app_developer[app_id] = developer_id
+            self.app_keys.setdefault(app_id, set())
+            for credential in app.get("credentials", []):
+                key = credential.get("consumerKey")
+                self.keys[key] = credential
+                self.app_keys[app_id].add(key)
+                self.key_app[key] = app_id
+                self.key_products.setdefault(key, set())
+                if credential.get("status") != "approved" or credential_expired(credential):
+                    continue
+                for product in credential.get("apiProducts", []):
+                    if product.get("status", "approved") != "approved":
+                        continue
+                    name = product.get("apiproduct")
+                    self.key_products[key].add(name)
+                    self.product_keys.setdefault(name, set()).add(key)
+                    self.developer_products[developer_id].add(name)
+                    self.product_developers.setdefault(name, set()).add(developer_id)
+
+    def product_names(self):
+        """
+        Returns the names of every product referenced by a credential.
+
+        Returns:
+            set: The product names.
+        """
+        return {product["apiproduct"] for credential in self.keys.values()
+                for product in credential.get("apiProducts", []) if product.get("apiproduct")}
+
+    def developers_with_access(self, product):
+        """
+        Returns the developers that have an approved key for a product.
+
+        Args:
+            product (str): The product name.
+
+        Returns:
+            set: The developer IDs.
+        """
+        return self.product_developers.get(product, set())
+
+    def products_of(self, developer_id):
+        """
+        Returns the products a developer has an approved key for.
+
+        Args:
+            developer_id (str): The developer ID.
+
+        Returns:
+            set: The product names.
+        """
+        return self.developer_products.get(developer_id, set())
+
+
+def fetch_graph(developers_client, products_client, developer_ids, max_workers=8):
+    """
+    Fetches the developers, apps, keys and products of many developers concurrently.
+
+    Each developer costs two calls, its details and its expanded app listing, which includes the
+    credentials. Products are then fetched once each, however many keys reference them.
+    Failed lookups are recorded in ``errors`` instead of aborting the whole fetch.
+
+    Args:
+        developers_client (DevelopersClient): The client used to fetch developers and their apps.
+        products_client (ProductsClient): The client used to fetch API products.
+        developer_ids (iterable): The IDs or emails of the developers.
+        max_workers (int): The maximum number of concurrent requests.
+
+    Returns:
+        DeveloperGraph: The graph of the developers.
+    """
+    graph = DeveloperGraph()
+
+    def fetch_developer(developer_id):
+        developer = developers_client.fetch_developer_details(developer_id)
+        listing = developers_client.list_developer_apps(developer_id, expand=True)
+        apps = listing.get("app", listing.get("apps", [])) if isinstance(listing, dict) else listing
+        return developer, [app for app in apps if isinstance(app, dict)]
+
+    for outcome in run_concurrently(fetch_developer, developer_ids, max_workers):
+        if outcome["error"]:
+            graph.errors.append({"developer_id": outcome["item"], "error": str(outcome["error"])})
+            continue
+        developer, apps = outcome["result"]
+        graph.add_developer(developer.get("developerId") or outcome["item"], developer, apps)
+
+    for outcome in run_concurrently(products_client.fetch_product_details, sorted(graph.product_names()), max_workers):
+        if outcome["error"]:
+            graph.errors.append({"product": outcome["item"], "error": str(outcome["error"])})
+        else:
+            graph.products[outcome["item"]] = outcome["result"]
+    return graph
@@ -0,0 +1,139 @@
+import os
+import sqlite3
+import threading
+
+
+class DeveloperIdCache:
+    """
+    LRU-bounded, persistent cache of developer email addresses and IDs.
+
+    Mappings are stored in SQLite, in memory by default or in a file to persist them between
+    runs. Every read or write marks the mapping as recently used; once the cache holds more than
+    ``max_entries`` mappings, the least recently used ones are evicted. Reads only record their
+    recency in memory, which is written to the database in batches of ``flush_every``, before an
+    eviction and on close, so cache hits do not write to disk.
+
+    Attributes:
+        path (str): The path of the SQLite database, or ``":memory:"``.
+        max_entries (int): The maximum number of mappings kept.
+        flush_every (int): The number of pending read recencies written to the database at once.
+    """
+
+    def __init__(self, path=":memory:", max_entries=10000, flush_every=256):
+        """
+        Initializes the DeveloperIdCache, creating the database if needed.
+
+        Args:
+            path (str): The path of the SQLite database. Defaults to an in-memory database.
+            max_entries (int): The maximum number of mappings kept.
+            flush_every (int): The number of pending read recencies written to the database at once.
+        """
+        self.path = path if path == ":memory:" else os.path.expanduser(path)
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self._used = {}
+        if self.path != ":memory:" and os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS developer_ids (email TEXT PRIMARY KEY, developer_id TEXT, used INTEGER)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS developer_ids_id ON developer_ids (developer_id)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS developer_ids_used ON developer_ids (used)")
+        self._clock = self.connection.execute("SELECT COALESCE(MAX(used), 0) FROM developer_ids").fetchone()[0]
+
+    def close(self):
+        """
+        Writes pending read recencies and closes the database connection.
+        """
+        with self._lock:
+            self._flush()
+        self.connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM developer_ids").fetchone()[0]
+
+    def _tick(self):
+        self._clock += 1
+        return self._clock
+
+    def _flush(self):
+        if not self._used:
+            return
+        with self.connection:
+            self.connection.executemany("UPDATE developer_ids SET used = ? WHERE email = ?",
+                                        [(used, email) for email, used in self._used.items()])
+        self._used.clear()
+
+    def _lookup(self, column, value, other):
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT email, {other} FROM developer_ids WHERE {column} = ?", (value,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._used[row[0]] = self._tick()
+            if len(self._used) >= self.flush_every:
+                self._flush()
+            return row[1]
+
+    def developer_id(self, email):
+        """
+        Returns the cached ID of a developer.
+
+        Args:
+            email (str): The developer email address.
+
+        Returns:
+            str: The developer ID, or None if it is not cached.
+        """
+        return self._lookup("email", email.lower(), "developer_id")
+
+    def email(self, developer_id):
+        """
+        Returns the cached email address of a developer.
+
+        Args:
+            developer_id (str): The developer ID.
+
+        Returns:
+            str: The developer email address, or None if it is not cached.
+        """
+        return self._lookup("developer_id", developer_id, "email")
+
+    def remember(self, developers):
+        """
+        Caches the email addresses and IDs of developer objects.
+
+        Args:
+            developers (iterable): Developer objects; those without ``email`` or ``developerId`` are ignored.
+        """
+        with self._lock, self.connection:
+            rows = [(developer["email"].lower(), developer["developerId"], self._tick()) for developer in developers
+                    if isinstance(developer, dict) and developer.get("email") and developer.get("developerId")]
+            if not rows:
+                return
+            for email, _, _ in rows:
+                self._used.pop(email, None)
+            self.connection.executemany("INSERT OR REPLACE INTO developer_ids VALUES (?, ?, ?)", rows)
+            if self.connection.execute("SELECT COUNT(*) FROM developer_ids").fetchone()[0] <= self.max_entries:
+                return
+            self._flush()
+            self.connection.execute(
+                "DELETE FROM developer_ids WHERE email NOT IN (SELECT email FROM developer_ids ORDER BY used DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def forget(self, email):
+        """
+        Drops the cached mapping of a developer.
+
+        Args:
+            email (str): The developer email address.
+        """
+        with self._lock, self.connection:
+            self._used.pop(email.lower(), None)
+            self.connection.execute("DELETE FROM developer_ids WHERE email = ?", (email.lower(),))
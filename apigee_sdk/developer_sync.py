@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+
+
+class DeveloperSync:
+    """
+    Incremental mirror of the developers of an organization.
+
+    The state file keeps the ``lastModifiedAt`` timestamp of every known developer. A sync pages
+    through the expanded developer listing and only emits the developers modified after their
+    stored timestamp, plus a ``deleted`` event for every known developer that is no longer listed.
+    No per-developer detail calls are made.
+
+    An event is recorded in the state once the consumer asks for the next one, and the state is
+    saved every ``checkpoint_every`` recorded events and when the sync ends, fails or is closed.
+    A consumer that stops partway therefore only gets the events it had not consumed again.
+
+    Attributes:
+        client (DevelopersClient): The client used to list the developers.
+        state_path (str): The path of the JSON state file.
+        checkpoint_every (int): The number of consumed events between state saves.
+    """
+
+    def __init__(self, client, state_path, page_size=1000, checkpoint_every=100):
+        """
+        Initializes the DeveloperSync and loads the state file, if it exists.
+
+        Args:
+            client (DevelopersClient): The client used to list the developers.
+            state_path (str): The path of the JSON state file.
+            page_size (int): The number of developers per listing call.
+            checkpoint_every (int): The number of consumed events between state saves.
+        """
+        self.client = client
+        self.state_path = os.path.expanduser(state_path)
+        self.page_size = page_size
+        self.checkpoint_every = checkpoint_every
+        self._known = {}
+        if os.path.exists(self.state_path):
+            with open(self.state_path, encoding="utf-8") as state:
+                self._known = json.load(state).get("developers", {})
+
+    def _save(self):
+        directory = os.path.dirname(self.state_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=directory, prefix=".developer-sync-")
+        with os.fdopen(handle, "w", encoding="utf-8") as state:
+            json.dump({"developers": self._known}, state)
+        os.replace(temporary, self.state_path)
+
+    def _events(self):
+        listed = set()
+        for developer in self.client.iter_developers(page_size=self.page_size):
+            developer_id = developer.get("developerId") or developer.get("email")
+            modified = int(developer.get("lastModifiedAt") or 0)
+            listed.add(developer_id)
+            if developer_id not in self._known:
+                yield {"event": "created", "developer_id": developer_id, "developer": developer}, modified
+            elif modified > self._known[developer_id]:
+                yield {"event": "updated", "developer_id": developer_id, "developer": developer}, modified
+        for developer_id in sorted(self._known.keys() - listed):
+            yield {"event": "deleted", "developer_id": developer_id, "developer": None}, None
+
+    def sync(self):
+        """
+        Lists the developers and emits what changed since the previous sync.
+
+        Yields:
+            dict: One event per changed developer with the keys ``event`` (``"created"``,
+                ``"updated"`` or ``"deleted"``), ``developer_id`` and ``developer`` (the full
+                developer object, or None for deletions).
+
+        Raises:
+            HTTPError: If an API request fails. The events consumed before the failure are saved.
+        """
+        pending = 0
+        try:
+            for event, modified in self._events():
+                yield event
+                if modified is None:
+                    self._known.pop(event["developer_id"], None)
+                else:
+                    self._known[event["developer_id"]] = modified
+                pending += 1
+                if pending >= self.checkpoint_every:
+                    self._save()
+                    pending = 0
+        finally:
+            if pending or not os.path.exists(self.state_path):
+                self._save()
@@ -1,5 +1,10 @@
+import time
+
 import requests
 
+from apigee_sdk.developer_ids import DeveloperIdCache
+from apigee_sdk.pagination import iter_listing, listing_url
+
 class DevelopersClient:
     """
     Client to manage developers in Apigee Edge.
@@ -9,18 +14,27 @@ class DevelopersClient:
     Attributes:
         base_url (str): The base URL for the Apigee API.
         headers (dict): The headers used for API requests, including the authorization token.
+        id_cache (DeveloperIdCache): The email and developer ID mappings seen in API responses.
+        missing_ttl (float): The number of seconds an email that matched no developer is remembered.
     """
 
-    def __init__(self, base_url, token):
+    def __init__(self, base_url, token, id_cache=None, missing_ttl=60):
         """
         Initializes the DevelopersClient with the base URL and authorization token.
 
         Args:
             base_url (str): The base URL for the Apigee API.
             token (str): The authorization token for accessing the API.
+            id_cache (DeveloperIdCache): Optional email and developer ID cache, e.g. a persistent
+                one. Defaults to an in-memory cache.
+            missing_ttl (float): The number of seconds an email that matched no developer is
+                remembered, so repeated lookups do not page through every developer again.
         """
         self.base_url = base_url
         self.headers = {"Authorization": f"Bearer {token}"}
+        self.id_cache = id_cache if id_cache is not None else DeveloperIdCache()
+        self.missing_ttl = missing_ttl
+        self._missing = {}
 
     def create_developer(self, payload):
         """
@@ -37,6 +51,7 @@ class DevelopersClient:
         """
         response = requests.post(f"{self.base_url}/developers", headers={"Content-Type": "application/json", **self.headers}, json=payload)
         response.raise_for_status()
+        self._missing.pop(str(payload.get("email", "")).lower(), None)
         return response.json()
 
     def delete_developer(self, developer_id):
@@ -71,19 +86,62 @@ class DevelopersClient:
         """
         response = requests.get(f"{self.base_url}/developers/{developer_id}", headers=self.headers)
         response.raise_for_status()
-        return response.json()
+        developer = response.json()
+        self.id_cache.remember([developer])
+        return developer
 
-    def list_developers(self):
+    def list_developers(self, expand=False, count=None, start_key=None):
         """
         Lists all developers in the Apigee environment.
 
+        Args:
+            expand (bool): Whether to return full developer objects instead of emails.
+            count (int): Optional maximum number of developers to return.
+            start_key (str): Optional email of the first developer to return.
+
         Returns:
             dict: The response from the API containing a list of developers.
 
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.get(f"{self.base_url}/developers", headers=self.headers)
+        response = requests.get(listing_url(f"{self.base_url}/developers", expand, count, start_key), headers=self.headers)
+        response.raise_for_status()
+        listing = response.json()
+        if expand:
+            self.id_cache.remember(listing.get("developer", []) if isinstance(listing, dict) else listing)
+        return listing
+
+    def iter_developers(self, page_size=1000):
+        """
+        Yields every developer as a full object, using expanded, paginated listing calls.
+
+        Args:
+            page_size (int): The number of developers per listing call.
+
+        Yields:
+            dict: The details of one developer.
+
+        Raises:
+            HTTPError: If an API request fails.
+        """
+        yield from iter_listing(self.list_developers, ("developer", "developers"), "email", page_size)
+
+    def list_developer_apps(self, developer_id, expand=True):
+        """
+        Lists the apps of a developer.
+
+        Args:
+            developer_id (str): The ID or email of the developer.
+            expand (bool): Whether to return full app objects, including their credentials, instead of app names.
+
+        Returns:
+            dict: The response from the API containing the developer's apps.
+
+        Raises:
+            HTTPError: If the API request fails.
+        """
+        response = requests.get(listing_url(f"{self.base_url}/developers/{developer_id}/apps", expand), headers=self.headers)
         response.raise_for_status()
         return response.json()
 
@@ -103,4 +161,81 @@ class DevelopersClient:
         """
         response = requests.put(f"{self.base_url}/developers/{developer_id}", headers={"Content-Type": "application/json", **self.headers}, json=payload)
         response.raise_for_status()
-        return response.json()
\ No newline at end of file
+        return response.json()
+
+    def resolve_developer_id(self, email):
+        """
+        Returns the ID of the developer with an email address.
+
+        The ID comes from the ID cache when possible; otherwise the expanded developer listing is
+        paged through, which caches every developer it returns, until the developer is found. An
+        email that matches no developer is remembered for ``missing_ttl`` seconds and fails
+        without another listing in the meantime.
+
+        Args:
+            email (str): The developer email address.
+
+        Returns:
+            str: The developer ID.
+
+        Raises:
+            KeyError: If no developer has the email address.
+            HTTPError: If an API request fails.
+        """
+        developer_id = self.id_cache.developer_id(email)
+        if developer_id is not None:
+            return developer_id
+        if self._missing.get(email.lower(), 0) > time.monotonic():
+            raise KeyError(f"No developer with email {email}")
+        for developer in self.iter_developers():
+            if isinstance(developer, dict) and developer.get("email", "").lower() == email.lower():
+                return developer["developerId"]
+        self._missing[email.lower()] = time.monotonic() + self.missing_ttl
+        raise KeyError(f"No developer with email {email}")
+
+    def _by_email(self, email, call):
+        developer_id = self.resolve_developer_id(email)
+        try:
+            return call(developer_id)
+        except requests.HTTPError as error:
+            if error.response is None or error.response.status_code != 404:
+                raise
+        self.id_cache.forget(email)
+        return call(self.resolve_developer_id(email))
+
+    def fetch_developer_by_email(self, email):
+        """
+        Fetches details of a developer by their email address.
+
+        A cached ID that no longer exists is dropped and resolved again.
+
+        Args:
+            email (str): The developer email address.
+
+        Returns:
+            dict: The response from the API containing developer details.
+
+        Raises:
+            KeyError: If no developer has the email address.
+            HTTPError: If the API request fails.
+        """
+        return self._by_email(email, self.fetch_developer_details)
+
+    def update_developer_by_email(self, email, payload):
+        """
+        Updates an existing developer by their email address.
+
+        A cached ID that no longer exists is dropped and resolved again.
+
+        Args:
+            email (str): The developer email address.
+            payload (dict): The payload containing updated developer details.
+
+        Returns:
+            dict: The response from the API containing details of the updated developer.
+
+        Raises:
+            KeyError: If no developer has the email address.
+            HTTPError: If the API request fails.
+        """
+        return self._by_email(email, lambda developer_id: self.update_developer(developer_id, payload))
@@ -0,0 +1,123 @@
+import json
+import os
+import sqlite3
+
+
+class ConsumerKeyIndex:
+    """
+    Persistent local index of consumer keys to the app and developer that own them.
+
+    The index is a SQLite database keyed by consumer key, so a lookup is a single primary-key
+    read from disk. The ``lastModifiedAt`` timestamp of every indexed app is stored as well, and
+    a refresh only rewrites the keys of apps that changed since they were last indexed.
+
+    Attributes:
+        path (str): The path of the SQLite database.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the ConsumerKeyIndex, creating the database if needed.
+
+        Args:
+            path (str): The path of the SQLite database.
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS keys ("
+                "consumer_key TEXT PRIMARY KEY, app_id TEXT, app_name TEXT, developer_id TEXT, products TEXT, status TEXT"
+                ") WITHOUT ROWID"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS keys_app_id ON keys (app_id)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS apps (app_id TEXT PRIMARY KEY, last_modified INTEGER)")
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM keys").fetchone()[0]
+
+    def _index_app(self, app):
+        app_id = app.get("appId")
+        self.connection.execute("DELETE FROM keys WHERE app_id = ?", (app_id,))
+        self.connection.executemany("INSERT OR REPLACE INTO keys VALUES (?, ?, ?, ?, ?, ?)", [
+            (
+                credential.get("consumerKey"),
+                app_id,
+                app.get("name"),
+                app.get("developerId"),
+                json.dumps([item.get("apiproduct") for item in credential.get("apiProducts", [])]),
+                credential.get("status"),
+            )
+            for credential in app.get("credentials", [])
+        ])
+        self.connection.execute("INSERT OR REPLACE INTO apps VALUES (?, ?)", (app_id, int(app.get("lastModifiedAt", 0))))
+
+    def refresh(self, client, max_workers=8):
+        """
+        Brings the index up to date with the developer apps of the organization.
+
+        Apps whose ``lastModifiedAt`` timestamp is not newer than the indexed one are left untouched,
+        and the keys of apps that no longer exist are removed.
+
+        Args:
+            client (DeveloperAppClient): The client used to list the apps.
+            max_workers (int): The maximum number of concurrent detail requests.
+
+        Returns:
+            dict: The number of ``updated``, ``unchanged`` and ``removed`` apps.
+
+        Raises:
+            Exception: If an API request fails.
+        """
+        indexed = dict(self.connection.execute("SELECT app_id, last_modified FROM apps"))
+        seen = set()
+        updated = unchanged = 0
+        with self.connection:
+            for app in client.iter_app_details(max_workers=max_workers):
+                app_id = app.get("appId")
+                seen.add(app_id)
+                last_modified = int(app.get("lastModifiedAt", 0))
+                if app_id in indexed and last_modified and last_modified <= indexed[app_id]:
+                    unchanged += 1
+                    continue
+                self._index_app(app)
+                updated += 1
+            removed = [(app_id,) for app_id in indexed if app_id not in seen]
+            self.connection.executemany("DELETE FROM keys WHERE app_id = ?", removed)
+            self.connection.executemany("DELETE FROM apps WHERE app_id = ?", removed)
+        return {"updated": updated, "unchanged": unchanged, "removed": len(removed)}
+
+    def lookup(self, consumer_key):
+        """
+        Looks up the owner of a consumer key.
+
+        Args:
+            consumer_key (str): The consumer key.
+
+        Returns:
+            dict: The ``consumer_key``, ``app_id``, ``app_name``, ``developer_id``, ``products`` and
+                ``status`` of the key, or None if the key is not indexed.
+        """
+        row = self.connection.execute(
+            "SELECT consumer_key, app_id, app_name, developer_id, products, status FROM keys WHERE consumer_key = ?",
+            (consumer_key,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "consumer_key": row[0],
+            "app_id": row[1],
+            "app_name": row[2],
+            "developer_id": row[3],
+            "products": json.loads(row[4]),
+            "status": row[5],
+        }
@@ -0,0 +1,227 @@
+import json
+import os
+import threading
+import time
+
+from apigee_sdk.concurrency import RateLimiter, run_concurrently
+
+
+class KeyRotation:
+    """
+    Staggered, resumable credential rotation for many developer apps.
+
+    A rotation runs in three phases: a new key is added to every app in parallel (and written to
+    the export file), the old keys stay valid for an overlap window so consumers can switch, and
+    the old keys are then revoked in parallel batches. The overlap window is recorded per app, so
+    the revoke phase can also run later, from another process, with :meth:`revoke_old_keys`.
+
+    Progress is appended to a JSON Lines checkpoint file. Before a key is added, every key of the
+    app, whatever its status, is checkpointed with the time; if the process crashes after the key
+    was created but before that was recorded, the resumed rotation adopts an approved key that is
+    not in the checkpoint and was issued after it, instead of issuing another one.
+
+    Attributes:
+        client (DeveloperAppClient): The client used to manage the app keys.
+        checkpoint_path (str): The path of the checkpoint file.
+        overlap (float): The number of seconds old and new keys are both valid.
+        batch_size (int): The number of apps whose old keys are revoked per batch.
+        max_workers (int): The maximum number of concurrent requests.
+        rate (float): Optional maximum number of app operations started per second.
+        payload (dict): The payload used when adding a new key.
+    """
+
+    def __init__(self, client, checkpoint_path, overlap=86400, batch_size=500, max_workers=16, rate=None, payload=None):
+        """
+        Initializes the KeyRotation and loads the checkpoint file, if it exists.
+
+        Args:
+            client (DeveloperAppClient): The client used to manage the app keys.
+            checkpoint_path (str): The path of the checkpoint file.
+            overlap (float): The number of seconds old and new keys are both valid.
+            batch_size (int): The number of apps whose old keys are revoked per batch.
+            max_workers (int): The maximum number of concurrent requests.
+            rate (float): Optional maximum number of app operations started per second.
+            payload (dict): The payload used when adding a new key.
+        """
+        self.client = client
+        self.checkpoint_path = os.path.expanduser(checkpoint_path)
+        self.overlap = overlap
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.rate = rate
+        self.payload = payload or {}
+        self.apps = {}
+        self._lock = threading.Lock()
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, encoding="utf-8") as checkpoint:
+                for line in checkpoint:
+                    if line.strip():
+                        self._apply(json.loads(line))
+
+    def _apply(self, event):
+        state = self.apps.setdefault(event["app_id"], {})
+        if event["event"] == "pending":
+            state.update(old_keys=event["old_keys"], keys=event.get("keys", event["old_keys"]),
+                         pending_at=event.get("at", 0))
+        elif event["event"] == "added":
+            state.update(old_keys=event["old_keys"], new_key=event["new_key"], added_at=event["at"],
+                         overlap=event.get("overlap", self.overlap))
+        elif event["event"] == "revoked":
+            state["revoked"] = True
+
+    def _record(self, event):
+        with self._lock:
+            with open(self.checkpoint_path, "a", encoding="utf-8") as checkpoint:
+                checkpoint.write(json.dumps(event) + "\n")
+            self._apply(event)
+
+    def _export(self, export_path, app_id, credential):
+        if export_path is None:
+            return
+        with self._lock:
+            handle = os.open(os.path.expanduser(export_path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            with os.fdopen(handle, "a", encoding="utf-8") as export:
+                export.write(json.dumps({
+                    "app_id": app_id,
+                    "consumer_key": credential.get("consumerKey"),
+                    "consumer_secret": credential.get("consumerSecret"),
+                }) + "\n")
+
+    def _add_key(self, app_id, export_path):
+        state = self.apps.get(app_id, {})
+        if "new_key" in state:
+            return "skipped"
+        details = self.client.fetch_app_details(app_id)
+        credentials = details.get("credentials", [])
+        if "old_keys" in state:
+            adopted = [credential for credential in credentials
+                       if credential.get("consumerKey") not in state["keys"] and credential.get("status") == "approved"
+                       and int(credential.get("issuedAt") or 0) >= state["pending_at"] * 1000]
+            if adopted:
+                self._record({"event": "added", "app_id": app_id, "old_keys": state["old_keys"],
+                              "new_key": adopted[0]["consumerKey"], "at": time.time(), "overlap": self.overlap})
+                self._export(export_path, app_id, adopted[0])
+                return "adopted"
+            old_keys = state["old_keys"]
+        else:
+            old_keys = [credential.get("consumerKey") for credential in credentials if credential.get("status") != "revoked"]
+            self._record({"event": "pending", "app_id": app_id, "old_keys": old_keys,
+                          "keys": [credential.get("consumerKey") for credential in credentials], "at": time.time()})
+        created = self.client.add_api_key(app_id, self.payload)
+        self._record({"event": "added", "app_id": app_id, "old_keys": old_keys,
+                      "new_key": created["consumerKey"], "at": time.time(), "overlap": self.overlap})
+        self._export(export_path, app_id, created)
+        return "added"
+
+    def _revoke_keys(self, app_id):
+        for api_key_id in self.apps[app_id]["old_keys"]:
+            self.client.revoke_api_key(app_id, api_key_id)
+        self._record({"event": "revoked", "app_id": app_id})
+        return "revoked"
+
+    def add_keys(self, app_ids, export_path=None):
+        """
+        Adds a new key to every app that does not have one from this rotation yet.
+
+        Args:
+            app_ids (iterable): The IDs of the apps to rotate.
+            export_path (str): Optional NDJSON file the new keys and secrets are appended to. A new
+                file is created readable by its owner only.
+
+        Yields:
+            dict: One outcome per app with the keys ``app_id``, ``status`` (``"added"``,
+                ``"adopted"``, ``"skipped"`` or ``"failed"``) and ``error``.
+        """
+        rate_limiter = RateLimiter(self.rate) if self.rate else None
+        for outcome in run_concurrently(lambda app_id: self._add_key(app_id, export_path), app_ids,
+                                        self.max_workers, rate_limiter=rate_limiter):
+            yield {
+                "app_id": outcome["item"],
+                "status": outcome["result"] or "failed",
+                "error": str(outcome["error"]) if outcome["error"] else None,
+            }
+
+    def pending_revocations(self):
+        """
+        Returns the apps whose old keys have not been revoked yet.
+
+        Returns:
+            dict: The Unix time at which each app's overlap window ends, by app ID.
+        """
+        return {app_id: state["added_at"] + state["overlap"] for app_id, state in self.apps.items()
+                if "added_at" in state and not state.get("revoked")}
+
+    def next_revocation(self):
+        """
+        Returns when the next old keys are due for revocation.
+
+        Returns:
+            float: The Unix time at which the earliest outstanding overlap window ends, or None if
+                no old keys are waiting to be revoked.
+        """
+        return min(self.pending_revocations().values(), default=None)
+
+    def wait_for_overlap(self):
+        """
+        Sleeps until the overlap window of every added, not yet revoked key has passed.
+        """
+        outstanding = self.pending_revocations()
+        if outstanding:
+            remaining = max(outstanding.values()) - time.time()
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def revoke_old_keys(self):
+        """
+        Revokes the old keys of every app whose overlap window has passed, in parallel batches.
+
+        Yields:
+            dict: One outcome per app with the keys ``app_id``, ``status`` (``"revoked"`` or
+                ``"failed"``) and ``error``.
+        """
+        now = time.time()
+        due = [app_id for app_id, revoke_at in self.pending_revocations().items() if revoke_at <= now]
+        rate_limiter = RateLimiter(self.rate) if self.rate else None
+        for start in range(0, len(due), self.batch_size):
+            batch = due[start:start + self.batch_size]
+            for outcome in run_concurrently(self._revoke_keys, batch, self.max_workers, rate_limiter=rate_limiter):
+                yield {
+                    "app_id": outcome["item"],
+                    "status": outcome["result"] or "failed",
+                    "error": str(outcome["error"]) if outcome["error"] else None,
+                }
+
+    def run(self, app_ids, export_path=None, wait=True):
+        """
+        Runs or resumes a rotation: add new keys, wait for the overlap window, revoke old keys.
+
+        Args:
+            app_ids (iterable): The IDs of the apps to rotate.
+            export_path (str): Optional NDJSON file the new keys and secrets are appended to.
+            wait (bool): Whether to sleep until the overlap window has passed. Without waiting,
+                only the old keys that are already due are revoked, and the rest are left for a
+                later :meth:`revoke_old_keys`.
+
+        Returns:
+            dict: A summary with the number of apps per status, the ``failed`` outcomes, the number
+                of apps whose old keys are still ``pending`` revocation and ``next_revocation``.
+        """
+        summary = {"added": 0, "adopted": 0, "skipped": 0, "revoked": 0, "failed": []}
+        for outcome in self.add_keys(app_ids, export_path=export_path):
+            if outcome["status"] == "failed":
+                summary["failed"].append({**outcome, "phase": "add"})
+            else:
+                summary[outcome["status"]] += 1
+        if wait:
+            self.wait_for_overlap()
+        for outcome in self.revoke_old_keys():
+            if outcome["status"] == "failed":
+                summary["failed"].append({**outcome, "phase": "revoke"})
+            else:
+                summary["revoked"] += 1
+        summary["pending"] = len(self.pending_revocations())
+        summary["next_revocation"] = self.next_revocation()
+        return summary
@@ -0,0 +1,236 @@
+import os
+import socketserver
+import stat
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+def credential_expiry(credential):
+    """
+    Returns when a credential expires.
+
+    Args:
+        credential (dict): The credential object of a developer app.
+
+    Returns:
+        int: The ``expiresAt`` timestamp in milliseconds, or None if the credential never expires.
+    """
+    expires_at = credential.get("expiresAt")
+    if expires_at in (None, "", -1, "-1"):
+        return None
+    return int(expires_at)
+
+
+def credential_expired(credential, now=None):
+    """
+    Checks whether a credential has expired.
+
+    Args:
+        credential (dict): The credential object of a developer app.
+        now (float): Optional current time in seconds. Defaults to ``time.time()``.
+
+    Returns:
+        bool: True if the credential has an ``expiresAt`` timestamp in the past.
+    """
+    expires_at = credential_expiry(credential)
+    return expires_at is not None and expires_at <= (time.time() if now is None else now) * 1000
+
+
+class KeyVerifier:
+    """
+    Local API-key verification backed by periodic snapshots of the developer apps.
+
+    Every refresh builds a new snapshot of the approved consumer keys, grouped per API product,
+    as frozen sets, and the expiry time of the keys that expire. The snapshot is swapped in with a
+    single assignment, so verification never blocks on a refresh. A failed refresh keeps serving
+    the previous snapshot.
+
+    Attributes:
+        client (DeveloperAppClient): The client used to list the apps.
+        developers_client (DevelopersClient): Optional client used to list the developers, so the
+            keys of inactive developers are rejected.
+        interval (float): The number of seconds between background refreshes.
+        max_workers (int): The maximum number of concurrent detail requests.
+    """
+
+    def __init__(self, client, developers_client=None, interval=300, max_workers=8):
+        """
+        Initializes the KeyVerifier.
+
+        Args:
+            client (DeveloperAppClient): The client used to list the apps.
+            developers_client (DevelopersClient): Optional client used to list the developers, so
+                the keys of inactive developers are rejected.
+            interval (float): The number of seconds between background refreshes.
+            max_workers (int): The maximum number of concurrent detail requests.
+        """
+        self.client = client
+        self.developers_client = developers_client
+        self.interval = interval
+        self.max_workers = max_workers
+        self.refresh_errors = 0
+        self.last_refresh = None
+        self._snapshot = (frozenset(), {}, {})
+        self._stop = threading.Event()
+        self._thread = None
+
+    def refresh(self):
+        """
+        Lists the developer apps and replaces the snapshot of approved keys.
+
+        Only approved, unexpired keys of approved apps are kept, and a key is only associated with
+        the API products it is approved for. With a ``developers_client``, the keys of developers
+        that are not active are dropped as well.
+
+        Returns:
+            int: The number of approved keys in the new snapshot.
+
+        Raises:
+            Exception: If an API request fails. The previous snapshot stays in use.
+        """
+        keys, products, expiries = set(), {}, {}
+        now = time.time()
+        try:
+            inactive = set()
+            if self.developers_client is not None:
+                inactive = {developer.get("developerId") for developer in self.developers_client.iter_developers()
+                            if developer.get("status", "active") != "active"}
+            for app in self.client.iter_app_details(max_workers=self.max_workers):
+                if app.get("status", "approved") != "approved" or app.get("developerId") in inactive:
+                    continue
+                for credential in app.get("credentials", []):
+                    if credential.get("status") != "approved" or credential_expired(credential, now):
+                        continue
+                    key = credential.get("consumerKey")
+                    keys.add(key)
+                    expires_at = credential_expiry(credential)
+                    if expires_at is not None:
+                        expiries[key] = expires_at
+                    for product in credential.get("apiProducts", []):
+                        if product.get("status", "approved") == "approved":
+                            products.setdefault(product.get("apiproduct"), set()).add(key)
+        except Exception:
+            self.refresh_errors += 1
+            raise
+        self._snapshot = (frozenset(keys), {name: frozenset(members) for name, members in products.items()}, expiries)
+        self.last_refresh = time.time()
+        return len(keys)
+
+    def verify(self, consumer_key, product=None):
+        """
+        Checks whether a consumer key is approved and has not expired.
+
+        Args:
+            consumer_key (str): The consumer key.
+            product (str): Optional API product the key must be approved for.
+
+        Returns:
+            bool: True if the key is approved (for the product, if given).
+        """
+        keys, products, expiries = self._snapshot
+        if consumer_key not in (keys if product is None else products.get(product, ())):
+            return False
+        expires_at = expiries.get(consumer_key)
+        return expires_at is None or expires_at > time.time() * 1000
+
+    def start(self):
+        """
+        Refreshes the snapshot once and then keeps refreshing it in a background thread.
+        """
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                pass
+
+    def stop(self):
+        """
+        Stops the background refresh thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def make_server(self, host="127.0.0.1", port=8089, unix_socket=None):
+        """
+        Creates an HTTP server that verifies keys on ``/verify``.
+
+        ``GET /verify?key=KEY&product=PRODUCT`` answers 200 for an approved key and 403 otherwise.
+        ``POST /verify?product=PRODUCT`` takes one key per line and answers one ``1`` or ``0`` per
+        line, so callers can verify many keys per request. Connections are kept alive.
+
+        Args:
+            host (str): The interface to listen on.
+            port (int): The port to listen on.
+            unix_socket (str): Optional Unix socket path to listen on instead of host and port. A
+                stale socket at the path is replaced.
+
+        Returns:
+            socketserver.BaseServer: The server. Call ``serve_forever()`` to start serving.
+
+        Raises:
+            FileExistsError: If something other than a socket exists at ``unix_socket``.
+        """
+        verifier = self
+
+        class VerifyHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, status, body):
+                self.send_response(status)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _parse(self):
+                url = urlsplit(self.path)
+                if url.path != "/verify":
+                    self._reply(404, b"not found\n")
+                    return None
+                return {name: values[0] for name, values in parse_qs(url.query).items()}
+
+            def do_GET(self):
+                query = self._parse()
+                if query is None:
+                    return
+                if verifier.verify(query.get("key", ""), query.get("product")):
+                    self._reply(200, b"1\n")
+                else:
+                    self._reply(403, b"0\n")
+
+            def do_POST(self):
+                query = self._parse()
+                if query is None:
+                    return
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+                product = query.get("product")
+                answers = ["1" if verifier.verify(key, product) else "0" for key in body.splitlines()]
+                self._reply(200, ("\n".join(answers) + "\n").encode("utf-8") if answers else b"")
+
+            def address_string(self):
+                return str(self.client_address[0]) if self.client_address else "unix"
+
+            def log_message(self, format, *args):
+                pass
+
+        if unix_socket is None:
+            return ThreadingHTTPServer((host, port), VerifyHandler)
+        if os.path.exists(unix_socket):
+            if not stat.S_ISSOCK(os.stat(unix_socket).st_mode):
+                raise FileExistsError(f"{unix_socket} exists and is not a socket")
+            os.remove(unix_socket)
+        return _ThreadingUnixHTTPServer(unix_socket, VerifyHandler)
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
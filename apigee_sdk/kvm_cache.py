@@ -0,0 +1,158 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+_MISSING = object()
+
+
+class KVMCache:
+    """
+    Thread-safe read-through cache for Key-Value Map (KVM) entries.
+
+    Entries are fetched through ``KVMClient.get_kvm_entry`` on the first read and then served
+    from memory until their map's TTL expires. Missing entries are cached as well, for
+    ``negative_ttl`` seconds. Once an entry is older than ``refresh_ahead`` of its TTL, reads keep
+    returning the cached value while a background thread fetches a fresh one, so only the very
+    first read of an entry waits for the management API. Concurrent first reads of the same entry
+    share a single request.
+
+    Attributes:
+        client (KVMClient): The client used to fetch the entries.
+        ttl (float): The default number of seconds an entry is cached.
+        ttls (dict): Per-map TTLs, keyed by KVM ID.
+        negative_ttl (float): The number of seconds a missing entry is cached.
+        refresh_ahead (float): The fraction of the TTL after which an entry is refreshed in the background.
+    """
+
+    def __init__(self, client, ttl=60, ttls=None, negative_ttl=None, refresh_ahead=0.8, refresh_workers=2):
+        """
+        Initializes the KVMCache.
+
+        Args:
+            client (KVMClient): The client used to fetch the entries.
+            ttl (float): The default number of seconds an entry is cached.
+            ttls (dict): Optional per-map TTLs, keyed by KVM ID.
+            negative_ttl (float): The number of seconds a missing entry is cached. Defaults to ``ttl``.
+            refresh_ahead (float): The fraction of the TTL after which an entry is refreshed in the background.
+            refresh_workers (int): The number of background refresh threads.
+        """
+        self.client = client
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.refresh_ahead = refresh_ahead
+        self._entries = {}
+        self._loading = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers)
+        self._stats = {"hits": 0, "misses": 0, "negative_hits": 0, "refreshes": 0, "errors": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Stops the background refresh threads.
+        """
+        self._executor.shutdown(wait=True)
+
+    def _fetch(self, kvm_id, name):
+        try:
+            value = self.client.get_kvm_entry(kvm_id, name).get("value")
+        except requests.HTTPError as error:
+            if error.response is None or error.response.status_code != 404:
+                raise
+            value = _MISSING
+        ttl = self.negative_ttl if value is _MISSING else self.ttls.get(kvm_id, self.ttl)
+        now = time.monotonic()
+        with self._lock:
+            self._entries[(kvm_id, name)] = (value, now + ttl * self.refresh_ahead, now + ttl)
+        return value
+
+    def _refresh(self, key):
+        try:
+            self._fetch(*key)
+            with self._lock:
+                self._stats["refreshes"] += 1
+        except Exception:
+            with self._lock:
+                self._stats["errors"] += 1
+        finally:
+            with self._lock:
+                self._loading.pop(key).set()
+
+    def get(self, kvm_id, name, default=None):
+        """
+        Returns the value of a KVM entry, fetching it only if it is not cached.
+
+        Args:
+            kvm_id (str): The ID of the KVM.
+            name (str): The entry name.
+            default: The value returned if the entry does not exist.
+
+        Returns:
+            str: The entry value, or ``default`` if the entry does not exist.
+
+        Raises:
+            HTTPError: If the entry is not cached and fetching it fails.
+        """
+        key = (kvm_id, name)
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                cached = self._entries.get(key)
+                if cached is not None and now < cached[2]:
+                    value, refresh_at, _ = cached
+                    self._stats["negative_hits" if value is _MISSING else "hits"] += 1
+                    if now >= refresh_at and key not in self._loading:
+                        self._loading[key] = threading.Event()
+                        self._executor.submit(self._refresh, key)
+                    return default if value is _MISSING else value
+                loading = self._loading.get(key)
+                if loading is None:
+                    self._stats["misses"] += 1
+                    loading = self._loading[key] = threading.Event()
+                    break
+            loading.wait()
+        try:
+            value = self._fetch(kvm_id, name)
+        except Exception:
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._loading.pop(key).set()
+        return default if value is _MISSING else value
+
+    def invalidate(self, kvm_id=None, name=None):
+        """
+        Drops cached entries, so the next read fetches them again.
+
+        Args:
+            kvm_id (str): Optional KVM ID. Defaults to every map.
+            name (str): Optional entry name within ``kvm_id``. Defaults to every entry of the map.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if (kvm_id is None or key[0] == kvm_id) and (name is None or key[1] == name):
+                    del self._entries[key]
+
+    def stats(self):
+        """
+        Returns the cache statistics.
+
+        Returns:
+            dict: The number of ``hits``, ``negative_hits``, ``misses``, background ``refreshes`` and
+                fetch ``errors``, the number of cached ``entries`` and the ``hit_ratio``.
+        """
+        with self._lock:
+            stats = dict(self._stats, entries=len(self._entries))
+        reads = stats["hits"] + stats["negative_hits"] + stats["misses"]
+        stats["hit_ratio"] = (stats["hits"] + stats["negative_hits"]) / reads if reads else 0.0
+        return stats
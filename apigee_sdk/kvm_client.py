@@ -1,5 +1,11 @@
+from itertools import islice
+from urllib.parse import quote, urlencode
+
 import requests
 
+from apigee_sdk.concurrency import run_concurrently
+from apigee_sdk.kvm_files import read_entries, write_entries
+
 class KVMClient:
     """
     Client to manage Key-Value Maps (KVMs) in Apigee Edge.
@@ -8,19 +14,26 @@ class KVMClient:
 
     Attributes:
         base_url (str): The base URL for the Apigee API.
+        kvms_url (str): The URL of the KVM collection.
         headers (dict): The headers used for API requests, including the authorization token.
+        session: The ``requests.Session`` or the ``requests`` module used to send requests.
     """
 
-    def __init__(self, base_url, token):
+    def __init__(self, base_url, token, session=None, collection="kvms"):
         """
         Initializes the KVMClient with the base URL and authorization token.
 
         Args:
             base_url (str): The base URL for the Apigee API.
             token (str): The authorization token for accessing the API.
+            session (requests.Session): Optional session whose connection pool is used for every request.
+            collection (str): The path segment of the KVM collection under ``base_url``,
+                e.g. ``"keyvaluemaps"`` for management API scopes.
         """
         self.base_url = base_url
+        self.kvms_url = f"{base_url}/{collection}"
         self.headers = {"Authorization": f"Bearer {token}"}
+        self.session = session or requests
 
     def create_kvm(self, payload):
         """
@@ -35,7 +48,7 @@ class KVMClient:
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.post(f"{self.base_url}/kvms", headers={"Content-Type": "application/json", **self.headers}, json=payload)
+        response = self.session.post(self.kvms_url, headers={"Content-Type": "application/json", **self.headers}, json=payload)
         response.raise_for_status()
         return response.json()
 
@@ -52,7 +65,7 @@ class KVMClient:
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.delete(f"{self.base_url}/kvms/{kvm_id}", headers=self.headers)
+        response = self.session.delete(f"{self.kvms_url}/{kvm_id}", headers=self.headers)
         response.raise_for_status()
         return response.json()
 
@@ -69,7 +82,7 @@ class KVMClient:
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.get(f"{self.base_url}/kvms/{kvm_id}", headers=self.headers)
+        response = self.session.get(f"{self.kvms_url}/{kvm_id}", headers=self.headers)
         response.raise_for_status()
         return response.json()
 
@@ -83,7 +96,7 @@ class KVMClient:
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.get(f"{self.base_url}/kvms", headers=self.headers)
+        response = self.session.get(self.kvms_url, headers=self.headers)
         response.raise_for_status()
         return response.json()
 
@@ -101,6 +114,264 @@ class KVMClient:
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.put(f"{self.base_url}/kvms/{kvm_id}", headers={"Content-Type": "application/json", **self.headers}, json=payload)
+        response = self.session.put(f"{self.kvms_url}/{kvm_id}", headers={"Content-Type": "application/json", **self.headers}, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    def list_kvm_entries(self, kvm_id, page_size=None, page_token=None):
+        """
+        Lists one page of the entries of a Key-Value Map (KVM).
+
+        Args:
+            kvm_id (str): The ID of the KVM.
+            page_size (int): Optional maximum number of entries to return.
+            page_token (str): Optional token of the page to return, from ``nextPageToken``.
+
+        Returns:
+            dict: The response from the API with the ``keyValueEntries`` and ``nextPageToken``.
+
+        Raises:
+            HTTPError: If the API request fails.
+        """
+        params = {}
+        if page_size is not None:
+            params["pageSize"] = page_size
+        if page_token:
+            params["pageToken"] = page_token
+        url = f"{self.kvms_url}/{kvm_id}/entries"
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        response = self.session.get(url, headers=self.headers)
+        response.raise_for_status()
+        return response.json()
+
+    def iter_kvm_entries(self, kvm_id, page_size=100):
+        """
+        Yields every entry of a Key-Value Map (KVM), following the page tokens.
+
+        Args:
+            kvm_id (str): The ID of the KVM.
+            page_size (int): The number of entries per request.
+
+        Yields:
+            dict: One entry with its ``name`` and ``value``.
+
+        Raises:
+            HTTPError: If an API request fails.
+        """
+        page_token = None
+        while True:
+            page = self.list_kvm_entries(kvm_id, page_size=page_size, page_token=page_token)
+            yield from page.get("keyValueEntries", [])
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                return
+
+    def get_kvm_entry(self, kvm_id, name):
+        """
+        Fetches a single entry of a Key-Value Map (KVM).
+
+        Args:
+            kvm_id (str): The ID of the KVM.
+            name (str): The entry name.
+
+        Returns:
+            dict: The response from the API containing the entry ``name`` and ``value``.
+
+        Raises:
+            HTTPError: If the API request fails, e.g. with status 404 if the entry does not exist.
+        """
+        response = self.session.get(f"{self.kvms_url}/{kvm_id}/entries/{quote(name, safe='')}", headers=self.headers)
+        response.raise_for_status()
+        return response.json()
+
+    def create_kvm_entry(self, kvm_id, name, value):
+        """
+        Creates an entry in a Key-Value Map (KVM).
+
+        Args:
+            kvm_id (str): The ID of the KVM.
+            name (str): The entry name.
+            value (str): The entry value.
+
+        Returns:
+            dict: The response from the API containing the created entry.
+
+        Raises:
+            HTTPError: If the API request fails.
+        """
+        response = self.session.post(f"{self.kvms_url}/{kvm_id}/entries", headers={"Content-Type": "application/json", **self.headers},
+                                     json={"name": name, "value": value})
+        response.raise_for_status()
+        return response.json()
+
+    def update_kvm_entry(self, kvm_id, name, value):
+        """
+        Updates the value of an entry in a Key-Value Map (KVM).
+
+        Args:
+            kvm_id (str): The ID of the KVM.
+            name (str): The entry name.
+            value (str): The new entry value.
+
+        Returns:
+            dict: The response from the API containing the updated entry.
+
+        Raises:
+            HTTPError: If the API request fails.
+        """
+        response = self.session.put(f"{self.kvms_url}/{kvm_id}/entries/{quote(name, safe='')}",
+                                    headers={"Content-Type": "application/json", **self.headers}, json={"name": name, "value": value})
         response.raise_for_status()
-        return response.json()
\ No newline at end of file
+        return response.json()
+
+    def delete_kvm_entry(self, kvm_id, name):
+        """
+        Deletes an entry from a Key-Value Map (KVM).
+
+        Args:
+            kvm_id (str): The ID of the KVM.
+            name (str): The entry name.
+
+        Returns:
+            dict: The response from the API confirming the deletion.
+
+        Raises:
+            HTTPError: If the API request fails.
+        """
+        response = self.session.delete(f"{self.kvms_url}/{kvm_id}/entries/{quote(name, safe='')}", headers=self.headers)
+        response.raise_for_status()
+        return response.json()
+
+    def sync_kvm(self, kvm_id, source, format=None, delete=True, dry_run=False, max_workers=8):
+        """
+        Makes the entries of a Key-Value Map (KVM) match a source file, writing only what changed.
+
+        The current entries are fetched page by page, the source file is read and compared
+        against them, and the inserts, updates and deletes are applied concurrently through the
+        per-entry endpoints. If a name appears more than once in the source, its last value wins,
+        so every name gets at most one change.
+
+        Args:
+            kvm_id (str): The ID of the KVM.
+            source (str): The path of a CSV, JSON or NDJSON file, see ``read_entries``.
+            format (str): The source format. Defaults to the file extension.
+            delete (bool): Whether to delete entries that are not in the source.
+            dry_run (bool): Whether to only compute the changes without applying them.
+            max_workers (int): The maximum number of concurrent writes.
+
+        Returns:
+            dict: The number of ``inserted``, ``updated``, ``deleted`` and ``unchanged`` entries,
+                and the ``failed`` changes with their ``action``, ``name`` and ``error``.
+
+        Raises:
+            HTTPError: If fetching the current entries fails.
+            ValueError: If the source file is invalid.
+        """
+        current = {entry["name"]: entry.get("value") for entry in self.iter_kvm_entries(kvm_id)}
+        summary = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0, "failed": []}
+
+        desired = dict(read_entries(source, format))
+
+        def changes():
+            for name, value in desired.items():
+                if name not in current:
+                    yield ("inserted", name, value)
+                elif current[name] != value:
+                    yield ("updated", name, value)
+                else:
+                    summary["unchanged"] += 1
+            if delete:
+                for name in [name for name in current if name not in desired]:
+                    yield ("deleted", name, None)
+
+        def apply(change):
+            action, name, value = change
+            if action == "inserted":
+                self.create_kvm_entry(kvm_id, name, value)
+            elif action == "updated":
+                self.update_kvm_entry(kvm_id, name, value)
+            else:
+                self.delete_kvm_entry(kvm_id, name)
+
+        if dry_run:
+            for action, _, _ in changes():
+                summary[action] += 1
+            return summary
+        for outcome in run_concurrently(apply, changes(), max_workers):
+            action, name, _ = outcome["item"]
+            if outcome["error"]:
+                summary["failed"].append({"action": action, "name": name, "error": str(outcome["error"])})
+            else:
+                summary[action] += 1
+        return summary
+
+    def export_kvm(self, kvm_id, path, page_size=100):
+        """
+        Streams the entries of a Key-Value Map (KVM) to an NDJSON file, page by page.
+
+        Args:
+            kvm_id (str): The ID of the KVM.
+            path (str): The path of the file. Names ending in ``.gz`` are gzip-compressed.
+            page_size (int): The number of entries per request.
+
+        Returns:
+            int: The number of entries exported.
+
+        Raises:
+            HTTPError: If an API request fails.
+        """
+        return write_entries(path, self.iter_kvm_entries(kvm_id, page_size=page_size))
+
+    def import_kvm(self, kvm_id, path, format=None, overwrite=False, max_workers=8, batch_size=100, max_failed=100):
+        """
+        Creates the entries of a file in a Key-Value Map (KVM), reading the file lazily.
+
+        The file is read in batches of ``batch_size`` entries and the batches are written in
+        parallel through the per-entry endpoint, the only one that writes single entries, with at
+        most ``max_workers * 2`` batches in memory, so the file size does not bound the import.
+
+        Args:
+            kvm_id (str): The ID of the KVM.
+            path (str): The path of a CSV, JSON or NDJSON file, optionally ``.gz``-compressed.
+            format (str): The file format. Defaults to the file extension.
+            overwrite (bool): Whether to update entries that already exist instead of failing them.
+            max_workers (int): The maximum number of batches written concurrently.
+            batch_size (int): The number of entries per batch.
+            max_failed (int): The maximum number of failed entries listed in the summary.
+
+        Returns:
+            dict: The number of ``imported`` entries, the number of ``failures`` and the first
+                ``max_failed`` ``failed`` entries with their ``name`` and ``error``.
+
+        Raises:
+            ValueError: If the file is invalid.
+        """
+        def write(name, value):
+            try:
+                self.create_kvm_entry(kvm_id, name, value)
+            except requests.HTTPError as error:
+                if not overwrite or error.response is None or error.response.status_code != 409:
+                    raise
+                self.update_kvm_entry(kvm_id, name, value)
+
+        def write_batch(batch):
+            failed = []
+            for name, value in batch:
+                try:
+                    write(name, value)
+                except Exception as error:
+                    failed.append({"name": name, "error": str(error)})
+            return failed
+
+        entries = read_entries(path, format)
+        batches = iter(lambda: list(islice(entries, batch_size)), [])
+        summary = {"imported": 0, "failures": 0, "failed": []}
+        for outcome in run_concurrently(write_batch, batches, max_workers):
+            failed = outcome["result"] if outcome["error"] is None else [
+                {"name": name, "error": str(outcome["error"])} for name, _ in outcome["item"]
+            ]
+            summary["imported"] += len(outcome["item"]) - len(failed)
+            summary["failures"] += len(failed)
+            summary["failed"].extend(failed[:max_failed - len(summary["failed"])])
+        return summary
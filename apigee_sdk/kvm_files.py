@@ -0,0 +1,117 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+
+
+def detect_format(path):
+    """
+    Guesses the format of a KVM entries file from its extension, ignoring a ``.gz`` suffix.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        str: ``"csv"``, ``"ndjson"`` or ``"json"``.
+    """
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return "json"
+
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8", newline="" if mode == "r" else None)
+    return open(path, mode, encoding="utf-8", newline="" if mode == "r" else None)
+
+
+def _entry(item):
+    if "name" not in item:
+        raise ValueError(f"KVM entry without a name: {item!r}")
+    value = item.get("value", "")
+    return str(item["name"]), value if isinstance(value, str) else json.dumps(value)
+
+
+def read_entries(path, format=None):
+    """
+    Reads the entries of a KVM from a CSV, JSON or NDJSON file.
+
+    CSV files need ``name`` and ``value`` columns. NDJSON files hold one ``{"name", "value"}``
+    object per line. JSON files hold a ``{name: value}`` object, a list of ``{"name", "value"}``
+    objects, or a ``{"keyValueEntries": [...]}`` management API response. Files ending in ``.gz``
+    are decompressed. CSV and NDJSON files are streamed; non-string values are serialized to JSON.
+
+    Args:
+        path (str): The path of the file.
+        format (str): ``"csv"``, ``"json"`` or ``"ndjson"``. Defaults to the file extension.
+
+    Yields:
+        tuple: ``(name, value)`` pairs in file order.
+
+    Raises:
+        ValueError: If the format is unknown or an entry has no name.
+    """
+    format = format or detect_format(path)
+    path = os.path.expanduser(path)
+    if format == "csv":
+        with _open(path, "r") as source:
+            for row in csv.DictReader(source):
+                yield _entry(row)
+    elif format == "ndjson":
+        with _open(path, "r") as source:
+            for line in source:
+                if line.strip():
+                    yield _entry(json.loads(line))
+    elif format == "json":
+        with _open(path, "r") as source:
+            document = json.load(source)
+        if isinstance(document, dict) and "keyValueEntries" in document:
+            document = document["keyValueEntries"]
+        if isinstance(document, dict):
+            for name, value in document.items():
+                yield _entry({"name": name, "value": value})
+        else:
+            for item in document:
+                yield _entry(item)
+    else:
+        raise ValueError(f"Unknown KVM file format: {format}")
+
+
+def write_entries(path, entries):
+    """
+    Writes KVM entries to an NDJSON file, one ``{"name", "value"}`` object per line.
+
+    Entries are written as they are produced, and the file is gzip-compressed if its name ends in ``.gz``.
+    They go to a temporary file in the same directory that is moved into place with ``os.replace``
+    once every entry is written, so a failed export never leaves a truncated file behind. Like the
+    temporary file, the export is readable by its owner only, because KVMs often hold secrets.
+
+    Args:
+        path (str): The path of the file.
+        entries (iterable): ``{"name", "value"}`` dicts, e.g. from ``KVMClient.iter_kvm_entries``.
+
+    Returns:
+        int: The number of entries written.
+    """
+    path = os.path.expanduser(path)
+    handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".kvm-export-",
+                                         suffix=".gz" if path.endswith(".gz") else "")
+    os.close(handle)
+    written = 0
+    try:
+        with _open(temporary, "w") as target:
+            for entry in entries:
+                target.write(json.dumps({"name": entry["name"], "value": entry.get("value")}) + "\n")
+                written += 1
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return written
@@ -0,0 +1,180 @@
+import mmap
+import os
+import struct
+import tempfile
+
+MAGIC = b"AKVS"
+VERSION = 1
+_HEADER = struct.Struct("<4sIQ")
+_INDEX_ENTRY = struct.Struct("<QIQI")
+
+
+def write_snapshot(path, entries):
+    """
+    Writes KVM entries to a snapshot file and atomically replaces the previous snapshot.
+
+    The file holds a header, an index of ``(key offset, key length, value offset, value length)``
+    records sorted by key, and the keys and values blob. It is written to a temporary file in the
+    same directory and moved into place with ``os.replace``, so readers see either the old or the
+    new snapshot, never a partial one.
+
+    Args:
+        path (str): The path of the snapshot file.
+        entries (iterable): ``(name, value)`` pairs. Later pairs win over earlier ones with the same name.
+
+    Returns:
+        int: The number of entries written.
+    """
+    path = os.path.expanduser(path)
+    pairs = sorted({name.encode("utf-8"): value.encode("utf-8") for name, value in entries}.items())
+    offset = _HEADER.size + _INDEX_ENTRY.size * len(pairs)
+    index, blob = [], []
+    for key, value in pairs:
+        index.append(_INDEX_ENTRY.pack(offset, len(key), offset + len(key), len(value)))
+        blob.append(key)
+        blob.append(value)
+        offset += len(key) + len(value)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=directory, prefix=".kvm-snapshot-")
+    try:
+        with os.fdopen(handle, "wb") as snapshot:
+            snapshot.write(_HEADER.pack(MAGIC, VERSION, len(pairs)))
+            snapshot.write(b"".join(index))
+            snapshot.write(b"".join(blob))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return len(pairs)
+
+
+def snapshot_kvm(client, kvm_id, path):
+    """
+    Fetches every entry of a Key-Value Map (KVM) and writes it to a snapshot file.
+
+    Args:
+        client (KVMClient): The client used to fetch the entries.
+        kvm_id (str): The ID of the KVM.
+        path (str): The path of the snapshot file.
+
+    Returns:
+        int: The number of entries written.
+
+    Raises:
+        HTTPError: If an API request fails. The previous snapshot is left in place.
+    """
+    return write_snapshot(path, ((entry["name"], entry.get("value") or "") for entry in client.iter_kvm_entries(kvm_id)))
+
+
+class KVMSnapshot:
+    """
+    Read-only, memory-mapped view of a KVM snapshot file.
+
+    The file is mapped with ``mmap``, so every process that opens the same snapshot shares the
+    same pages of the page cache instead of holding its own copy. Lookups binary-search the sorted
+    index in place; ``view`` returns a ``memoryview`` of the value without copying it.
+
+    Attributes:
+        path (str): The path of the snapshot file.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the KVMSnapshot and maps the snapshot file.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Raises:
+            ValueError: If the file is not a KVM snapshot.
+        """
+        self.path = os.path.expanduser(path)
+        self._mapping, self._identity = (None, 0), None
+        self._open()
+
+    def _open(self):
+        with open(self.path, "rb") as snapshot:
+            status = os.fstat(snapshot.fileno())
+            mapped = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = _HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC or version != VERSION:
+            mapped.close()
+            raise ValueError(f"{self.path} is not a KVM snapshot")
+        # The previous mapping is released once no memoryview refers to it any more.
+        self._mapping, self._identity = (mapped, count), (status.st_ino, status.st_mtime_ns, status.st_size)
+
+    def reload(self):
+        """
+        Maps the snapshot file again if it was replaced since it was last mapped.
+
+        Returns:
+            bool: True if a new snapshot was mapped.
+        """
+        status = os.stat(self.path)
+        if (status.st_ino, status.st_mtime_ns, status.st_size) == self._identity:
+            return False
+        self._open()
+        return True
+
+    def __len__(self):
+        return self._mapping[1]
+
+    def __contains__(self, name):
+        return self.view(name) is not None
+
+    def view(self, name):
+        """
+        Looks up an entry without copying its value.
+
+        Args:
+            name (str): The entry name.
+
+        Returns:
+            memoryview: The UTF-8 encoded value, or None if the entry does not exist.
+        """
+        (mapped, count), key = self._mapping, name.encode("utf-8")
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, value_offset, value_length = _INDEX_ENTRY.unpack_from(
+                mapped, _HEADER.size + middle * _INDEX_ENTRY.size
+            )
+            candidate = mapped[key_offset:key_offset + key_length]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return memoryview(mapped)[value_offset:value_offset + value_length]
+        return None
+
+    def get(self, name, default=None):
+        """
+        Looks up the value of an entry.
+
+        Args:
+            name (str): The entry name.
+            default: The value returned if the entry does not exist.
+
+        Returns:
+            str: The entry value, or ``default`` if the entry does not exist.
+        """
+        value = self.view(name)
+        return default if value is None else str(value, "utf-8")
+
+    def keys(self):
+        """
+        Yields the entry names in sorted order.
+
+        Yields:
+            str: One entry name.
+        """
+        mapped, count = self._mapping
+        for position in range(count):
+            key_offset, key_length, _, _ = _INDEX_ENTRY.unpack_from(mapped, _HEADER.size + position * _INDEX_ENTRY.size)
+            yield mapped[key_offset:key_offset + key_length].decode("utf-8")
@@ -0,0 +1,213 @@
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from apigee_sdk.analytics import format_time_range
+from apigee_sdk.concurrency import run_concurrently
+
+logger = logging.getLogger(__name__)
+
+
+def _metric_name(select):
+    name = re.sub(r"[^a-zA-Z0-9_]+", "_", select).strip("_")
+    return f"apigee_{name}"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsExporter:
+    """
+    Periodically polls the analytics stats API and serves the results in the Prometheus text format.
+
+    Scrapes are served from the last rendered result held in memory, so they never trigger
+    management API calls. Concurrent refreshes are coalesced: a refresh requested while another
+    one is running waits for it instead of starting a second round of calls.
+
+    Attributes:
+        client (AnalyticsClient): The client used to query the stats.
+        org (str): The organization name.
+        environments (list): The environments to export.
+        dimensions (list): The stats dimensions to export, e.g. ``["apis"]``.
+        select (str): The metrics to export, e.g. ``"sum(message_count),avg(total_response_time)"``.
+        lookback (timedelta): The time range covered by each refresh.
+        interval (float): The number of seconds between background refreshes.
+        max_workers (int): The maximum number of concurrent stats requests.
+    """
+
+    def __init__(self, client, org, environments, dimensions=("apis",), select="sum(message_count)",
+                 lookback=timedelta(minutes=5), interval=60, max_workers=4):
+        """
+        Initializes the MetricsExporter.
+
+        Args:
+            client (AnalyticsClient): The client used to query the stats.
+            org (str): The organization name.
+            environments (list): The environments to export.
+            dimensions (list): The stats dimensions to export.
+            select (str): The metrics to export.
+            lookback (timedelta): The time range covered by each refresh.
+            interval (float): The number of seconds between background refreshes.
+            max_workers (int): The maximum number of concurrent stats requests.
+        """
+        self.client = client
+        self.org = org
+        self.environments = list(environments)
+        self.dimensions = list(dimensions)
+        self.select = select
+        self.lookback = lookback
+        self.interval = interval
+        self.max_workers = max_workers
+        self.refresh_errors = 0
+        self.last_refresh = None
+        self._text = ""
+        self._results = {}
+        self._lock = threading.Lock()
+        self._refreshing = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _fetch(self, target):
+        env, dimension = target
+        end = datetime.now(timezone.utc)
+        return self.client.get_stats(self.org, env, dimension, self.select, format_time_range(end - self.lookback, end))
+
+    def _render(self, results):
+        samples = {}
+        for (env, dimension), response in results:
+            for environment in response.get("environments", []):
+                for entry in environment.get("dimensions", []):
+                    for metric in entry.get("metrics", []):
+                        values = metric.get("values", [])
+                        if not values:
+                            continue
+                        latest = values[-1]
+                        value = latest.get("value") if isinstance(latest, dict) else latest
+                        try:
+                            value = float(value)
+                        except (TypeError, ValueError):
+                            continue
+                        labels = (f'environment="{_escape_label(env)}",dimension="{_escape_label(dimension)}",'
+                                  f'name="{_escape_label(entry["name"])}"')
+                        samples.setdefault(metric["name"], []).append(f"{_metric_name(metric['name'])}{{{labels}}} {value}")
+        lines = []
+        for select, metric_samples in sorted(samples.items()):
+            name = _metric_name(select)
+            lines.append(f"# HELP {name} Apigee analytics metric {select}.")
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(metric_samples)
+        return lines
+
+    def refresh(self):
+        """
+        Fetches the stats for every environment and dimension and re-renders the metrics.
+
+        If a refresh is already running, waits for it to finish instead of starting another one.
+        When the request for an environment and dimension fails, its last good values are kept
+        and the error counter is incremented.
+
+        Returns:
+            str: The rendered metrics.
+        """
+        with self._lock:
+            running = self._refreshing
+            if running is None:
+                self._refreshing = threading.Event()
+        if running is not None:
+            running.wait()
+            return self._text
+        try:
+            targets = [(env, dimension) for env in self.environments for dimension in self.dimensions]
+            results, failed, succeeded = dict(self._results), False, False
+            for outcome in run_concurrently(self._fetch, targets, self.max_workers):
+                if outcome["error"]:
+                    failed = True
+                else:
+                    results[outcome["item"]], succeeded = outcome["result"], True
+            if failed:
+                self.refresh_errors += 1
+            if succeeded or not self._text:
+                self._results = results
+                lines = self._render(sorted(results.items(), key=lambda result: result[0]))
+                self.last_refresh = time.time()
+                lines.append("# HELP apigee_exporter_last_refresh_timestamp_seconds Time of the last refresh.")
+                lines.append("# TYPE apigee_exporter_last_refresh_timestamp_seconds gauge")
+                lines.append(f"apigee_exporter_last_refresh_timestamp_seconds {self.last_refresh}")
+                lines.append("# HELP apigee_exporter_refresh_errors_total Refreshes with at least one failed request.")
+                lines.append("# TYPE apigee_exporter_refresh_errors_total counter")
+                lines.append(f"apigee_exporter_refresh_errors_total {self.refresh_errors}")
+                self._text = "\n".join(lines) + "\n"
+            return self._text
+        finally:
+            with self._lock:
+                event, self._refreshing = self._refreshing, None
+            event.set()
+
+    def render(self):
+        """
+        Returns the last rendered metrics without calling the management API.
+
+        Returns:
+            str: The metrics in the Prometheus text exposition format.
+        """
+        return self._text
+
+    def start(self):
+        """
+        Refreshes the metrics once and then keeps refreshing them in a background thread.
+        """
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                self.refresh_errors += 1
+                logger.exception("Refreshing the Apigee metrics failed")
+
+    def stop(self):
+        """
+        Stops the background refresh thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def make_server(self, host="0.0.0.0", port=9464):
+        """
+        Creates an HTTP server that serves the rendered metrics on ``/metrics``.
+
+        Args:
+            host (str): The interface to listen on.
+            port (int): The port to listen on.
+
+        Returns:
+            ThreadingHTTPServer: The server. Call ``serve_forever()`` to start serving.
+        """
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return ThreadingHTTPServer((host, port), MetricsHandler)
@@ -0,0 +1,60 @@
+from urllib.parse import urlencode
+
+
+def listing_url(url, expand=False, count=None, start_key=None, count_param="count"):
+    """
+    Adds the expand and paging query parameters of an Apigee list endpoint to a URL.
+
+    Args:
+        url (str): The URL of the list endpoint.
+        expand (bool): Whether to request full objects instead of names or IDs.
+        count (int): Optional maximum number of entries to return.
+        start_key (str): Optional name or ID of the first entry to return.
+        count_param (str): The name of the page size parameter, e.g. ``"rows"`` for apps.
+
+    Returns:
+        str: The URL, unchanged if no parameter is set.
+    """
+    params = {}
+    if expand:
+        params["expand"] = "true"
+    if count is not None:
+        params[count_param] = count
+    if start_key is not None:
+        params["startKey"] = start_key
+    return f"{url}?{urlencode(params)}" if params else url
+
+
+def iter_listing(list_page, items_keys, id_key, page_size=1000):
+    """
+    Yields every entry of an expanded, paginated Apigee listing.
+
+    Each page starts at the last entry of the previous page, which Apigee returns again and which
+    is skipped. Entries are full objects when the endpoint honours ``expand`` and names or IDs otherwise.
+
+    Args:
+        list_page (callable): Called with ``expand``, ``count`` and ``start_key`` keyword arguments
+            and returning one page of the listing.
+        items_keys (tuple): The keys the entries may be wrapped in, e.g. ``("developer", "developers")``.
+        id_key (str): The key of the entry field used as the start key, e.g. ``"email"``.
+        page_size (int): The maximum number of entries per page.
+
+    Yields:
+        The entries of the listing.
+    """
+    start_key = None
+    while True:
+        page = list_page(expand=True, count=page_size, start_key=start_key)
+        if isinstance(page, dict):
+            page = next((page[key] for key in items_keys if key in page), [])
+        entries = page
+        if start_key is not None and entries and _entry_id(entries[0], id_key) == start_key:
+            entries = entries[1:]
+        yield from entries
+        if not entries or len(page) < page_size:
+            return
+        start_key = _entry_id(page[-1], id_key)
+
+
+def _entry_id(entry, id_key):
+    return entry.get(id_key) if isinstance(entry, dict) else entry
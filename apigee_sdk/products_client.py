@@ -1,5 +1,7 @@
 import requests
 
+from apigee_sdk.pagination import iter_listing, listing_url
+
 class ProductsClient:
     """
     Client to manage API products in Apigee Edge.
@@ -73,20 +75,40 @@ class ProductsClient:
         response.raise_for_status()
         return response.json()
 
-    def list_products(self):
+    def list_products(self, expand=False, count=None, start_key=None):
         """
         Lists all API products in the Apigee environment.
 
+        Args:
+            expand (bool): Whether to return full product objects instead of names.
+            count (int): Optional maximum number of products to return.
+            start_key (str): Optional name of the first product to return.
+
         Returns:
             dict: The response from the API containing a list of API products.
 
         Raises:
             HTTPError: If the API request fails.
         """
-        response = requests.get(f"{self.base_url}/products", headers=self.headers)
+        response = requests.get(listing_url(f"{self.base_url}/products", expand, count, start_key), headers=self.headers)
         response.raise_for_status()
         return response.json()
 
+    def iter_products(self, page_size=1000):
+        """
+        Yields every product as a full object, using expanded, paginated listing calls.
+
+        Args:
+            page_size (int): The number of products per listing call.
+
+        Yields:
+            dict: The details of one product.
+
+        Raises:
+            HTTPError: If an API request fails.
+        """
+        yield from iter_listing(self.list_products, ("apiProduct", "products"), "name", page_size)
+
     def update_product(self, product_id, payload):
         """
         Updates an existing API product by its ID.
@@ -0,0 +1,120 @@
+import time
+
+from apigee_sdk.concurrency import run_concurrently
+
+
+class PromotionPipeline:
+    """
+    Promotes API proxy revisions through an ordered chain of environments.
+
+    Each stage deploys every revision to its environments concurrently and waits for the
+    deployments to become ready before the next stage starts. A stage is either a single
+    environment name or a list of environment names that may be deployed in parallel,
+    for example ``["dev", "test", ["uat", "uat-eu"], "prod"]``.
+
+    Attributes:
+        client (ProxyClient): The client used to deploy revisions.
+        bearer (str): The bearer token for authorization.
+        stages (list): The ordered promotion stages.
+        max_workers (int): The maximum number of concurrent deployments.
+        gate (callable): Optional callable that receives a finished stage report and returns
+            False to stop the promotion.
+        gate_delay (float): The number of seconds to wait between stages.
+        readiness_timeout (float): The maximum number of seconds to wait for a deployment.
+        poll_interval (float): The number of seconds between deployment status checks.
+        override (bool): Whether deployments replace the revision already deployed to an environment.
+    """
+
+    def __init__(self, client, bearer, stages, max_workers=8, gate=None, gate_delay=0,
+                 readiness_timeout=300, poll_interval=5, override=True):
+        """
+        Initializes the PromotionPipeline.
+
+        Args:
+            client (ProxyClient): The client used to deploy revisions.
+            bearer (str): The bearer token for authorization.
+            stages (list): The ordered promotion stages.
+            max_workers (int): The maximum number of concurrent deployments.
+            gate (callable): Optional callable that receives a finished stage report and
+                returns False to stop the promotion.
+            gate_delay (float): The number of seconds to wait between stages.
+            readiness_timeout (float): The maximum number of seconds to wait for a deployment.
+            poll_interval (float): The number of seconds between deployment status checks.
+            override (bool): Whether deployments replace the revision already deployed to an
+                environment. Defaults to True, since promoting usually replaces an older revision.
+        """
+        self.client = client
+        self.bearer = bearer
+        self.stages = [[stage] if isinstance(stage, str) else list(stage) for stage in stages]
+        self.max_workers = max_workers
+        self.gate = gate
+        self.gate_delay = gate_delay
+        self.readiness_timeout = readiness_timeout
+        self.poll_interval = poll_interval
+        self.override = override
+
+    def _deploy(self, org, target):
+        env, api, revision = target
+        self.client.deploy_proxy_revision(org, env, api, revision, self.bearer, override=self.override)
+        return self.client.wait_for_deployment(
+            org, env, api, revision, self.bearer,
+            timeout=self.readiness_timeout, interval=self.poll_interval
+        )
+
+    def run_stage(self, org, environments, revisions):
+        """
+        Deploys revisions to the environments of a single stage and waits for readiness.
+
+        Args:
+            org (str): The organization name.
+            environments (list): The environment names of the stage.
+            revisions (dict): A mapping of API proxy names to the revision to deploy.
+
+        Returns:
+            dict: The stage report with the keys ``environments``, ``elapsed`` (seconds),
+                ``passed`` and ``results`` (one entry per deployment).
+        """
+        started = time.monotonic()
+        targets = [(env, api, revision) for env in environments for api, revision in revisions.items()]
+        results = []
+        for outcome in run_concurrently(lambda target: self._deploy(org, target), targets, self.max_workers):
+            env, api, revision = outcome["item"]
+            results.append({
+                "environment": env,
+                "api": api,
+                "revision": revision,
+                "elapsed": outcome["elapsed"],
+                "error": str(outcome["error"]) if outcome["error"] else None,
+            })
+        return {
+            "environments": environments,
+            "elapsed": time.monotonic() - started,
+            "passed": all(result["error"] is None for result in results),
+            "results": results,
+        }
+
+    def promote(self, org, revisions):
+        """
+        Promotes revisions through every stage, stopping at the first failed or rejected stage.
+
+        Args:
+            org (str): The organization name.
+            revisions (dict): A mapping of API proxy names to the revision to promote.
+
+        Returns:
+            dict: The promotion report with the keys ``completed`` and ``stages`` (one stage
+                report per stage that ran).
+        """
+        reports = []
+        for index, environments in enumerate(self.stages):
+            report = self.run_stage(org, environments, revisions)
+            reports.append(report)
+            if not report["passed"]:
+                return {"completed": False, "stages": reports}
+            if index == len(self.stages) - 1:
+                break
+            if self.gate is not None and not self.gate(report):
+                return {"completed": False, "stages": reports}
+            if self.gate_delay:
+                time.sleep(self.gate_delay)
+        return {"completed": True, "stages": reports}
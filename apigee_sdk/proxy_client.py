@@ -1,5 +1,10 @@
+import fnmatch
+import time
+
 import requests
 
+from apigee_sdk.concurrency import run_concurrently
+
 class ProxyClient:
     """
     Client to interact with the Apigee Management API.
@@ -10,18 +15,21 @@ class ProxyClient:
     Attributes:
         base_url (str): The base URL for the Apigee API.
         token (str): The authorization token for accessing the API.
+        journal (DeploymentJournal): Optional journal that records deployments for rollback.
     """
 
-    def __init__(self, base_url, token):
+    def __init__(self, base_url, token, journal=None):
         """
         Initializes the ProxyClient with the base URL and authorization token.
 
         Args:
             base_url (str): The base URL for the Apigee API.
             token (str): The authorization token for accessing the API.
+            journal (DeploymentJournal): Optional journal that records deployments for rollback.
         """
         self.base_url = base_url
         self.token = token
+        self.journal = journal
 
     def _handle_request_errors(self, response):
         """
@@ -115,16 +123,21 @@ class ProxyClient:
         self._handle_request_errors(response)
         return response.json()
 
-    def deploy_proxy_revision(self, org, env, api, revision, bearer):
+    def deploy_proxy_revision(self, org, env, api, revision, bearer, override=False):
         """
         Deploys a specific revision of the API Proxy to an environment.
 
+        The deployment is recorded in the client's journal, if one is configured.
+
         Args:
             org (str): The organization name.
             env (str): The environment name.
             api (str): The API proxy name.
             revision (str): The revision number to deploy.
             bearer (str): The bearer token for authorization.
+            override (bool): Whether to replace the revision currently deployed to the environment
+                (``?override=true``). Without it, Edge rejects a deployment while another revision
+                is deployed.
 
         Returns:
             dict: The response from the API confirming the deployment.
@@ -132,7 +145,17 @@ class ProxyClient:
         Raises:
             Exception: If the API request fails.
         """
+        if self.journal is None:
+            return self._post_deployment(org, env, api, revision, bearer, override=override)
+        with self.journal.locked(org, env, api):
+            response = self._post_deployment(org, env, api, revision, bearer, override=override)
+            self.journal.record_deployment(org, env, api, revision)
+        return response
+
+    def _post_deployment(self, org, env, api, revision, bearer, override=False):
         url = f"{self.base_url}/v1/organizations/{org}/environments/{env}/apis/{api}/revisions/{revision}/deployments"
+        if override:
+            url += "?override=true"
         headers = {
             "Authorization": f"Bearer {bearer}"
         }
@@ -140,6 +163,70 @@ class ProxyClient:
         self._handle_request_errors(response)
         return response.json()
 
+    def rollback(self, org, env, api, bearer):
+        """
+        Rolls the API Proxy back to the revision deployed before the current one.
+
+        The previous revision is taken from the deployment journal, so no discovery calls are
+        made: the previous revision is deployed with ``override=true``, replacing the current one
+        without downtime, and the current one is then undeployed. The journal
+        is read and updated while holding the proxy's journal lock, so concurrent deployments
+        and rollbacks of the same proxy cannot interleave. If the previous revision was
+        redeployed but the current one could not be undeployed, the rollback is recorded as
+        partial and an exception is raised.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+            bearer (str): The bearer token for authorization.
+
+        Returns:
+            dict: A summary with the restored ``revision`` and the ``rolled_back_revision``.
+
+        Raises:
+            Exception: If no journal is configured, no previous revision is recorded, or the API request fails.
+        """
+        if self.journal is None:
+            raise Exception("Rollback requires a deployment journal")
+        with self.journal.locked(org, env, api):
+            current, previous = self.journal.revisions(org, env, api)
+            if previous is None:
+                raise Exception(f"No previous revision recorded for {api} in {env}")
+            self._post_deployment(org, env, api, previous, bearer, override=True)
+            try:
+                self.delete_deployment(org, env, api, current, bearer)
+            except Exception as error:
+                self.journal.record_rollback(org, env, api, undeploy_error=str(error))
+                raise Exception(f"Redeployed revision {previous} of {api} in {env}, "
+                                f"but undeploying revision {current} failed: {error}")
+            self.journal.record_rollback(org, env, api)
+        return {"api": api, "environment": env, "revision": previous, "rolled_back_revision": current}
+
+    def rollback_many(self, org, env, apis, bearer, max_workers=8):
+        """
+        Rolls back several API Proxies concurrently.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            apis (list): The API proxy names to roll back. Repeated names are rolled back once.
+            bearer (str): The bearer token for authorization.
+            max_workers (int): The maximum number of concurrent rollbacks.
+
+        Yields:
+            dict: One result per API proxy as it completes, with the keys ``api``, ``result``,
+                ``error`` and ``elapsed``.
+        """
+        for outcome in run_concurrently(lambda api: self.rollback(org, env, api, bearer), list(dict.fromkeys(apis)),
+                                        max_workers):
+            yield {
+                "api": outcome["item"],
+                "result": outcome["result"],
+                "error": str(outcome["error"]) if outcome["error"] else None,
+                "elapsed": outcome["elapsed"],
+            }
+
     def get_deployment_status(self, org, env, api, bearer):
         """
         Checks the deployment status of the API Proxy in an environment.
@@ -164,6 +251,40 @@ class ProxyClient:
         self._handle_request_errors(response)
         return response.json()
 
+    def wait_for_deployment(self, org, env, api, revision, bearer, timeout=300, interval=5):
+        """
+        Waits until a revision of the API Proxy reports as deployed in an environment.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+            revision (str): The revision number to wait for.
+            bearer (str): The bearer token for authorization.
+            timeout (float): The maximum number of seconds to wait.
+            interval (float): The number of seconds between status checks.
+
+        Returns:
+            dict: The last deployment status response from the API.
+
+        Raises:
+            Exception: If the deployment fails, does not become ready in time, or the API request fails.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            status = self.get_deployment_status(org, env, api, bearer)
+            for deployed in status.get("revision", []):
+                if str(deployed.get("name")) != str(revision):
+                    continue
+                state = deployed.get("state")
+                if state == "deployed":
+                    return status
+                if state == "error":
+                    raise Exception(f"Deployment of {api} revision {revision} to {env} failed")
+            if time.monotonic() >= deadline:
+                raise Exception(f"Timed out waiting for {api} revision {revision} to deploy to {env}")
+            time.sleep(interval)
+
     def delete_deployment(self, org, env, api, revision, bearer):
         """
         Deletes the deployment of a specific revision of the API Proxy.
@@ -215,6 +336,159 @@ class ProxyClient:
         self._handle_request_errors(response)
         return response.json()
 
+    def export_proxy_revision(self, org, api, revision, bearer):
+        """
+        Downloads a revision of the API Proxy as a bundle.
+
+        Args:
+            org (str): The organization name.
+            api (str): The API proxy name.
+            revision (str): The revision number.
+            bearer (str): The bearer token for authorization.
+
+        Returns:
+            bytes: The ZIP bundle of the revision.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        url = f"{self.base_url}/v1/organizations/{org}/apis/{api}/revisions/{revision}?format=bundle"
+        headers = {
+            "Authorization": f"Bearer {bearer}"
+        }
+        response = requests.get(url, headers=headers)
+        self._handle_request_errors(response)
+        return response.content
+
+    def import_proxy_bundle(self, org, api, bundle, bearer):
+        """
+        Imports a bundle as a new revision of the API Proxy, creating the proxy if needed.
+
+        Args:
+            org (str): The organization name.
+            api (str): The API proxy name.
+            bundle (bytes): The ZIP bundle, e.g. from :meth:`export_proxy_revision`.
+            bearer (str): The bearer token for authorization.
+
+        Returns:
+            dict: The response from the API containing details of the new revision.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        url = f"{self.base_url}/v1/organizations/{org}/apis?action=import&name={api}"
+        headers = {
+            "Authorization": f"Bearer {bearer}"
+        }
+        response = requests.post(url, headers=headers, files={"file": (f"{api}.zip", bundle, "application/zip")})
+        self._handle_request_errors(response)
+        return response.json()
+
+    def clone_proxy_revision(self, org, api, revision, bearer):
+        """
+        Creates a new revision of the API Proxy with the same contents as an existing one.
+
+        The revision is exported as a bundle and imported again, which is how Edge copies a revision.
+
+        Args:
+            org (str): The organization name.
+            api (str): The API proxy name.
+            revision (str): The revision number to copy.
+            bearer (str): The bearer token for authorization.
+
+        Returns:
+            dict: The response from the API containing details of the new revision.
+
+        Raises:
+            Exception: If an API request fails.
+        """
+        return self.import_proxy_bundle(org, api, self.export_proxy_revision(org, api, revision, bearer), bearer)
+
+    def bulk_update_policies(self, org, payload, bearer, apis=None, pattern=None, contains_policy=None,
+                             deploy_env=None, override=True, max_workers=8):
+        """
+        Applies a policy update to many API Proxies concurrently.
+
+        For every selected proxy the latest revision is cloned (exported as a bundle and imported
+        as a new revision), the policy update is applied to the clone and, optionally, the new
+        revision is deployed.
+
+        Args:
+            org (str): The organization name.
+            payload (dict): The payload containing updated policy details.
+            bearer (str): The bearer token for authorization.
+            apis (list): The API proxy names to update. Defaults to every proxy in the organization.
+            pattern (str): Optional shell-style pattern that proxy names must match, e.g. ``"orders-*"``.
+            contains_policy (str): Optional policy name; proxies whose latest revision does not
+                contain it are skipped.
+            deploy_env (str): Optional environment to deploy the new revisions to.
+            override (bool): Whether new revisions replace the revisions already deployed in
+                ``deploy_env``, which Edge rejects otherwise.
+            max_workers (int): The maximum number of proxies updated concurrently.
+
+        Yields:
+            dict: One result per proxy as it completes, with the keys ``api``, ``status``
+                (``"updated"``, ``"skipped"`` or ``"failed"``), ``base_revision``, ``revision``,
+                ``error`` and ``elapsed``.
+
+        Raises:
+            Exception: If listing the API proxies fails.
+        """
+        latest = {}
+        if apis is None:
+            apis = []
+            for entry in self.list_apis(org, bearer, expand=True):
+                if isinstance(entry, dict):
+                    apis.append(entry["name"])
+                    if entry.get("revision"):
+                        latest[entry["name"]] = max(entry["revision"], key=int)
+                else:
+                    apis.append(entry)
+        if pattern is not None:
+            apis = [api for api in apis if fnmatch.fnmatchcase(api, pattern)]
+
+        def update(api):
+            base_revision = latest.get(api) or self.latest_revision(org, api, bearer)
+            if contains_policy is not None:
+                details = self.get_proxy_revision_details(org, api, base_revision, bearer)
+                if contains_policy not in details.get("policies", []):
+                    return {"status": "skipped", "base_revision": base_revision, "revision": None}
+            created = self.clone_proxy_revision(org, api, base_revision, bearer)
+            revision = str(created["revision"])
+            self.update_proxy_policies(org, api, revision, payload, bearer)
+            if deploy_env is not None:
+                self.deploy_proxy_revision(org, deploy_env, api, revision, bearer, override=override)
+            return {"status": "updated", "base_revision": base_revision, "revision": revision}
+
+        for outcome in run_concurrently(update, apis, max_workers):
+            result = outcome["result"] or {"status": "failed", "base_revision": None, "revision": None}
+            yield {
+                "api": outcome["item"],
+                **result,
+                "error": str(outcome["error"]) if outcome["error"] else None,
+                "elapsed": outcome["elapsed"],
+            }
+
+    def latest_revision(self, org, api, bearer):
+        """
+        Returns the highest revision number of the API Proxy.
+
+        Args:
+            org (str): The organization name.
+            api (str): The API proxy name.
+            bearer (str): The bearer token for authorization.
+
+        Returns:
+            str: The latest revision number.
+
+        Raises:
+            Exception: If the API proxy has no revisions or the API request fails.
+        """
+        revisions = self.list_proxy_revisions(org, api, bearer)
+        if not revisions:
+            raise Exception(f"API proxy {api} has no revisions")
+        return max(revisions, key=int)
+
     def get_proxy_revision_details(self, org, api, revision, bearer):
         """
         Gets the details of a specific revision of the API Proxy.
@@ -239,13 +513,15 @@ class ProxyClient:
         self._handle_request_errors(response)
         return response.json()
 
-    def list_apis(self, org, bearer):
+    def list_apis(self, org, bearer, expand=False):
         """
         Lists all API Proxies in the organization.
 
         Args:
             org (str): The organization name.
             bearer (str): The bearer token for authorization.
+            expand (bool): Whether to return proxy objects with their revisions and metadata
+                instead of proxy names.
 
         Returns:
             dict: The response from the API containing a list of API proxies.
@@ -254,6 +530,8 @@ class ProxyClient:
             Exception: If the API request fails.
         """
         url = f"{self.base_url}/v1/organizations/{org}/apis"
+        if expand:
+            url += "?includeRevisions=true&includeMetaData=true"
         headers = {
             "Authorization": f"Bearer {bearer}"
         }
@@ -284,7 +562,7 @@ class ProxyClient:
         self._handle_request_errors(response)
         return response.json()
 
-    def start_debug_session(self, org, env, api, revision, bearer):
+    def start_debug_session(self, org, env, api, revision, bearer, session=None):
         """
         Starts a debug session for a deployed API Proxy.
 
@@ -294,6 +572,7 @@ class ProxyClient:
             api (str): The API proxy name.
             revision (str): The revision number.
             bearer (str): The bearer token for authorization.
+            session (str): Optional name for the debug session.
 
         Returns:
             dict: The response from the API containing debug session details.
@@ -305,18 +584,104 @@ class ProxyClient:
         headers = {
             "Authorization": f"Bearer {bearer}"
         }
-        response = requests.post(url, headers=headers)
+        params = {"session": session} if session else None
+        response = requests.post(url, headers=headers, params=params)
+        self._handle_request_errors(response)
+        return response.json()
+
+    def list_debug_transactions(self, org, env, api, revision, session, bearer):
+        """
+        Lists the IDs of the transactions captured by a debug session.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+            revision (str): The revision number.
+            session (str): The debug session name.
+            bearer (str): The bearer token for authorization.
+
+        Returns:
+            list: The captured transaction IDs.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        url = f"{self.base_url}/v1/organizations/{org}/environments/{env}/apis/{api}/revisions/{revision}/debugsessions/{session}/data"
+        headers = {
+            "Authorization": f"Bearer {bearer}"
+        }
+        response = requests.get(url, headers=headers)
+        self._handle_request_errors(response)
+        return response.json()
+
+    def get_debug_transaction(self, org, env, api, revision, session, transaction_id, bearer):
+        """
+        Gets the trace data of a transaction captured by a debug session.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+            revision (str): The revision number.
+            session (str): The debug session name.
+            transaction_id (str): The transaction ID.
+            bearer (str): The bearer token for authorization.
+
+        Returns:
+            dict: The response from the API containing the transaction trace.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        url = f"{self.base_url}/v1/organizations/{org}/environments/{env}/apis/{api}/revisions/{revision}/debugsessions/{session}/data/{transaction_id}"
+        headers = {
+            "Authorization": f"Bearer {bearer}"
+        }
+        response = requests.get(url, headers=headers)
         self._handle_request_errors(response)
         return response.json()
 
-    def get_api_metrics(self, org, env, bearer):
+    def delete_debug_session(self, org, env, api, revision, session, bearer):
+        """
+        Deletes a debug session and the transactions it captured.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+            api (str): The API proxy name.
+            revision (str): The revision number.
+            session (str): The debug session name.
+            bearer (str): The bearer token for authorization.
+
+        Returns:
+            dict: The response from the API confirming the deletion.
+
+        Raises:
+            Exception: If the API request fails.
+        """
+        url = f"{self.base_url}/v1/organizations/{org}/environments/{env}/apis/{api}/revisions/{revision}/debugsessions/{session}"
+        headers = {
+            "Authorization": f"Bearer {bearer}"
+        }
+        response = requests.delete(url, headers=headers)
+        self._handle_request_errors(response)
+        return response.json()
+
+    def get_api_metrics(self, org, env, bearer, select=None, time_range=None, time_unit=None, filter=None):
         """
         Gets usage and performance metrics for the API Proxy.
 
+        For long time ranges, see :meth:`apigee_sdk.analytics.AnalyticsClient.query_stats`.
+
         Args:
             org (str): The organization name.
             env (str): The environment name.
             bearer (str): The bearer token for authorization.
+            select (str): Optional metrics to return, e.g. ``"sum(message_count),avg(total_response_time)"``.
+            time_range (str): Optional time range, e.g. ``"10/01/2026 00:00~10/02/2026 00:00"``.
+            time_unit (str): Optional aggregation interval, e.g. ``"hour"`` or ``"day"``.
+            filter (str): Optional filter expression, e.g. ``"(apiproxy eq 'orders-api')"``.
 
         Returns:
             dict: The response from the API containing metrics.
@@ -328,7 +693,9 @@ class ProxyClient:
         headers = {
             "Authorization": f"Bearer {bearer}"
         }
-        response = requests.get(url, headers=headers)
+        params = {"select": select, "timeRange": time_range, "timeUnit": time_unit, "filter": filter}
+        params = {name: value for name, value in params.items() if value is not None}
+        response = requests.get(url, headers=headers, params=params or None)
         self._handle_request_errors(response)
         return response.json()
 
@@ -385,6 +752,9 @@ class ProxyClient:
         """
         Promotes a revision of the API Proxy to the production environment.
 
+        For promotions through several environments, see
+        :class:`apigee_sdk.promotion.PromotionPipeline`.
+
         Args:
             org (str): The organization name.
             api (str): The API proxy name.
@@ -397,13 +767,7 @@ class ProxyClient:
         Raises:
             Exception: If the API request fails.
         """
-        url = f"{self.base_url}/v1/organizations/{org}/environments/prod/apis/{api}/revisions/{revision}/deployments"
-        headers = {
-            "Authorization": f"Bearer {bearer}"
-        }
-        response = requests.post(url, headers=headers)
-        self._handle_request_errors(response)
-        return response.json()
+        return self.deploy_proxy_revision(org, "prod", api, revision, bearer)
 
     def delete_proxy_revision(self, org, api, revision, bearer):
         """
@@ -0,0 +1,144 @@
+import threading
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from apigee_sdk.caches_client import CachesClient
+from apigee_sdk.concurrency import run_concurrently
+from apigee_sdk.kvm_client import KVMClient
+
+
+def scope_url(base_url, org, env=None, api=None):
+    """
+    Resolves the management API URL of an organization, environment or API proxy scope.
+
+    Args:
+        base_url (str): The base URL of the management API, e.g. ``"https://api.enterprise.apigee.com"``.
+        org (str): The organization name.
+        env (str): Optional environment name.
+        api (str): Optional API proxy name.
+
+    Returns:
+        str: The scope URL, e.g. ``{base_url}/v1/organizations/{org}/environments/{env}``.
+
+    Raises:
+        ValueError: If both an environment and an API proxy are given.
+    """
+    if env is not None and api is not None:
+        raise ValueError("A scope is either an environment or an API proxy, not both")
+    url = f"{base_url}/v1/organizations/{quote(org, safe='')}"
+    if env is not None:
+        url += f"/environments/{quote(env, safe='')}"
+    elif api is not None:
+        url += f"/apis/{quote(api, safe='')}"
+    return url
+
+
+class ScopedClients:
+    """
+    Factory for KVM and cache clients scoped to organizations, environments and API proxies.
+
+    Every client shares one ``requests.Session``, so a job touching many scopes reuses one
+    connection pool instead of opening new connections per client. Clients are created once per
+    scope and reused.
+
+    Attributes:
+        base_url (str): The base URL of the management API.
+        session (requests.Session): The session shared by every client.
+    """
+
+    def __init__(self, base_url, token, session=None, pool_size=16):
+        """
+        Initializes the ScopedClients.
+
+        Args:
+            base_url (str): The base URL of the management API.
+            token (str): The authorization token for accessing the API.
+            session (requests.Session): Optional session to share. Defaults to a new session.
+            pool_size (int): The maximum number of pooled connections of a new session.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the pooled connections of the shared session.
+        """
+        self.session.close()
+
+    def _client(self, kind, factory, org, env=None, api=None):
+        key = (kind, org, env, api)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = factory(scope_url(self.base_url, org, env, api))
+            return client
+
+    def kvm(self, org, env=None, api=None):
+        """
+        Returns the KVM client of an organization, environment or API proxy scope.
+
+        Args:
+            org (str): The organization name.
+            env (str): Optional environment name.
+            api (str): Optional API proxy name.
+
+        Returns:
+            KVMClient: A client for ``{scope}/keyvaluemaps``.
+        """
+        return self._client("kvm", lambda url: KVMClient(url, self.token, session=self.session, collection="keyvaluemaps"),
+                            org, env, api)
+
+    def caches(self, org, env):
+        """
+        Returns the cache client of an environment.
+
+        Args:
+            org (str): The organization name.
+            env (str): The environment name.
+
+        Returns:
+            CachesClient: A client for ``{scope}/caches``.
+        """
+        return self._client("caches", lambda url: CachesClient(url, self.token, session=self.session), org, env)
+
+    def clear_cache_entries(self, org, environments, cache_id, prefix=None, max_workers=8):
+        """
+        Clears the entries of a cache in many environments concurrently.
+
+        Args:
+            org (str): The organization name.
+            environments (list): The environment names.
+            cache_id (str): The name of the cache in every environment.
+            prefix (str): Optional key prefix; only entries whose keys start with it are cleared.
+            max_workers (int): The maximum number of environments cleared concurrently.
+
+        Yields:
+            dict: One result per environment as it completes, with the keys ``environment``,
+                ``status`` (``"cleared"`` or ``"failed"``), ``error`` and ``elapsed``.
+        """
+        def clear(env):
+            return self.caches(org, env).clear_entries(cache_id, prefix=prefix)
+
+        for outcome in run_concurrently(clear, environments, max_workers):
+            yield {
+                "environment": outcome["item"],
+                "status": "failed" if outcome["error"] else "cleared",
+                "error": str(outcome["error"]) if outcome["error"] else None,
+                "elapsed": outcome["elapsed"],
+            }
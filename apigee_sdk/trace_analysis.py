@@ -0,0 +1,195 @@
+import gzip
+import json
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TARGET_STATE = "REQ_SENT"
+MILLIS_PER_DAY = 86400000
+
+
+def _parse_timestamp(value):
+    """Converts a trace timestamp such as ``19-10-26 10:00:00:123`` to milliseconds since midnight of its day."""
+    time_part = value.split(" ")[1]
+    hours, minutes, seconds, millis = time_part.split(":")
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(millis)
+
+
+def _elapsed(start, end):
+    return float((end - start) % MILLIS_PER_DAY)
+
+
+def _properties(result):
+    properties = result.get("properties", {}).get("property", [])
+    return {prop.get("name"): prop.get("value") for prop in properties}
+
+
+def parse_transaction(transaction, target_name=None):
+    """
+    Parses a debug transaction into compact per-step timing records.
+
+    A policy's execution time is the time since the previous trace point, a flow's time is the
+    time spent between two state changes, and the target time is the time spent waiting for the
+    backend (the ``REQ_SENT`` state).
+
+    Args:
+        transaction (dict): The transaction trace as returned by ``ProxyClient.get_debug_transaction``,
+            or a record written by ``TraceCapture``.
+        target_name (str): Optional name for the target records. Defaults to the ``target.name``
+            trace property, the API proxy name, or ``"target"``.
+
+    Returns:
+        list: ``(kind, name, duration_ms)`` tuples, where kind is ``"policy"``, ``"flow"`` or ``"target"``.
+    """
+    if "transaction" in transaction:
+        target_name = target_name or transaction.get("api")
+        transaction = transaction["transaction"]
+    records = []
+    state = None
+    state_started = None
+    previous = None
+    for point in transaction.get("point", []):
+        for result in point.get("results", []):
+            if result.get("ActionResult") != "DebugInfo" or "timestamp" not in result:
+                continue
+            timestamp = _parse_timestamp(result["timestamp"])
+            properties = _properties(result)
+            target_name = properties.get("target.name", target_name)
+            if point.get("id") == "Execution" and previous is not None:
+                name = properties.get("stepDefinition-name")
+                if name:
+                    records.append(("policy", name, _elapsed(previous, timestamp)))
+            elif point.get("id") == "StateChange" and "To" in properties:
+                if state is not None:
+                    if state == TARGET_STATE:
+                        records.append(("target", target_name or "target", _elapsed(state_started, timestamp)))
+                    else:
+                        records.append(("flow", state, _elapsed(state_started, timestamp)))
+                state = properties["To"]
+                state_started = timestamp
+            previous = timestamp
+    return records
+
+
+def iter_transactions(path):
+    """
+    Reads transactions lazily from a newline-delimited JSON file, gzip-compressed if the path ends in ``.gz``.
+
+    Args:
+        path (str): The path of the NDJSON file.
+
+    Yields:
+        dict: One parsed transaction per line.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as source:
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * q / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+class TraceLatencyAnalyzer:
+    """
+    Aggregates per-policy, per-flow and per-target execution times across many debug transactions.
+
+    Durations are stored in compact ``array('d')`` buffers, so only the timings are kept in memory,
+    and percentiles are computed with NumPy when it is installed.
+
+    Attributes:
+        durations (dict): A mapping of ``(kind, name)`` to an ``array('d')`` of durations in milliseconds.
+        transactions (int): The number of transactions analyzed.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty TraceLatencyAnalyzer.
+        """
+        self.durations = {}
+        self.transactions = 0
+
+    def add(self, transaction):
+        """
+        Adds the timing records of a single transaction.
+
+        Args:
+            transaction (dict): The transaction trace.
+        """
+        for kind, name, duration in parse_transaction(transaction):
+            key = (kind, name)
+            if key not in self.durations:
+                self.durations[key] = array("d")
+            self.durations[key].append(duration)
+        self.transactions += 1
+
+    def add_all(self, transactions):
+        """
+        Adds the timing records of every transaction in an iterable.
+
+        Args:
+            transactions (iterable): The transaction traces, e.g. from :func:`iter_transactions`.
+
+        Returns:
+            TraceLatencyAnalyzer: The analyzer itself, for chaining.
+        """
+        for transaction in transactions:
+            self.add(transaction)
+        return self
+
+    def report(self, percentiles=(50, 95, 99)):
+        """
+        Summarizes the collected durations.
+
+        Args:
+            percentiles (tuple): The percentiles to compute.
+
+        Returns:
+            list: One dict per policy, flow and target with the keys ``kind``, ``name``, ``count``,
+                ``mean``, ``max`` and ``p<N>`` for every requested percentile, slowest first by the
+                highest requested percentile.
+        """
+        rows = []
+        for (kind, name), values in self.durations.items():
+            row = {"kind": kind, "name": name, "count": len(values)}
+            if numpy is not None:
+                data = numpy.frombuffer(values, dtype=numpy.float64)
+                computed = numpy.percentile(data, percentiles)
+                row["mean"] = float(data.mean())
+                row["max"] = float(data.max())
+                for q, value in zip(percentiles, computed):
+                    row[f"p{q}"] = float(value)
+            else:
+                ordered = sorted(values)
+                row["mean"] = sum(ordered) / len(ordered)
+                row["max"] = ordered[-1]
+                for q in percentiles:
+                    row[f"p{q}"] = _percentile(ordered, q)
+            rows.append(row)
+        sort_key = f"p{percentiles[-1]}" if percentiles else "max"
+        rows.sort(key=lambda row: row[sort_key], reverse=True)
+        return rows
+
+
+def analyze_file(path, percentiles=(50, 95, 99)):
+    """
+    Streams a trace dump from disk and reports latency percentiles per policy, flow and target.
+
+    Args:
+        path (str): The path of an NDJSON trace dump, such as one written by ``TraceCapture.write_ndjson``.
+        percentiles (tuple): The percentiles to compute.
+
+    Returns:
+        list: The rows produced by :meth:`TraceLatencyAnalyzer.report`.
+    """
+    return TraceLatencyAnalyzer().add_all(iter_transactions(path)).report(percentiles)
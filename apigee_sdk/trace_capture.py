@@ -0,0 +1,194 @@
+import json
+import time
+import uuid
+
+from apigee_sdk.concurrency import run_concurrently
+
+
+class TraceCapture:
+    """
+    Captures debug (trace) transactions from several API proxies and environments at once.
+
+    Debug sessions are started on every target, captured transaction IDs are polled with
+    exponential backoff, and transaction payloads are fetched concurrently and yielded as
+    they arrive. Use the capture as a context manager so sessions are always deleted.
+
+    Example:
+        with TraceCapture(client, "org", [("test", "orders-api", "3")], bearer) as capture:
+            capture.write_ndjson("traces.ndjson", duration=60)
+
+    Attributes:
+        client (ProxyClient): The client used to call the debug session endpoints.
+        org (str): The organization name.
+        targets (list): The ``(environment, api, revision)`` tuples to trace.
+        bearer (str): The bearer token for authorization.
+        session (str): The debug session name used on every target.
+        max_workers (int): The maximum number of concurrent requests.
+        poll_interval (float): The initial number of seconds between polls.
+        max_poll_interval (float): The upper bound of the polling backoff.
+        max_attempts (int): The number of times a failing transaction fetch is tried.
+        errors (list): The failed listing and fetch calls, as dicts with the keys ``environment``,
+            ``api``, ``revision``, ``transaction_id`` (None for a failed listing) and ``error``.
+    """
+
+    def __init__(self, client, org, targets, bearer, session=None, max_workers=8, poll_interval=1,
+                 max_poll_interval=30, max_attempts=3):
+        """
+        Initializes the TraceCapture.
+
+        Args:
+            client (ProxyClient): The client used to call the debug session endpoints.
+            org (str): The organization name.
+            targets (list): The ``(environment, api, revision)`` tuples to trace.
+            bearer (str): The bearer token for authorization.
+            session (str): Optional debug session name. A unique name is generated by default.
+            max_workers (int): The maximum number of concurrent requests.
+            poll_interval (float): The initial number of seconds between polls.
+            max_poll_interval (float): The upper bound of the polling backoff.
+            max_attempts (int): The number of times a failing transaction fetch is tried.
+        """
+        self.client = client
+        self.org = org
+        self.targets = [tuple(target) for target in targets]
+        self.bearer = bearer
+        self.session = session or f"apigee-client-{uuid.uuid4().hex[:12]}"
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_attempts = max_attempts
+        self.started = []
+        self.errors = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Starts the debug session on every target concurrently.
+
+        Raises:
+            Exception: If a session could not be started. Sessions that did start are deleted.
+        """
+        def start_session(target):
+            env, api, revision = target
+            return self.client.start_debug_session(self.org, env, api, revision, self.bearer, session=self.session)
+
+        errors = []
+        for outcome in run_concurrently(start_session, self.targets, self.max_workers):
+            if outcome["error"]:
+                errors.append(f"{outcome['item']}: {outcome['error']}")
+            else:
+                self.started.append(outcome["item"])
+        if errors:
+            self.stop()
+            raise Exception(f"Failed to start debug sessions: {'; '.join(errors)}")
+
+    def stop(self):
+        """
+        Deletes every started debug session. Failures are ignored so all sessions are attempted.
+        """
+        def delete_session(target):
+            env, api, revision = target
+            return self.client.delete_debug_session(self.org, env, api, revision, self.session, self.bearer)
+
+        for _ in run_concurrently(delete_session, self.started, self.max_workers):
+            pass
+        self.started = []
+
+    def transactions(self, duration=None, max_transactions=None):
+        """
+        Polls the started sessions and yields captured transactions as they are fetched.
+
+        A transaction is only marked as seen once its fetch succeeded, so a failed fetch is retried
+        on the next poll, up to ``max_attempts`` times. Every failed listing or fetch is recorded
+        in ``errors``.
+
+        Args:
+            duration (float): Optional number of seconds to capture for.
+            max_transactions (int): Optional number of transactions after which to stop.
+
+        Yields:
+            dict: A captured transaction with the keys ``environment``, ``api``, ``revision``,
+                ``session``, ``transaction_id`` and ``transaction`` (the parsed trace data).
+        """
+        deadline = None if duration is None else time.monotonic() + duration
+        seen = {target: set() for target in self.started}
+        attempts = {}
+        interval = self.poll_interval
+        count = 0
+
+        def list_new(target):
+            env, api, revision = target
+            ids = self.client.list_debug_transactions(self.org, env, api, revision, self.session, self.bearer)
+            return [(target, transaction_id) for transaction_id in ids if transaction_id not in seen[target]]
+
+        def fetch(item):
+            (env, api, revision), transaction_id = item
+            return self.client.get_debug_transaction(self.org, env, api, revision, self.session, transaction_id, self.bearer)
+
+        def record_error(target, transaction_id, error):
+            env, api, revision = target
+            self.errors.append({"environment": env, "api": api, "revision": revision,
+                                "transaction_id": transaction_id, "error": str(error)})
+
+        while self.started:
+            new_items = []
+            for outcome in run_concurrently(list_new, self.started, self.max_workers):
+                if outcome["error"]:
+                    record_error(outcome["item"], None, outcome["error"])
+                elif outcome["result"]:
+                    new_items.extend(outcome["result"])
+            if max_transactions is not None:
+                new_items = new_items[:max_transactions - count]
+
+            for outcome in run_concurrently(fetch, new_items, self.max_workers):
+                target, transaction_id = outcome["item"]
+                if outcome["error"]:
+                    record_error(target, transaction_id, outcome["error"])
+                    attempts[outcome["item"]] = attempts.get(outcome["item"], 0) + 1
+                    if attempts[outcome["item"]] >= self.max_attempts:
+                        seen[target].add(transaction_id)
+                    continue
+                seen[target].add(transaction_id)
+                env, api, revision = target
+                count += 1
+                yield {
+                    "environment": env,
+                    "api": api,
+                    "revision": revision,
+                    "session": self.session,
+                    "transaction_id": transaction_id,
+                    "transaction": outcome["result"],
+                }
+
+            if max_transactions is not None and count >= max_transactions:
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            interval = self.poll_interval if new_items else min(interval * 2, self.max_poll_interval)
+            if deadline is not None:
+                interval = min(interval, max(deadline - time.monotonic(), 0))
+            time.sleep(interval)
+
+    def write_ndjson(self, path, duration=None, max_transactions=None):
+        """
+        Writes captured transactions to a newline-delimited JSON file as they arrive.
+
+        Args:
+            path (str): The path of the output file.
+            duration (float): Optional number of seconds to capture for.
+            max_transactions (int): Optional number of transactions after which to stop.
+
+        Returns:
+            int: The number of transactions written.
+        """
+        count = 0
+        with open(path, "w", encoding="utf-8") as output:
+            for transaction in self.transactions(duration=duration, max_transactions=max_transactions):
+                output.write(json.dumps(transaction) + "\n")
+                count += 1
+        return count
@@ -0,0 +1,210 @@
+import csv
+import os
+from collections import Counter
+
+from apigee_sdk.concurrency import RateLimiter, run_concurrently
+
+
+USER_FIELDS = ("emailId", "firstName", "lastName")
+
+
+def read_users(path):
+    """
+    Reads the desired users and their roles from a CSV or YAML file.
+
+    CSV files need an ``emailId`` column and may have a ``roles`` column with role names
+    separated by ``;``; every other column is part of the user payload. YAML files hold a list
+    of user mappings, or a mapping with a ``users`` list, where ``roles`` is a list or a single
+    role name.
+
+    Args:
+        path (str): The path of the file. Files ending in ``.yaml`` or ``.yml`` are read as YAML.
+
+    Returns:
+        list: One dict per user with the user fields and a ``roles`` list.
+
+    Raises:
+        ImportError: If the file is YAML and PyYAML is not installed.
+        ValueError: If a user has no ``emailId``, an ``emailId`` appears more than once, or
+            ``roles`` is neither a role name nor a list of role names.
+    """
+    path = os.path.expanduser(path)
+    if path.lower().endswith((".yaml", ".yml")):
+        import yaml
+
+        with open(path, encoding="utf-8") as source:
+            document = yaml.safe_load(source) or []
+        rows = document.get("users", []) if isinstance(document, dict) else document
+    else:
+        with open(path, newline="", encoding="utf-8") as source:
+            rows = [
+                {**row, "roles": [role.strip() for role in (row.get("roles") or "").split(";") if role.strip()]}
+                for row in csv.DictReader(source)
+            ]
+    users, emails = [], set()
+    for row in rows:
+        if not row.get("emailId"):
+            raise ValueError(f"User without an emailId: {row!r}")
+        if row["emailId"].lower() in emails:
+            raise ValueError(f"Duplicate emailId: {row['emailId']}")
+        emails.add(row["emailId"].lower())
+        roles = row.get("roles") or []
+        if isinstance(roles, str):
+            roles = [roles]
+        if not isinstance(roles, list) or not all(isinstance(role, str) for role in roles):
+            raise ValueError(f"Invalid roles for {row['emailId']}: {roles!r}")
+        users.append({**{name: value for name, value in row.items() if value not in (None, "")}, "roles": roles})
+    return users
+
+
+def _names(response, key):
+    if isinstance(response, dict):
+        response = response.get(key, [])
+    return [entry.get("name") or entry.get("emailId") if isinstance(entry, dict) else entry for entry in response]
+
+
+class UserProvisioner:
+    """
+    Provisions users and their role memberships from a desired state.
+
+    A plan is computed by diffing the desired users against the current users and the members of
+    every role the desired state mentions. Only the ``compare_fields`` of existing users are
+    compared, so write-only fields such as ``password`` are sent on create but never cause an
+    update on their own. Applying a plan creates and updates users first and then assigns or
+    removes roles, concurrently and under an optional rate limit.
+
+    Attributes:
+        users_client (UsersClient): The client used to manage users.
+        roles_client (UserRolesClient): The client used to manage role memberships.
+        max_workers (int): The maximum number of concurrent requests.
+        rate (float): Optional maximum number of requests started per second.
+        compare_fields (tuple): The user fields compared to decide whether an existing user is updated.
+    """
+
+    def __init__(self, users_client, roles_client, max_workers=8, rate=None, compare_fields=USER_FIELDS):
+        """
+        Initializes the UserProvisioner.
+
+        Args:
+            users_client (UsersClient): The client used to manage users.
+            roles_client (UserRolesClient): The client used to manage role memberships.
+            max_workers (int): The maximum number of concurrent requests.
+            rate (float): Optional maximum number of requests started per second.
+            compare_fields (tuple): The user fields compared to decide whether an existing user is updated.
+        """
+        self.users_client = users_client
+        self.roles_client = roles_client
+        self.max_workers = max_workers
+        self.rate = rate
+        self.compare_fields = tuple(compare_fields)
+
+    def _gather(self, func, items):
+        results = {}
+        for outcome in run_concurrently(func, items, self.max_workers):
+            if outcome["error"]:
+                raise outcome["error"]
+            results[outcome["item"]] = outcome["result"]
+        return results
+
+    def plan(self, users, remove_roles=False):
+        """
+        Computes the changes needed to reach the desired users and role memberships.
+
+        Args:
+            users (list): The desired users, e.g. from ``read_users``.
+            remove_roles (bool): Whether to remove the listed users from mentioned roles they should not have.
+
+        Returns:
+            list: The changes as dicts with the keys ``action`` (``"create_user"``, ``"update_user"``,
+                ``"add_role"`` or ``"remove_role"``), ``user`` and ``payload`` or ``role``.
+
+        Raises:
+            HTTPError: If reading the current state fails.
+            ValueError: If an ``emailId`` appears more than once.
+        """
+        counts = Counter(user["emailId"].lower() for user in users)
+        duplicates = sorted(email for email, count in counts.items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate emailId: {', '.join(duplicates)}")
+        existing = {name.lower() for name in _names(self.users_client.list_users(), "user")}
+        roles = sorted({role for user in users for role in user["roles"]})
+        members = {role: {name.lower() for name in _names(response, "user")}
+                   for role, response in self._gather(self.roles_client.list_role_users, roles).items()}
+        current = self._gather(self.users_client.fetch_user_details,
+                               [user["emailId"] for user in users if user["emailId"].lower() in existing])
+        changes = []
+        for user in users:
+            email = user["emailId"]
+            payload = {name: value for name, value in user.items() if name != "roles"}
+            if email.lower() not in existing:
+                changes.append({"action": "create_user", "user": email, "payload": payload})
+            elif any(str(current[email].get(name)) != str(payload[name]) for name in self.compare_fields
+                     if name != "emailId" and name in payload):
+                changes.append({"action": "update_user", "user": email, "payload": payload})
+            for role in roles:
+                member = email.lower() in members[role]
+                if role in user["roles"] and not member:
+                    changes.append({"action": "add_role", "user": email, "role": role})
+                elif remove_roles and member and role not in user["roles"]:
+                    changes.append({"action": "remove_role", "user": email, "role": role})
+        return changes
+
+    def _apply_change(self, change):
+        if change["action"] == "create_user":
+            return self.users_client.create_user(change["payload"])
+        if change["action"] == "update_user":
+            return self.users_client.update_user(change["user"], change["payload"])
+        if change["action"] == "add_role":
+            return self.roles_client.add_user_to_role(change["role"], change["user"])
+        return self.roles_client.remove_user_from_role(change["role"], change["user"])
+
+    def apply(self, changes):
+        """
+        Applies a plan: user creates and updates first, then role changes.
+
+        Role changes of users whose create or update failed are skipped.
+
+        Args:
+            changes (list): The changes, e.g. from :meth:`plan`.
+
+        Yields:
+            dict: One result per change with the change keys plus ``status`` (``"ok"``, ``"failed"``
+                or ``"skipped"``), ``error`` and ``elapsed``.
+        """
+        rate_limiter = RateLimiter(self.rate) if self.rate else None
+        user_changes = [change for change in changes if change["action"] in ("create_user", "update_user")]
+        role_changes = [change for change in changes if change["action"] not in ("create_user", "update_user")]
+        failed_users = set()
+        for batch in (user_changes, role_changes):
+            pending = []
+            for change in batch:
+                if change["user"] in failed_users:
+                    yield {**change, "status": "skipped", "error": None, "elapsed": 0.0}
+                else:
+                    pending.append(change)
+            for outcome in run_concurrently(self._apply_change, pending, self.max_workers, rate_limiter=rate_limiter):
+                if outcome["error"]:
+                    failed_users.add(outcome["item"]["user"])
+                yield {
+                    **outcome["item"],
+                    "status": "failed" if outcome["error"] else "ok",
+                    "error": str(outcome["error"]) if outcome["error"] else None,
+                    "elapsed": outcome["elapsed"],
+                }
+
+    def provision(self, path, dry_run=False, remove_roles=False):
+        """
+        Reads the desired users from a file, plans the changes and applies them unless it is a dry run.
+
+        Args:
+            path (str): The path of a CSV or YAML file, see ``read_users``.
+            dry_run (bool): Whether to only return the plan.
+            remove_roles (bool): Whether to remove the listed users from mentioned roles they should not have.
+
+        Returns:
+            list: The planned changes for a dry run, otherwise the results of :meth:`apply`.
+        """
+        changes = self.plan(read_users(path), remove_roles=remove_roles)
+        if dry_run:
+            return changes
+        return list(self.apply(changes))
@@ -1,3 +1,5 @@
+from urllib.parse import quote, urlencode
+
 import requests
 
 class UserRolesClient:
@@ -103,4 +105,57 @@ class UserRolesClient:
         """
         response = requests.put(f"{self.base_url}/user-roles/{role_id}", headers={"Content-Type": "application/json", **self.headers}, json=payload)
         response.raise_for_status()
-        return response.json()
\ No newline at end of file
+        return response.json()
+
+    def list_role_users(self, role_id):
+        """
+        Lists the users assigned to a user role.
+
+        Args:
+            role_id (str): The ID of the user role.
+
+        Returns:
+            list: The response from the API containing the user IDs (email addresses) in the role.
+
+        Raises:
+            HTTPError: If the API request fails.
+        """
+        response = requests.get(f"{self.base_url}/user-roles/{role_id}/users", headers=self.headers)
+        response.raise_for_status()
+        return response.json()
+
+    def add_user_to_role(self, role_id, user_id):
+        """
+        Assigns a user to a user role.
+
+        Args:
+            role_id (str): The ID of the user role.
+            user_id (str): The ID (email address) of the user.
+
+        Returns:
+            dict: The response from the API confirming the assignment, or an empty dict if it has no body.
+
+        Raises:
+            HTTPError: If the API request fails.
+        """
+        response = requests.post(f"{self.base_url}/user-roles/{role_id}/users?{urlencode({'id': user_id})}", headers=self.headers)
+        response.raise_for_status()
+        return response.json() if response.content else {}
+
+    def remove_user_from_role(self, role_id, user_id):
+        """
+        Removes a user from a user role.
+
+        Args:
+            role_id (str): The ID of the user role.
+            user_id (str): The ID (email address) of the user.
+
+        Returns:
+            dict: The response from the API confirming the removal, or an empty dict if it has no body.
+
+        Raises:
+            HTTPError: If the API request fails.
+        """
+        response = requests.delete(f"{self.base_url}/user-roles/{role_id}/users/{quote(user_id, safe='@')}", headers=self.headers)
+        response.raise_for_status()
+        return response.json() if response.content else {}
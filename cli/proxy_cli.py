@@ -67,6 +67,26 @@ def create_api_proxy(base_url, token, org, payload):
         click.echo(f"Error creating API Proxy: {e}", err=True)
         raise SystemExit(1)
 
+@proxy.command("rollback")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--org', required=True, help='Apigee organization name.')
+@click.option('--env', required=True, help='Environment to roll back.')
+@click.option('--api', 'apis', required=True, multiple=True, help='API Proxy name to roll back (repeatable).')
+@click.option('--journal', default='~/.apigee-client/deployments.jsonl', show_default=True, help='Path of the deployment journal.')
+@click.option('--max-workers', default=8, show_default=True, help='Maximum number of concurrent rollbacks.')
+def rollback(base_url, token, org, env, apis, journal, max_workers):
+    """Roll API Proxies back to their previously deployed revision."""
+    from apigee_sdk.deployment_journal import DeploymentJournal
+
+    client = ProxyClient(base_url, token, journal=DeploymentJournal(journal))
+    failed = False
+    for result in client.rollback_many(org, env, apis, token, max_workers=max_workers):
+        click.echo(result)
+        failed = failed or result["error"] is not None
+    if failed:
+        raise SystemExit(1)
+
 @cli.group()
 def app():
     """Subcommand to interact with developer apps."""
@@ -120,6 +140,157 @@ def create_app(base_url, token, payload):
         click.echo(f"Error creating app: {e}", err=True)
         raise SystemExit(1)
 
+@app.command("bulk-key-action")
+@click.argument('action', type=click.Choice(['approve', 'revoke', 'rotate']))
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--key', 'key_specs', multiple=True, help='Key to act on, as APP_ID:CONSUMER_KEY. Can be repeated.')
+@click.option('--developer', help='Only keys of apps owned by this developer ID.')
+@click.option('--product', help='Only keys associated with this API product.')
+@click.option('--attribute', help='Only keys of apps with this attribute, as NAME=VALUE.')
+@click.option('--status', help='Only keys with this status, e.g. approved.')
+@click.option('--all', 'all_keys', is_flag=True, help='Act on every key in the organization (requires --yes).')
+@click.option('--yes', is_flag=True, help='Confirm acting on every key in the organization.')
+@click.option('--dry-run', is_flag=True, help='Only print the selected keys.')
+@click.option('--payload', help='Payload in JSON format for new keys when rotating.')
+@click.option('--max-workers', default=16, show_default=True, help='Maximum number of concurrent key operations.')
+@click.option('--rate', type=float, help='Maximum number of key operations per second.')
+def bulk_key_action(action, base_url, token, key_specs, developer, product, attribute, status, all_keys, yes, dry_run,
+                    payload, max_workers, rate):
+    """Approve, revoke or rotate the given API keys or every API key matching a selector."""
+    import json
+
+    selectors = (developer, product, attribute, status)
+    if key_specs and (all_keys or any(selectors)):
+        raise click.UsageError("--key cannot be combined with --all or selector options.")
+    if not key_specs and not any(selectors) and not (all_keys and yes):
+        raise click.UsageError("Give --key or a selector option, or --all together with --yes to act on every key.")
+    if any(":" not in spec for spec in key_specs):
+        raise click.UsageError("--key must be given as APP_ID:CONSUMER_KEY.")
+
+    client = DeveloperAppClient(base_url, token)
+    try:
+        if key_specs:
+            keys = [tuple(spec.split(':', 1)) for spec in dict.fromkeys(key_specs)]
+        else:
+            selected_attribute = tuple(attribute.split('=', 1)) if attribute else None
+            keys = client.select_api_keys(developer=developer, product=product, attribute=selected_attribute, status=status)
+        click.echo(f"{len(keys)} keys selected.")
+        if dry_run:
+            for app_id, api_key_id in keys:
+                click.echo(f"{app_id}:{api_key_id}")
+            return
+        failed = 0
+        for result in client.bulk_api_key_action(action, keys, payload=json.loads(payload) if payload else None,
+                                                 max_workers=max_workers, rate=rate):
+            click.echo(result)
+            failed += result["status"] == "failed"
+        click.echo(f"{len(keys) - failed} of {len(keys)} keys processed successfully.")
+    except Exception as e:
+        click.echo(f"Error executing bulk key action '{action}': {e}", err=True)
+        raise SystemExit(1)
+    if failed:
+        raise SystemExit(1)
+
+@app.command("rotate-keys")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--checkpoint', required=True, help='Checkpoint file used to resume an interrupted rotation.')
+@click.option('--export', 'export_path', help='NDJSON file the new keys and secrets are appended to.')
+@click.option('--app-id', 'app_ids', multiple=True, help='App to rotate. Can be repeated.')
+@click.option('--developer', help='Rotate the apps owned by this developer ID.')
+@click.option('--product', help='Rotate the apps with keys for this API product.')
+@click.option('--all', 'all_apps', is_flag=True, help='Rotate every app in the organization.')
+@click.option('--overlap', default=86400, show_default=True, help='Seconds old and new keys are both valid.')
+@click.option('--wait', is_flag=True, help='Wait for the overlap window and revoke the old keys before exiting.')
+@click.option('--batch-size', default=500, show_default=True, help='Number of apps whose old keys are revoked per batch.')
+@click.option('--payload', help='Payload in JSON format for the new keys.')
+@click.option('--max-workers', default=16, show_default=True, help='Maximum number of concurrent app operations.')
+@click.option('--rate', type=float, help='Maximum number of app operations per second.')
+def rotate_keys(base_url, token, checkpoint, export_path, app_ids, developer, product, all_apps, overlap, wait,
+                batch_size, payload, max_workers, rate):
+    """Add new API keys to many apps, resuming from the checkpoint.
+
+    Old keys that are past their overlap window are revoked. Without --wait, the others are
+    left for a later run of revoke-old-keys with the same checkpoint.
+    """
+    import json
+    from apigee_sdk.key_rotation import KeyRotation
+
+    if not (app_ids or developer or product or all_apps):
+        raise click.UsageError("Give --app-id, --developer or --product, or --all to rotate every app.")
+    client = DeveloperAppClient(base_url, token)
+    try:
+        if not app_ids:
+            keys = client.select_api_keys(developer=developer, product=product, status="approved")
+            app_ids = list(dict.fromkeys(app_id for app_id, _ in keys))
+        rotation = KeyRotation(client, checkpoint, overlap=overlap, batch_size=batch_size, max_workers=max_workers,
+                               rate=rate, payload=json.loads(payload) if payload else None)
+        summary = rotation.run(app_ids, export_path=export_path, wait=wait)
+        click.echo(summary)
+    except Exception as e:
+        click.echo(f"Error rotating keys: {e}", err=True)
+        raise SystemExit(1)
+    if summary["failed"]:
+        raise SystemExit(1)
+
+@app.command("revoke-old-keys")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--checkpoint', required=True, help='Checkpoint file of the rotation.')
+@click.option('--batch-size', default=500, show_default=True, help='Number of apps whose old keys are revoked per batch.')
+@click.option('--max-workers', default=16, show_default=True, help='Maximum number of concurrent app operations.')
+@click.option('--rate', type=float, help='Maximum number of app operations per second.')
+def revoke_old_keys(base_url, token, checkpoint, batch_size, max_workers, rate):
+    """Revoke the old keys of a rotation whose overlap window has passed."""
+    import os
+    from apigee_sdk.key_rotation import KeyRotation
+
+    if not os.path.exists(os.path.expanduser(checkpoint)):
+        raise click.UsageError(f"Checkpoint {checkpoint} does not exist.")
+    rotation = KeyRotation(DeveloperAppClient(base_url, token), checkpoint, batch_size=batch_size,
+                           max_workers=max_workers, rate=rate)
+    failed = 0
+    try:
+        for outcome in rotation.revoke_old_keys():
+            click.echo(outcome)
+            failed += outcome["status"] == "failed"
+        click.echo({"pending": len(rotation.pending_revocations()), "next_revocation": rotation.next_revocation()})
+    except Exception as e:
+        click.echo(f"Error revoking old keys: {e}", err=True)
+        raise SystemExit(1)
+    if failed:
+        raise SystemExit(1)
+
+@app.command("lookup-key")
+@click.argument('consumer_key')
+@click.option('--index', default='~/.apigee-client/keys.db', show_default=True, help='Path of the local consumer-key index.')
+@click.option('--refresh', is_flag=True, help='Bring the index up to date before the lookup.')
+@click.option('--base-url', help='Base URL of the Apigee Management API (required with --refresh).')
+@click.option('--token', help='Authentication token for the API (required with --refresh).')
+def lookup_key(consumer_key, index, refresh, base_url, token):
+    """Find the app and developer that own a consumer key."""
+    from apigee_sdk.key_index import ConsumerKeyIndex
+
+    key_index = ConsumerKeyIndex(index)
+    try:
+        if refresh:
+            if not base_url or not token:
+                raise click.UsageError("--base-url and --token are required with --refresh.")
+            click.echo(key_index.refresh(DeveloperAppClient(base_url, token)), err=True)
+        owner = key_index.lookup(consumer_key)
+    except click.UsageError:
+        raise
+    except Exception as e:
+        click.echo(f"Error looking up consumer key: {e}", err=True)
+        raise SystemExit(1)
+    finally:
+        key_index.close()
+    if owner is None:
+        click.echo(f"Consumer key '{consumer_key}' not found in the index.", err=True)
+        raise SystemExit(1)
+    click.echo(owner)
+
 @cli.group()
 def kvm():
     """Subcommand to interact with Key-Value Maps (KVMs)."""
@@ -207,6 +378,85 @@ def update_kvm(base_url, token, kvm_id, payload):
         click.echo(f"Error updating KVM: {e}", err=True)
         raise SystemExit(1)
 
+@kvm.command("sync-kvm")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--kvm-id', required=True, help='KVM ID to synchronise.')
+@click.option('--source', required=True, help='CSV, JSON or NDJSON file with the desired entries.')
+@click.option('--format', 'source_format', type=click.Choice(['csv', 'json', 'ndjson']), help='Source format. Defaults to the file extension.')
+@click.option('--no-delete', is_flag=True, help='Keep entries that are not in the source.')
+@click.option('--dry-run', is_flag=True, help='Only report the changes.')
+@click.option('--max-workers', default=8, show_default=True, help='Maximum number of concurrent writes.')
+def sync_kvm(base_url, token, kvm_id, source, source_format, no_delete, dry_run, max_workers):
+    """Apply only the changed entries of a source file to a Key-Value Map (KVM)."""
+    from apigee_sdk.kvm_client import KVMClient
+
+    client = KVMClient(base_url, token)
+    try:
+        summary = client.sync_kvm(kvm_id, source, format=source_format, delete=not no_delete, dry_run=dry_run,
+                                  max_workers=max_workers)
+        click.echo(summary)
+    except Exception as e:
+        click.echo(f"Error synchronising KVM: {e}", err=True)
+        raise SystemExit(1)
+    if summary["failed"]:
+        raise SystemExit(1)
+
+@kvm.command("snapshot-kvm")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--kvm-id', required=True, help='KVM ID to snapshot.')
+@click.option('--output', required=True, help='Path of the snapshot file to write or replace.')
+def snapshot_kvm(base_url, token, kvm_id, output):
+    """Write a memory-mappable snapshot of a Key-Value Map (KVM)."""
+    from apigee_sdk.kvm_client import KVMClient
+    from apigee_sdk.kvm_snapshot import snapshot_kvm as write_kvm_snapshot
+
+    try:
+        written = write_kvm_snapshot(KVMClient(base_url, token), kvm_id, output)
+        click.echo({"entries": written, "path": output})
+    except Exception as e:
+        click.echo(f"Error writing KVM snapshot: {e}", err=True)
+        raise SystemExit(1)
+
+@kvm.command("export-kvm")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--kvm-id', required=True, help='KVM ID to export.')
+@click.option('--output', required=True, help='NDJSON file to write; a .gz suffix compresses it.')
+def export_kvm(base_url, token, kvm_id, output):
+    """Stream the entries of a Key-Value Map (KVM) to an NDJSON file."""
+    from apigee_sdk.kvm_client import KVMClient
+
+    client = KVMClient(base_url, token)
+    try:
+        click.echo({"exported": client.export_kvm(kvm_id, output), "path": output})
+    except Exception as e:
+        click.echo(f"Error exporting KVM: {e}", err=True)
+        raise SystemExit(1)
+
+@kvm.command("import-kvm")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--kvm-id', required=True, help='KVM ID to import into.')
+@click.option('--source', required=True, help='CSV, JSON or NDJSON file, optionally .gz-compressed.')
+@click.option('--overwrite', is_flag=True, help='Update entries that already exist.')
+@click.option('--max-workers', default=8, show_default=True, help='Maximum number of batches written concurrently.')
+@click.option('--batch-size', default=100, show_default=True, help='Number of entries per batch.')
+def import_kvm(base_url, token, kvm_id, source, overwrite, max_workers, batch_size):
+    """Create the entries of a file in a Key-Value Map (KVM)."""
+    from apigee_sdk.kvm_client import KVMClient
+
+    client = KVMClient(base_url, token)
+    try:
+        summary = client.import_kvm(kvm_id, source, overwrite=overwrite, max_workers=max_workers, batch_size=batch_size)
+        click.echo(summary)
+    except Exception as e:
+        click.echo(f"Error importing KVM: {e}", err=True)
+        raise SystemExit(1)
+    if summary["failures"]:
+        raise SystemExit(1)
+
 @cli.group()
 def developers():
     """Subcommand to interact with Developers."""
@@ -294,6 +544,23 @@ def update_developer(base_url, token, developer_id, payload):
         click.echo(f"Error updating Developer: {e}", err=True)
         raise SystemExit(1)
 
+@developers.command("sync-developers")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--state', default='~/.apigee-client/developers.json', show_default=True, help='Path of the sync state file.')
+def sync_developers(base_url, token, state):
+    """Print the developers created, updated or deleted since the last sync, one JSON event per line."""
+    import json
+    from apigee_sdk.developers_client import DevelopersClient
+    from apigee_sdk.developer_sync import DeveloperSync
+
+    try:
+        for event in DeveloperSync(DevelopersClient(base_url, token), state).sync():
+            click.echo(json.dumps(event))
+    except Exception as e:
+        click.echo(f"Error syncing Developers: {e}", err=True)
+        raise SystemExit(1)
+
 @cli.group()
 def users():
     """Subcommand to interact with Users."""
@@ -381,6 +648,41 @@ def update_user(base_url, token, user_id, payload):
         click.echo(f"Error updating User: {e}", err=True)
         raise SystemExit(1)
 
+@users.command("provision")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--source', required=True, help='CSV or YAML file with the users and their roles.')
+@click.option('--dry-run', is_flag=True, help='Print the planned changes without applying them.')
+@click.option('--remove-roles', is_flag=True, help='Also remove the users from listed roles they should not have.')
+@click.option('--max-workers', default=8, show_default=True, help='Maximum number of concurrent requests.')
+@click.option('--rate', type=float, help='Maximum number of requests per second.')
+def provision_users(base_url, token, source, dry_run, remove_roles, max_workers, rate):
+    """Create and update Users and assign their roles from a file, applying only what changed."""
+    import json
+    from apigee_sdk.user_provisioning import UserProvisioner, read_users
+    from apigee_sdk.user_roles_client import UserRolesClient
+    from apigee_sdk.users_client import UsersClient
+
+    provisioner = UserProvisioner(UsersClient(base_url, token), UserRolesClient(base_url, token),
+                                  max_workers=max_workers, rate=rate)
+    failed = 0
+    try:
+        changes = provisioner.plan(read_users(source), remove_roles=remove_roles)
+        if dry_run:
+            for change in changes:
+                click.echo(json.dumps(change))
+            click.echo(f"{len(changes)} changes planned.")
+            return
+        for result in provisioner.apply(changes):
+            click.echo(json.dumps(result))
+            failed += result["status"] != "ok"
+        click.echo(f"{len(changes) - failed} of {len(changes)} changes applied successfully.")
+    except Exception as e:
+        click.echo(f"Error provisioning Users: {e}", err=True)
+        raise SystemExit(1)
+    if failed:
+        raise SystemExit(1)
+
 @cli.group()
 def user_roles():
     """Subcommand to interact with User Roles."""
@@ -642,6 +944,141 @@ def update_cache(base_url, token, cache_id, payload):
         click.echo(f"Error updating Cache: {e}", err=True)
         raise SystemExit(1)
 
+@caches.command("clear-entries")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--org', required=True, help='Apigee organization name.')
+@click.option('--env', 'envs', required=True, multiple=True, help='Environment to clear the cache in (repeatable).')
+@click.option('--cache', 'cache_id', required=True, help='Name of the cache to clear.')
+@click.option('--prefix', help='Only clear entries whose keys start with this prefix.')
+@click.option('--max-workers', default=8, show_default=True, help='Maximum number of environments cleared concurrently.')
+def clear_entries(base_url, token, org, envs, cache_id, prefix, max_workers):
+    """Clear the entries of a cache in every given environment."""
+    from apigee_sdk.scopes import ScopedClients
+
+    failed = 0
+    with ScopedClients(base_url, token) as clients:
+        for result in clients.clear_cache_entries(org, envs, cache_id, prefix=prefix, max_workers=max_workers):
+            click.echo(result)
+            failed += result["status"] == "failed"
+    if failed:
+        click.echo(f"Failed to clear cache '{cache_id}' in {failed} of {len(envs)} environments.", err=True)
+        raise SystemExit(1)
+
+@cli.group()
+def analytics():
+    """Subcommand to query and store API analytics."""
+    pass
+
+@analytics.command("sync")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--org', required=True, help='Apigee organization name.')
+@click.option('--env', required=True, help='Environment to sync.')
+@click.option('--dimension', default='apis', show_default=True, help='Stats dimension to sync.')
+@click.option('--select', required=True, help='Metrics to sync, e.g. "sum(message_count)".')
+@click.option('--time-unit', default='hour', show_default=True, help='Aggregation interval.')
+@click.option('--since-days', default=7, show_default=True, help='Days to fetch when the store is empty.')
+@click.option('--store', default='~/.apigee-client/analytics.db', show_default=True, help='Path of the local store.')
+def analytics_sync(base_url, token, org, env, dimension, select, time_unit, since_days, store):
+    """Fetch stats newer than the local high-water mark into the local store."""
+    from datetime import datetime, timedelta, timezone
+    from apigee_sdk.analytics import AnalyticsClient
+    from apigee_sdk.analytics_store import AnalyticsStore
+
+    local_store = AnalyticsStore(store)
+    try:
+        since = datetime.now(timezone.utc) - timedelta(days=since_days)
+        written = local_store.sync(AnalyticsClient(base_url, token), org, env, dimension, select, since, time_unit=time_unit)
+        click.echo({"written": written, "high_water_mark": str(local_store.high_water_mark(env, dimension, select))})
+    except Exception as e:
+        click.echo(f"Error syncing analytics: {e}", err=True)
+        raise SystemExit(1)
+    finally:
+        local_store.close()
+
+@analytics.command("query")
+@click.option('--env', required=True, help='Environment to query.')
+@click.option('--dimension', default='apis', show_default=True, help='Stats dimension to query.')
+@click.option('--metric', required=True, help='Metric to query, e.g. "sum(message_count)".')
+@click.option('--start', required=True, type=click.DateTime(), help='Start of the range (UTC).')
+@click.option('--end', required=True, type=click.DateTime(), help='End of the range (UTC).')
+@click.option('--dimension-value', help='Only return points for this dimension value.')
+@click.option('--store', default='~/.apigee-client/analytics.db', show_default=True, help='Path of the local store.')
+def analytics_query(env, dimension, metric, start, end, dimension_value, store):
+    """Read stats for a time range from the local store."""
+    from apigee_sdk.analytics_store import AnalyticsStore
+
+    local_store = AnalyticsStore(store)
+    try:
+        for row in local_store.query(env, dimension, metric, start, end, dimension_value=dimension_value):
+            click.echo(row)
+    finally:
+        local_store.close()
+
+@cli.command()
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--org', required=True, help='Apigee organization name.')
+@click.option('--env', 'envs', required=True, multiple=True, help='Environment to export (repeatable).')
+@click.option('--dimension', 'dimensions', default=('apis',), multiple=True, show_default=True, help='Stats dimension to export (repeatable).')
+@click.option('--select', default='sum(message_count)', show_default=True, help='Metrics to export.')
+@click.option('--interval', default=60, show_default=True, help='Seconds between refreshes.')
+@click.option('--lookback-minutes', default=5, show_default=True, help='Time range covered by each refresh.')
+@click.option('--host', default='0.0.0.0', show_default=True, help='Interface to listen on.')
+@click.option('--port', default=9464, show_default=True, help='Port to serve /metrics on.')
+def exporter(base_url, token, org, envs, dimensions, select, interval, lookback_minutes, host, port):
+    """Serve Apigee analytics as Prometheus metrics on /metrics."""
+    from datetime import timedelta
+    from apigee_sdk.analytics import AnalyticsClient
+    from apigee_sdk.metrics_exporter import MetricsExporter
+
+    metrics_exporter = MetricsExporter(AnalyticsClient(base_url, token), org, envs, dimensions=dimensions, select=select,
+                                       lookback=timedelta(minutes=lookback_minutes), interval=interval)
+    metrics_exporter.start()
+    server = metrics_exporter.make_server(host, port)
+    click.echo(f"Serving metrics on http://{host}:{port}/metrics")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        metrics_exporter.stop()
+
+@cli.command("key-verifier")
+@click.option('--base-url', required=True, help='Base URL of the Apigee Management API.')
+@click.option('--token', required=True, help='Authentication token for the API.')
+@click.option('--interval', default=300, show_default=True, help='Seconds between refreshes of the key snapshot.')
+@click.option('--host', default='127.0.0.1', show_default=True, help='Interface to listen on.')
+@click.option('--port', default=8089, show_default=True, help='Port to serve /verify on.')
+@click.option('--unix-socket', help='Unix socket path to listen on instead of host and port.')
+def key_verifier(base_url, token, interval, host, port, unix_socket):
+    """Serve local API-key verification on /verify."""
+    from apigee_sdk.developers_client import DevelopersClient
+    from apigee_sdk.key_verifier import KeyVerifier
+
+    verifier = KeyVerifier(DeveloperAppClient(base_url, token), DevelopersClient(base_url, token), interval=interval)
+    try:
+        verifier.start()
+    except Exception as e:
+        click.echo(f"Error loading API keys: {e}", err=True)
+        raise SystemExit(1)
+    try:
+        server = verifier.make_server(host, port, unix_socket=unix_socket)
+    except OSError as e:
+        verifier.stop()
+        click.echo(f"Error starting the key verifier: {e}", err=True)
+        raise SystemExit(1)
+    click.echo(f"Serving key verification on {unix_socket or f'http://{host}:{port}/verify'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        verifier.stop()
+
 # Ensure the user_roles command group is registered with the main CLI group
 cli.add_command(user_roles)
 
@@ -0,0 +1,146 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from apigee_sdk.analytics import AnalyticsClient, format_time_range, merge_stats, split_time_range
+
+def stats_response(timestamp, value):
+    return {
+        "environments": [{"name": "prod", "dimensions": [{"name": "orders-api", "metrics": [
+            {"name": "sum(message_count)", "values": [{"timestamp": timestamp, "value": str(value)}]}
+        ]}]}],
+        "metaData": {"errors": []},
+    }
+
+def test_format_time_range():
+    assert format_time_range(datetime(2026, 10, 1), datetime(2026, 10, 2, 6, 30)) == "10/01/2026 00:00~10/02/2026 06:30"
+
+def test_split_time_range_aligns_windows():
+    windows = split_time_range(datetime(2026, 10, 1, 12), datetime(2026, 10, 3, 6), timedelta(days=1))
+
+    assert [(start.isoformat(), end.isoformat()) for start, end in windows] == [
+        ("2026-10-01T12:00:00+00:00", "2026-10-02T00:00:00+00:00"),
+        ("2026-10-02T00:00:00+00:00", "2026-10-03T00:00:00+00:00"),
+        ("2026-10-03T00:00:00+00:00", "2026-10-03T06:00:00+00:00"),
+    ]
+
+def test_merge_stats_orders_values():
+    merged = merge_stats([stats_response(2000, 2), stats_response(1000, 1)])
+
+    values = merged["environments"][0]["dimensions"][0]["metrics"][0]["values"]
+    assert [value["timestamp"] for value in values] == [1000, 2000]
+
+def test_query_stats_fetches_windows_and_caches_closed_ones(mocker, tmp_path):
+    def fake_get(url, headers, params):
+        day = int(params["timeRange"][3:5])
+        response = mocker.Mock()
+        response.status_code = 200
+        response.json.return_value = stats_response(day, day)
+        return response
+
+    mock_get = mocker.patch("requests.get", side_effect=fake_get)
+    client = AnalyticsClient("https://api.enterprise.apigee.com", "test_token", cache_dir=str(tmp_path))
+    start = datetime(2026, 9, 1, tzinfo=timezone.utc)
+    end = start + timedelta(days=3)
+
+    first = client.query_stats("test_org", "prod", "apis", "sum(message_count)", start, end)
+    second = client.query_stats("test_org", "prod", "apis", "sum(message_count)", start, end)
+
+    values = first["environments"][0]["dimensions"][0]["metrics"][0]["values"]
+    assert [value["value"] for value in values] == ["1", "2", "3"]
+    assert first == second
+    assert mock_get.call_count == 3
+    assert mock_get.call_args.kwargs["params"]["timeUnit"] == "hour"
+    assert mock_get.call_args[0][0] == "https://api.enterprise.apigee.com/v1/organizations/test_org/environments/prod/stats/apis"
+
+def test_query_stats_does_not_cache_open_window(mocker, tmp_path):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = stats_response(1, 1)
+    mock_get = mocker.patch("requests.get", return_value=mock_response)
+    client = AnalyticsClient("https://api.enterprise.apigee.com", "test_token", cache_dir=str(tmp_path))
+    now = datetime.now(timezone.utc)
+
+    for _ in range(2):
+        client.query_stats("test_org", "prod", "apis", "sum(message_count)", now - timedelta(minutes=5),
+                           now + timedelta(hours=1), window=timedelta(days=3650))
+
+    assert mock_get.call_count == 2
+    assert list(tmp_path.iterdir()) == []
+
+def test_query_stats_does_not_cache_unsettled_window(mocker, tmp_path):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = stats_response(1, 1)
+    mock_get = mocker.patch("requests.get", return_value=mock_response)
+    now = datetime.now(timezone.utc)
+    just_closed = (now - timedelta(hours=3), now - timedelta(minutes=10))
+
+    client = AnalyticsClient("https://api.enterprise.apigee.com", "test_token", cache_dir=str(tmp_path))
+    for _ in range(2):
+        client.query_stats("test_org", "prod", "apis", "sum(message_count)", *just_closed, window=timedelta(days=3650))
+    assert mock_get.call_count == 2
+    assert list(tmp_path.iterdir()) == []
+
+    settled = AnalyticsClient("https://api.enterprise.apigee.com", "test_token", cache_dir=str(tmp_path),
+                              settle_delay=timedelta(minutes=5))
+    for _ in range(2):
+        settled.query_stats("test_org", "prod", "apis", "sum(message_count)", *just_closed, window=timedelta(days=3650))
+    assert mock_get.call_count == 3
+
+def test_merge_stats_combines_totals_without_time_unit():
+    def totals(count, average):
+        return {"environments": [{"name": "prod", "dimensions": [{"name": "orders-api", "metrics": [
+            {"name": "sum(message_count)", "values": [str(count)]},
+            {"name": "max(total_response_time)", "values": [str(average * 2)]},
+            {"name": "avg(total_response_time)", "values": [str(average)]},
+        ]}]}]}
+
+    merged = merge_stats([totals(10, 100), totals(5, 300)])
+
+    metrics = {metric["name"]: metric["values"] for metric in merged["environments"][0]["dimensions"][0]["metrics"]}
+    assert metrics == {"sum(message_count)": ["15.0"], "max(total_response_time)": ["600.0"],
+                       "avg(total_response_time)": ["100", "300"]}
+
+def test_wait_for_query_backs_off(mocker):
+    states = iter([{"state": "enqueued"}, {"state": "running"}, {"state": "completed"}])
+    client = AnalyticsClient("https://api.enterprise.apigee.com", "test_token")
+    mocker.patch.object(client, "get_query", side_effect=lambda org, env, query_id: next(states))
+    mock_sleep = mocker.patch("apigee_sdk.analytics.time.sleep")
+
+    query = client.wait_for_query("test_org", "prod", "q-1", poll_interval=1)
+
+    assert query["state"] == "completed"
+    assert [round(call.args[0]) for call in mock_sleep.call_args_list] == [1, 2]
+
+def test_wait_for_query_failure(mocker):
+    client = AnalyticsClient("https://api.enterprise.apigee.com", "test_token")
+    mocker.patch.object(client, "get_query", return_value={"state": "failed", "error": "too many dimensions"})
+
+    with pytest.raises(Exception, match="too many dimensions"):
+        client.wait_for_query("test_org", "prod", "q-1")
+
+def test_run_query_streams_gzipped_rows(mocker):
+    rows = [{"apiproxy": f"api-{index}", "sum(message_count)": index} for index in range(500)]
+    body = b"".join(json.dumps(row).encode("utf-8") + b"\n" for row in rows)
+    compressed = gzip.compress(body[:9000]) + gzip.compress(body[9000:])
+    chunks = [compressed[offset:offset + 100] for offset in range(0, len(compressed), 100)]
+
+    submitted = mocker.Mock(status_code=200)
+    submitted.json.return_value = {"self": "/organizations/test_org/environments/prod/queries/q-1", "state": "enqueued"}
+    completed = mocker.Mock(status_code=200)
+    completed.json.return_value = {"state": "completed"}
+    result = mocker.Mock(status_code=200)
+    result.iter_content.return_value = iter(chunks)
+    mocker.patch("requests.post", return_value=submitted)
+    mock_get = mocker.patch("requests.get", side_effect=[completed, result])
+
+    client = AnalyticsClient("https://api.enterprise.apigee.com", "test_token")
+    streamed = list(client.run_query("test_org", "prod", {"metrics": [{"name": "message_count", "function": "sum"}]}))
+
+    assert streamed == rows
+    assert mock_get.call_args_list[1][0][0].endswith("/queries/q-1/result")
+    assert mock_get.call_args_list[1].kwargs["stream"] is True
+    result.close.assert_called_once()
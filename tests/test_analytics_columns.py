@@ -0,0 +1,54 @@
+import math
+
+import pytest
+
+from apigee_sdk import analytics_columns
+from apigee_sdk.analytics_columns import StatsColumns
+
+HOUR = 3600000
+RESPONSE = {
+    "environments": [{"name": "prod", "dimensions": [
+        {"name": "orders-api", "metrics": [
+            {"name": "sum(message_count)", "values": [{"timestamp": 0, "value": "10.0"}, {"timestamp": HOUR, "value": "30.0"}]},
+            {"name": "avg(total_response_time)", "values": [{"timestamp": HOUR, "value": "120.5"}]},
+        ]},
+        {"name": "payments-api", "metrics": [
+            {"name": "sum(message_count)", "values": [{"timestamp": 0, "value": "5.0"}, {"timestamp": 25 * HOUR, "value": "7.0"}]},
+        ]},
+    ]}],
+}
+
+@pytest.fixture(params=["numpy", "fallback"])
+def columns(request, monkeypatch):
+    if request.param == "fallback":
+        monkeypatch.setattr(analytics_columns, "numpy", None)
+    elif analytics_columns.numpy is None:
+        pytest.skip("NumPy is not installed")
+    return StatsColumns.from_response(RESPONSE)
+
+def test_from_response_aligns_metrics(columns):
+    assert len(columns) == 4
+    assert columns.dimensions == ["orders-api", "payments-api"]
+    assert list(columns.dimension_codes) == [0, 0, 1, 1]
+    assert list(columns.metrics["sum(message_count)"]) == [10.0, 30.0, 5.0, 7.0]
+    response_times = list(columns.metrics["avg(total_response_time)"])
+    assert math.isnan(response_times[0])
+    assert response_times[1] == 120.5
+
+def test_percentile(columns):
+    assert columns.percentile("sum(message_count)", 50) == 8.5
+    assert columns.percentile("avg(total_response_time)", 99) == 120.5
+
+def test_rollup_by_day(columns):
+    assert columns.rollup("sum(message_count)", 24 * HOUR) == [(0, 45.0), (24 * HOUR, 7.0)]
+
+def test_top_n(columns):
+    assert columns.top_n("sum(message_count)", n=1) == [("orders-api", 40.0)]
+
+def test_to_dataframe():
+    pytest.importorskip("pandas")
+
+    frame = StatsColumns.from_response(RESPONSE).to_dataframe()
+
+    assert list(frame["dimension"]) == ["orders-api", "orders-api", "payments-api", "payments-api"]
+    assert frame["sum(message_count)"].sum() == 52.0
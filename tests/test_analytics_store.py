@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+
+from apigee_sdk.analytics_store import AnalyticsStore
+
+HOUR = 3600000
+START = datetime(2026, 10, 1, tzinfo=timezone.utc)
+START_MS = int(START.timestamp() * 1000)
+
+def stats_response(*points):
+    return {"environments": [{"name": "prod", "dimensions": [{"name": "orders-api", "metrics": [
+        {"name": "sum(message_count)", "values": [{"timestamp": ts, "value": str(value)} for ts, value in points]}
+    ]}]}]}
+
+def test_write_and_query(tmp_path):
+    store = AnalyticsStore(str(tmp_path / "analytics.db"))
+
+    written = store.write("apis", stats_response((START_MS, 1), (START_MS + HOUR, 2), (START_MS + 2 * HOUR, 3)))
+    rows = store.query("prod", "apis", "sum(message_count)", START, datetime(2026, 10, 1, 2, tzinfo=timezone.utc))
+
+    assert written == 3
+    assert rows == [("orders-api", START_MS, 1.0), ("orders-api", START_MS + HOUR, 2.0)]
+    assert store.high_water_mark("prod", "apis", "sum(message_count)") == datetime(2026, 10, 1, 2, tzinfo=timezone.utc)
+    store.close()
+
+def test_sync_fetches_from_high_water_mark(mocker, tmp_path):
+    store = AnalyticsStore(str(tmp_path / "analytics.db"))
+    client = mocker.Mock()
+    client.query_stats.side_effect = [
+        stats_response((START_MS, 1), (START_MS + HOUR, 2)),
+        stats_response((START_MS + HOUR, 5), (START_MS + 2 * HOUR, 6)),
+    ]
+
+    store.sync(client, "test_org", "prod", "apis", "sum(message_count)", since=START,
+               until=datetime(2026, 10, 1, 2, tzinfo=timezone.utc))
+    store.sync(client, "test_org", "prod", "apis", "sum(message_count)", since=START,
+               until=datetime(2026, 10, 1, 3, tzinfo=timezone.utc))
+
+    second_start = client.query_stats.call_args_list[1][0][4]
+    assert second_start == datetime(2026, 10, 1, 1, tzinfo=timezone.utc)
+    rows = store.query("prod", "apis", "sum(message_count)", START, datetime(2026, 10, 2, tzinfo=timezone.utc))
+    assert [value for _, _, value in rows] == [1.0, 5.0, 6.0]
+    store.close()
+
+def test_sync_skips_when_up_to_date(mocker, tmp_path):
+    store = AnalyticsStore(str(tmp_path / "analytics.db"))
+    store.write("apis", stats_response((START_MS + HOUR, 1)))
+    client = mocker.Mock()
+
+    written = store.sync(client, "test_org", "prod", "apis", "sum(message_count)", since=START,
+                         until=datetime(2026, 10, 1, 1, tzinfo=timezone.utc))
+
+    assert written == 0
+    client.query_stats.assert_not_called()
+    store.close()
+
+def test_sync_tracks_each_selection_separately(mocker, tmp_path):
+    store = AnalyticsStore(str(tmp_path / "analytics.db"))
+    client = mocker.Mock()
+    latency = {"environments": [{"name": "prod", "dimensions": [{"name": "orders-api", "metrics": [
+        {"name": "avg(total_response_time)", "values": [{"timestamp": START_MS, "value": "12.5"}]}
+    ]}]}]}
+    client.query_stats.side_effect = [stats_response((START_MS, 1), (START_MS + 2 * HOUR, 3)), latency]
+    until = datetime(2026, 10, 1, 3, tzinfo=timezone.utc)
+
+    store.sync(client, "test_org", "prod", "apis", "sum(message_count)", since=START, until=until)
+    store.sync(client, "test_org", "prod", "apis", "avg(total_response_time)", since=START, until=until)
+
+    assert client.query_stats.call_args_list[1][0][4] == START
+    assert store.high_water_mark("prod", "apis", "avg(total_response_time)") == datetime(2026, 10, 1, 2, tzinfo=timezone.utc)
+    assert store.high_water_mark("prod", "apis", "sum(message_count)") == datetime(2026, 10, 1, 2, tzinfo=timezone.utc)
+    assert store.query("prod", "apis", "avg(total_response_time)", START, until) == [("orders-api", START_MS, 12.5)]
+    store.close()
+
+def test_sync_advances_high_water_mark_without_points(mocker, tmp_path):
+    store = AnalyticsStore(str(tmp_path / "analytics.db"))
+    client = mocker.Mock()
+    client.query_stats.return_value = {"environments": []}
+
+    written = store.sync(client, "test_org", "prod", "apis", "sum(message_count)", since=START,
+                         until=datetime(2026, 10, 8, 12, 30, tzinfo=timezone.utc))
+    store.sync(client, "test_org", "prod", "apis", "sum(message_count)", since=START,
+               until=datetime(2026, 10, 8, 12, 35, tzinfo=timezone.utc))
+
+    assert written == 0
+    assert store.high_water_mark("prod", "apis", "sum(message_count)") == datetime(2026, 10, 8, 11, tzinfo=timezone.utc)
+    assert client.query_stats.call_args_list[1][0][4] == datetime(2026, 10, 8, 11, tzinfo=timezone.utc)
+    store.close()
@@ -86,5 +86,20 @@ class TestCachesClient(unittest.TestCase):
         )
         self.assertEqual(response, {"cache": "updated"})
 
+    @patch("requests.post")
+    def test_clear_entries(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.content = b""
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        response = self.client.clear_entries("cache-id", prefix="user:42")
+
+        mock_post.assert_called_once_with(
+            "https://api.example.com/caches/cache-id/entries?action=clear&prefix=user%3A42",
+            headers={"Authorization": "Bearer test-token"}
+        )
+        self.assertEqual(response, {})
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,34 @@
+from apigee_sdk.concurrency import run_concurrently
+
+def test_run_concurrently_returns_every_item():
+    results = list(run_concurrently(lambda item: item * 2, range(20), max_workers=4))
+
+    assert sorted(result["item"] for result in results) == list(range(20))
+    assert all(result["result"] == result["item"] * 2 for result in results)
+    assert all(result["error"] is None for result in results)
+
+def test_run_concurrently_captures_errors():
+    def fail_on_odd(item):
+        if item % 2:
+            raise ValueError(f"odd {item}")
+        return item
+
+    results = {result["item"]: result for result in run_concurrently(fail_on_odd, range(4), max_workers=2)}
+
+    assert results[0]["result"] == 0
+    assert isinstance(results[1]["error"], ValueError)
+    assert results[3]["result"] is None
+
+def test_rate_limiter_spaces_calls(mocker):
+    from apigee_sdk.concurrency import RateLimiter
+
+    clock = {"now": 0.0}
+    mocker.patch("apigee_sdk.concurrency.time.monotonic", side_effect=lambda: clock["now"])
+    mock_sleep = mocker.patch("apigee_sdk.concurrency.time.sleep", side_effect=lambda seconds: clock.update(now=clock["now"] + seconds))
+
+    limiter = RateLimiter(rate=2, burst=1)
+    for _ in range(3):
+        limiter.acquire()
+
+    assert clock["now"] == 1.0
+    assert mock_sleep.call_count == 2
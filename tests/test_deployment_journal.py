@@ -0,0 +1,24 @@
+from apigee_sdk.deployment_journal import DeploymentJournal
+
+def test_record_deployment_tracks_previous_revision(tmp_path):
+    journal = DeploymentJournal(str(tmp_path / "deployments.jsonl"))
+
+    journal.record_deployment("test_org", "prod", "test_api", "1")
+    entry = journal.record_deployment("test_org", "prod", "test_api", "2")
+
+    assert entry["previous_revision"] == "1"
+    assert journal.current_revision("test_org", "prod", "test_api") == "2"
+    assert journal.previous_revision("test_org", "prod", "test_api") == "1"
+    assert journal.previous_revision("test_org", "test", "test_api") is None
+
+def test_journal_is_replayed_from_disk(tmp_path):
+    path = str(tmp_path / "deployments.jsonl")
+    journal = DeploymentJournal(path)
+    for revision in ("1", "2", "3"):
+        journal.record_deployment("test_org", "prod", "test_api", revision)
+    journal.record_rollback("test_org", "prod", "test_api")
+
+    reloaded = DeploymentJournal(path)
+
+    assert reloaded.current_revision("test_org", "prod", "test_api") == "2"
+    assert reloaded.previous_revision("test_org", "prod", "test_api") == "1"
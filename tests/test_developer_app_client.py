@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, call
 from apigee_sdk.developer_app_client import DeveloperAppClient
 
 class TestDeveloperAppClient(unittest.TestCase):
@@ -133,5 +133,81 @@ class TestDeveloperAppClient(unittest.TestCase):
         )
         self.assertEqual(response, {"app": "updated"})
 
+    def _apps(self):
+        return [
+            {"appId": "app-1", "developerId": "dev-1", "attributes": [{"name": "tier", "value": "gold"}], "credentials": [
+                {"consumerKey": "key-1", "status": "approved", "apiProducts": [{"apiproduct": "orders", "status": "approved"}]},
+                {"consumerKey": "key-2", "status": "revoked", "apiProducts": [{"apiproduct": "payments", "status": "approved"}]},
+            ]},
+            {"appId": "app-2", "developerId": "dev-2", "attributes": [], "credentials": [
+                {"consumerKey": "key-3", "status": "approved", "apiProducts": [{"apiproduct": "orders", "status": "approved"}]},
+            ]},
+        ]
+
+    def test_select_api_keys(self):
+        apps = {app["appId"]: app for app in self._apps()}
+        with patch.object(self.client, "list_apps", return_value=["app-1", "app-2"]), \
+                patch.object(self.client, "fetch_app_details", side_effect=lambda app_id: apps[app_id]):
+            self.assertEqual(sorted(self.client.select_api_keys(product="orders")), [("app-1", "key-1"), ("app-2", "key-3")])
+            self.assertEqual(self.client.select_api_keys(developer="dev-1", status="revoked"), [("app-1", "key-2")])
+            self.assertEqual(self.client.select_api_keys(attribute=("tier", "gold"), product="orders"), [("app-1", "key-1")])
+
+    @patch("requests.post")
+    def test_bulk_api_key_action_revoke(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"status": "revoked"}
+        mock_response.status_code = 200
+        mock_post.return_value = mock_response
+
+        keys = [(f"app-{index}", f"key-{index}") for index in range(50)]
+        results = list(self.client.bulk_api_key_action("revoke", keys))
+
+        self.assertEqual(len(results), 50)
+        self.assertTrue(all(result["status"] == "ok" for result in results))
+        self.assertEqual(mock_post.call_count, 50)
+        self.assertIn(call("https://api.example.com/apps/app-7/api-keys/key-7/revoke", headers={"Authorization": "Bearer test-token"}), mock_post.call_args_list)
+
+    def test_bulk_api_key_action_rotate_reports_failures(self):
+        def revoke(app_id, api_key_id):
+            if app_id == "app-2":
+                raise Exception("Error 404: key not found")
+            return {"status": "revoked"}
+
+        with patch.object(self.client, "add_api_key", return_value={"consumerKey": "new-key"}) as mock_add, \
+                patch.object(self.client, "revoke_api_key", side_effect=revoke):
+            results = {result["app_id"]: result for result in self.client.bulk_api_key_action(
+                "rotate", [("app-1", "key-1"), ("app-2", "key-2")], payload={"expiryDate": "2027-01-01"}
+            )}
+
+        mock_add.assert_any_call("app-1", {"expiryDate": "2027-01-01"})
+        self.assertEqual(results["app-1"]["result"], {"consumerKey": "new-key"})
+        self.assertEqual(results["app-2"]["status"], "failed")
+        self.assertEqual(results["app-2"]["phase"], "revoke")
+        self.assertEqual(results["app-2"]["result"], {"consumerKey": "new-key"})
+        self.assertIn("404", results["app-2"]["error"])
+
+    def test_bulk_api_key_action_rotate_reports_failed_add(self):
+        with patch.object(self.client, "add_api_key", side_effect=Exception("Error 403: forbidden")), \
+                patch.object(self.client, "revoke_api_key") as mock_revoke:
+            results = list(self.client.bulk_api_key_action("rotate", [("app-1", "key-1")]))
+
+        self.assertEqual(results[0]["status"], "failed")
+        self.assertEqual(results[0]["phase"], "add")
+        self.assertIsNone(results[0]["result"])
+        mock_revoke.assert_not_called()
+
+    def test_bulk_api_key_action_rejects_unknown_action(self):
+        with self.assertRaises(ValueError):
+            list(self.client.bulk_api_key_action("delete", []))
+
+    def test_iter_app_details_uses_expanded_listing(self):
+        with patch.object(self.client, "list_apps", return_value={"app": self._apps()}) as mock_list_apps, \
+                patch.object(self.client, "fetch_app_details") as mock_fetch:
+            apps = list(self.client.iter_app_details())
+
+        self.assertEqual([app["appId"] for app in apps], ["app-1", "app-2"])
+        mock_list_apps.assert_called_once_with(expand=True, count=1000, start_key=None)
+        mock_fetch.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
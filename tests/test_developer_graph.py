@@ -0,0 +1,72 @@
+from apigee_sdk.developer_graph import fetch_graph
+
+APPS = {
+    "dev-1": {"app": [
+        {"appId": "app-1", "credentials": [
+            {"consumerKey": "key-1", "status": "approved", "apiProducts": [
+                {"apiproduct": "orders", "status": "approved"}, {"apiproduct": "billing", "status": "pending"}]},
+        ]},
+    ]},
+    "dev-2": {"app": [
+        {"appId": "app-2", "credentials": [
+            {"consumerKey": "key-2", "status": "approved", "apiProducts": [{"apiproduct": "orders", "status": "approved"}]},
+            {"consumerKey": "key-3", "status": "revoked", "apiProducts": [{"apiproduct": "payments", "status": "approved"}]},
+        ]},
+    ]},
+}
+
+def make_clients(mocker):
+    developers_client, products_client = mocker.Mock(), mocker.Mock()
+    developers_client.fetch_developer_details.side_effect = lambda developer_id: {"developerId": developer_id}
+    developers_client.list_developer_apps.side_effect = lambda developer_id, expand: APPS[developer_id]
+    products_client.fetch_product_details.side_effect = lambda name: {"name": name}
+    return developers_client, products_client
+
+def test_fetch_graph_builds_adjacency_indexes(mocker):
+    developers_client, products_client = make_clients(mocker)
+
+    graph = fetch_graph(developers_client, products_client, ["dev-1", "dev-2"])
+
+    assert graph.developers_with_access("orders") == {"dev-1", "dev-2"}
+    assert graph.developers_with_access("billing") == set()
+    assert graph.developers_with_access("payments") == set()
+    assert graph.products_of("dev-1") == {"orders"}
+    assert graph.developer_apps["dev-2"] == {"app-2"}
+    assert graph.app_keys["app-2"] == {"key-2", "key-3"}
+    assert graph.key_app["key-3"] == "app-2"
+    assert graph.app_developer["app-1"] == "dev-1"
+    assert set(graph.products) == {"orders", "billing", "payments"}
+    assert graph.errors == []
+
+def test_fetch_graph_deduplicates_products_and_records_errors(mocker):
+    developers_client, products_client = make_clients(mocker)
+
+    def list_developer_apps(developer_id, expand):
+        if developer_id not in APPS:
+            raise Exception("404 Client Error")
+        return APPS[developer_id]
+
+    developers_client.list_developer_apps.side_effect = list_developer_apps
+
+    graph = fetch_graph(developers_client, products_client, ["dev-1", "dev-2", "dev-3"])
+
+    assert products_client.fetch_product_details.call_count == 3
+    assert graph.errors == [{"developer_id": "dev-3", "error": "404 Client Error"}]
+    assert set(graph.developers) == {"dev-1", "dev-2"}
+
+def test_expired_keys_do_not_grant_access():
+    from apigee_sdk.developer_graph import DeveloperGraph
+
+    graph = DeveloperGraph()
+    graph.add_developer("dev-1", {"developerId": "dev-1"}, [
+        {"appId": "app-1", "credentials": [
+            {"consumerKey": "key-1", "status": "approved", "expiresAt": 1000,
+             "apiProducts": [{"apiproduct": "orders", "status": "approved"}]},
+            {"consumerKey": "key-2", "status": "approved", "expiresAt": -1,
+             "apiProducts": [{"apiproduct": "billing", "status": "approved"}]},
+        ]},
+    ])
+
+    assert graph.products_of("dev-1") == {"billing"}
+    assert graph.key_products["key-1"] == set()
+    assert graph.key_app["key-1"] == "app-1"
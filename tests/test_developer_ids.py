@@ -0,0 +1,49 @@
+from apigee_sdk.developer_ids import DeveloperIdCache
+
+def developer(index):
+    return {"email": f"Dev{index}@Example.com", "developerId": f"id-{index}"}
+
+def test_remember_and_lookup_both_ways():
+    cache = DeveloperIdCache()
+    cache.remember([developer(1), {"email": "no-id@example.com"}, "not-a-developer"])
+
+    assert cache.developer_id("dev1@example.com") == "id-1"
+    assert cache.email("id-1") == "dev1@example.com"
+    assert cache.developer_id("missing@example.com") is None
+    assert len(cache) == 1
+
+def test_least_recently_used_entries_are_evicted():
+    cache = DeveloperIdCache(max_entries=2)
+    cache.remember([developer(1), developer(2)])
+    cache.developer_id("dev1@example.com")
+
+    cache.remember([developer(3)])
+
+    assert cache.developer_id("dev2@example.com") is None
+    assert cache.developer_id("dev1@example.com") == "id-1"
+    assert cache.developer_id("dev3@example.com") == "id-3"
+
+def test_cache_persists_between_runs(tmp_path):
+    path = str(tmp_path / "developer-ids.db")
+    cache = DeveloperIdCache(path)
+    cache.remember([developer(1)])
+    cache.close()
+
+    reopened = DeveloperIdCache(path)
+    assert reopened.developer_id("dev1@example.com") == "id-1"
+    reopened.forget("DEV1@example.com")
+    assert len(reopened) == 0
+
+def test_lookups_do_not_write_until_flushed(tmp_path):
+    path = str(tmp_path / "developer-ids.db")
+    cache = DeveloperIdCache(path, flush_every=3)
+    cache.remember([developer(1), developer(2), developer(3)])
+    changes = cache.connection.total_changes
+
+    cache.developer_id("dev1@example.com")
+    cache.email("id-2")
+    cache.developer_id("dev1@example.com")
+    assert cache.connection.total_changes == changes
+
+    cache.developer_id("dev3@example.com")
+    assert cache.connection.total_changes == changes + 3
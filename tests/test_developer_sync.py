@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from apigee_sdk.developer_sync import DeveloperSync
+
+def developer(developer_id, modified):
+    return {"developerId": developer_id, "email": f"{developer_id}@example.com", "lastModifiedAt": modified}
+
+def test_sync_emits_changes_since_previous_run(mocker, tmp_path):
+    client = mocker.Mock()
+    state_path = str(tmp_path / "developers.json")
+    client.iter_developers.return_value = iter([developer("dev-1", 100), developer("dev-2", 100), developer("dev-3", 100)])
+
+    first = list(DeveloperSync(client, state_path).sync())
+
+    client.iter_developers.return_value = iter([developer("dev-1", 100), developer("dev-2", 250), developer("dev-4", 300)])
+    sync = DeveloperSync(client, state_path)
+    second = list(sync.sync())
+
+    assert [event["event"] for event in first] == ["created"] * 3
+    assert [(event["event"], event["developer_id"]) for event in second] == [
+        ("updated", "dev-2"), ("created", "dev-4"), ("deleted", "dev-3"),
+    ]
+    assert second[0]["developer"]["lastModifiedAt"] == 250
+    assert json.loads((tmp_path / "developers.json").read_text())["developers"] == {"dev-1": 100, "dev-2": 250, "dev-4": 300}
+    client.iter_developers.assert_called_with(page_size=1000)
+
+def test_interrupted_sync_keeps_consumed_events(mocker, tmp_path):
+    client = mocker.Mock()
+    state_path = str(tmp_path / "developers.json")
+
+    def failing_listing(page_size):
+        yield developer("dev-1", 100)
+        raise Exception("HTTP error occurred: 503")
+
+    client.iter_developers.side_effect = failing_listing
+    with pytest.raises(Exception):
+        list(DeveloperSync(client, state_path).sync())
+
+    client.iter_developers.side_effect = None
+    client.iter_developers.return_value = iter([developer("dev-1", 100), developer("dev-2", 100)])
+    events = list(DeveloperSync(client, state_path).sync())
+
+    assert [(event["event"], event["developer_id"]) for event in events] == [("created", "dev-2")]
+
+def test_stopped_sync_checkpoints_consumed_events(mocker, tmp_path):
+    client = mocker.Mock()
+    state_path = str(tmp_path / "developers.json")
+    client.iter_developers.return_value = iter([developer(f"dev-{index}", 100) for index in range(5)])
+
+    sync = DeveloperSync(client, state_path, checkpoint_every=2).sync()
+    consumed = [next(sync)["developer_id"] for _ in range(3)]
+    assert set(json.loads((tmp_path / "developers.json").read_text())["developers"]) == {"dev-0", "dev-1"}
+    sync.close()
+
+    client.iter_developers.return_value = iter([developer(f"dev-{index}", 100) for index in range(5)])
+    events = list(DeveloperSync(client, state_path).sync())
+
+    assert consumed == ["dev-0", "dev-1", "dev-2"]
+    assert [event["developer_id"] for event in events] == ["dev-2", "dev-3", "dev-4"]
@@ -1,5 +1,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
+
+import requests
+
 from apigee_sdk.developers_client import DevelopersClient
 
 class TestDevelopersClient(unittest.TestCase):
@@ -86,5 +89,85 @@ class TestDevelopersClient(unittest.TestCase):
         )
         self.assertEqual(response, {"developer": "updated"})
 
+    @patch("requests.get")
+    def test_iter_developers_uses_expanded_pages(self, mock_get):
+        first, second = MagicMock(status_code=200), MagicMock(status_code=200)
+        first.json.return_value = {"developer": [{"email": "a@example.com"}, {"email": "b@example.com"}]}
+        second.json.return_value = {"developer": [{"email": "b@example.com"}]}
+        mock_get.side_effect = [first, second]
+
+        developers = list(self.client.iter_developers(page_size=2))
+
+        self.assertEqual([developer["email"] for developer in developers], ["a@example.com", "b@example.com"])
+        mock_get.assert_any_call(
+            "https://api.example.com/developers?expand=true&count=2&startKey=b%40example.com",
+            headers={"Authorization": "Bearer test-token"}
+        )
+
+    @patch("requests.get")
+    def test_fetch_developer_by_email_uses_id_cache(self, mock_get):
+        listing, details = MagicMock(status_code=200), MagicMock(status_code=200)
+        listing.json.return_value = {"developer": [{"email": "a@example.com", "developerId": "id-a"}]}
+        details.json.return_value = {"email": "a@example.com", "developerId": "id-a", "firstName": "A"}
+        mock_get.side_effect = [listing, details, details]
+
+        self.assertEqual(self.client.fetch_developer_by_email("A@example.com")["firstName"], "A")
+        self.assertEqual(self.client.fetch_developer_by_email("a@example.com")["firstName"], "A")
+
+        self.assertEqual(mock_get.call_count, 3)
+        mock_get.assert_called_with("https://api.example.com/developers/id-a", headers={"Authorization": "Bearer test-token"})
+
+    @patch("requests.put")
+    @patch("requests.get")
+    def test_update_developer_by_email_repairs_stale_id(self, mock_get, mock_put):
+        self.client.id_cache.remember([{"email": "a@example.com", "developerId": "id-old"}])
+        listing = MagicMock(status_code=200)
+        listing.json.return_value = {"developer": [{"email": "a@example.com", "developerId": "id-new"}]}
+        mock_get.return_value = listing
+        not_found, updated = MagicMock(), MagicMock()
+        not_found.raise_for_status.side_effect = requests.HTTPError("404 Client Error", response=MagicMock(status_code=404))
+        updated.json.return_value = {"developerId": "id-new"}
+        mock_put.side_effect = [not_found, updated]
+
+        response = self.client.update_developer_by_email("a@example.com", {"firstName": "B"})
+
+        self.assertEqual(response, {"developerId": "id-new"})
+        self.assertEqual(mock_put.call_args[0][0], "https://api.example.com/developers/id-new")
+        self.assertEqual(self.client.id_cache.developer_id("a@example.com"), "id-new")
+
+    def test_resolve_unknown_email_raises(self):
+        with patch.object(self.client, "iter_developers", return_value=iter([])):
+            with self.assertRaises(KeyError):
+                self.client.resolve_developer_id("missing@example.com")
+
+    def test_resolve_unknown_email_is_remembered_briefly(self):
+        with patch.object(self.client, "iter_developers", return_value=iter([])) as mock_iter:
+            for _ in range(2):
+                with self.assertRaises(KeyError):
+                    self.client.resolve_developer_id("missing@example.com")
+            self.assertEqual(mock_iter.call_count, 1)
+
+            self.client.missing_ttl = 0
+            self.client._missing.clear()
+            for _ in range(2):
+                with self.assertRaises(KeyError):
+                    self.client.resolve_developer_id("missing@example.com")
+            self.assertEqual(mock_iter.call_count, 3)
+
+    @patch("requests.get")
+    def test_list_developer_apps(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"app": [{"appId": "app-1"}]}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        response = self.client.list_developer_apps("dev@example.com")
+
+        mock_get.assert_called_once_with(
+            "https://api.example.com/developers/dev@example.com/apps?expand=true",
+            headers={"Authorization": "Bearer test-token"}
+        )
+        self.assertEqual(response, {"app": [{"appId": "app-1"}]})
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
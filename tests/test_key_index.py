@@ -0,0 +1,44 @@
+from apigee_sdk.key_index import ConsumerKeyIndex
+
+def make_app(app_id, consumer_key, last_modified, status="approved"):
+    return {
+        "appId": app_id,
+        "name": f"{app_id}-name",
+        "developerId": "dev-1",
+        "lastModifiedAt": last_modified,
+        "credentials": [{"consumerKey": consumer_key, "status": status, "apiProducts": [{"apiproduct": "orders"}]}],
+    }
+
+def test_refresh_and_lookup(mocker, tmp_path):
+    client = mocker.Mock()
+    client.iter_app_details.return_value = iter([make_app("app-1", "key-1", 100), make_app("app-2", "key-2", 100)])
+    index = ConsumerKeyIndex(str(tmp_path / "keys.db"))
+
+    assert index.refresh(client) == {"updated": 2, "unchanged": 0, "removed": 0}
+    assert index.lookup("key-2") == {
+        "consumer_key": "key-2", "app_id": "app-2", "app_name": "app-2-name",
+        "developer_id": "dev-1", "products": ["orders"], "status": "approved",
+    }
+    assert index.lookup("missing") is None
+    index.close()
+
+def test_refresh_is_incremental(mocker, tmp_path):
+    client = mocker.Mock()
+    client.iter_app_details.return_value = iter([make_app("app-1", "key-1", 100), make_app("app-2", "key-2", 100)])
+    path = str(tmp_path / "keys.db")
+    ConsumerKeyIndex(path).refresh(client)
+
+    # app-1 was rotated, app-2 was deleted.
+    client.iter_app_details.return_value = iter([make_app("app-1", "key-1b", 200, status="approved")])
+    index = ConsumerKeyIndex(path)
+    summary = index.refresh(client)
+
+    assert summary == {"updated": 1, "unchanged": 0, "removed": 1}
+    assert index.lookup("key-1") is None
+    assert index.lookup("key-1b")["app_id"] == "app-1"
+    assert index.lookup("key-2") is None
+    assert len(index) == 1
+
+    client.iter_app_details.return_value = iter([make_app("app-1", "key-1b", 200)])
+    assert index.refresh(client) == {"updated": 0, "unchanged": 1, "removed": 0}
+    index.close()
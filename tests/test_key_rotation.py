@@ -0,0 +1,129 @@
+import json
+import os
+import stat
+
+from apigee_sdk.key_rotation import KeyRotation
+
+def make_client(mocker, app_ids):
+    apps = {app_id: [{"consumerKey": f"{app_id}-old", "status": "approved"}] for app_id in app_ids}
+    client = mocker.Mock()
+    client.fetch_app_details.side_effect = lambda app_id: {"appId": app_id, "credentials": list(apps[app_id])}
+
+    def add_api_key(app_id, payload):
+        credential = {"consumerKey": f"{app_id}-new", "consumerSecret": "secret", "status": "approved"}
+        apps[app_id].append(credential)
+        return credential
+
+    client.add_api_key.side_effect = add_api_key
+    return client, apps
+
+def test_run_adds_exports_and_revokes(mocker, tmp_path):
+    mock_sleep = mocker.patch("apigee_sdk.key_rotation.time.sleep")
+    mocker.patch("apigee_sdk.key_rotation.time.time", side_effect=lambda: 1000.0 + mock_sleep.call_count * 60)
+    client, _ = make_client(mocker, ["app-1", "app-2", "app-3"])
+    export_path = tmp_path / "new-keys.ndjson"
+    rotation = KeyRotation(client, str(tmp_path / "rotation.jsonl"), overlap=60, batch_size=2)
+
+    summary = rotation.run(["app-1", "app-2", "app-3"], export_path=str(export_path))
+
+    assert summary == {"added": 3, "adopted": 0, "skipped": 0, "revoked": 3, "failed": [], "pending": 0,
+                       "next_revocation": None}
+    mock_sleep.assert_called_once_with(60.0)
+    exported = [json.loads(line) for line in export_path.read_text().splitlines()]
+    assert sorted(entry["consumer_key"] for entry in exported) == ["app-1-new", "app-2-new", "app-3-new"]
+    assert sorted(call.args for call in client.revoke_api_key.call_args_list) == [
+        ("app-1", "app-1-old"), ("app-2", "app-2-old"), ("app-3", "app-3-old")
+    ]
+
+def test_resume_does_not_double_issue_keys(mocker, tmp_path):
+    mocker.patch("apigee_sdk.key_rotation.time.sleep")
+    checkpoint = tmp_path / "rotation.jsonl"
+    client, apps = make_client(mocker, ["app-1", "app-2"])
+    # Simulate a crash after app-1's key was created but before it was checkpointed.
+    checkpoint.write_text(json.dumps({"event": "pending", "app_id": "app-1", "old_keys": ["app-1-old"],
+                                      "keys": ["app-1-old"], "at": 1000.0}) + "\n")
+    apps["app-1"].append({"consumerKey": "app-1-crashed", "status": "approved", "issuedAt": 1000500})
+
+    rotation = KeyRotation(client, str(checkpoint), overlap=0)
+    summary = rotation.run(["app-1", "app-2"])
+
+    assert summary["adopted"] == 1
+    assert summary["added"] == 1
+    client.add_api_key.assert_called_once_with("app-2", {})
+    assert rotation.apps["app-1"]["new_key"] == "app-1-crashed"
+
+    resumed = KeyRotation(client, str(checkpoint), overlap=0)
+    summary = resumed.run(["app-1", "app-2"])
+
+    assert summary == {"added": 0, "adopted": 0, "skipped": 2, "revoked": 0, "failed": [], "pending": 0,
+                       "next_revocation": None}
+    assert client.add_api_key.call_count == 1
+
+def test_resume_after_failed_add_does_not_adopt_revoked_key(mocker, tmp_path):
+    mocker.patch("apigee_sdk.key_rotation.time.sleep")
+    checkpoint = str(tmp_path / "rotation.jsonl")
+    export_path = tmp_path / "new-keys.ndjson"
+    client, apps = make_client(mocker, ["app-1"])
+    apps["app-1"] = [{"consumerKey": "key-a", "status": "approved", "issuedAt": 1000},
+                     {"consumerKey": "key-r", "status": "revoked", "issuedAt": 2000}]
+    add_api_key = client.add_api_key.side_effect
+
+    def flaky_add_api_key(app_id, payload):
+        if client.add_api_key.call_count == 1:
+            raise Exception("HTTP error occurred: 503")
+        return add_api_key(app_id, payload)
+
+    client.add_api_key.side_effect = flaky_add_api_key
+
+    first = KeyRotation(client, checkpoint, overlap=0).run(["app-1"], export_path=str(export_path))
+    resumed = KeyRotation(client, checkpoint, overlap=0).run(["app-1"], export_path=str(export_path))
+
+    assert first["failed"][0]["app_id"] == "app-1"
+    assert resumed["added"] == 1
+    assert resumed["adopted"] == 0
+    assert [json.loads(line)["consumer_key"] for line in export_path.read_text().splitlines()] == ["app-1-new"]
+    client.revoke_api_key.assert_called_once_with("app-1", "key-a")
+
+def test_failed_revocations_are_retried_on_resume(mocker, tmp_path):
+    mocker.patch("apigee_sdk.key_rotation.time.sleep")
+    client, _ = make_client(mocker, ["app-1"])
+    client.revoke_api_key.side_effect = [Exception("HTTP error occurred: 503"), {}]
+    checkpoint = str(tmp_path / "rotation.jsonl")
+
+    first = KeyRotation(client, checkpoint, overlap=0).run(["app-1"])
+    second = KeyRotation(client, checkpoint, overlap=0).run(["app-1"])
+
+    assert first["failed"][0]["phase"] == "revoke"
+    assert second["revoked"] == 1
+    assert client.add_api_key.call_count == 1
+
+def test_run_without_wait_leaves_revocation_for_later(mocker, tmp_path):
+    mock_sleep = mocker.patch("apigee_sdk.key_rotation.time.sleep")
+    mock_time = mocker.patch("apigee_sdk.key_rotation.time.time", return_value=1000.0)
+    client, _ = make_client(mocker, ["app-1", "app-2"])
+    checkpoint = str(tmp_path / "rotation.jsonl")
+
+    summary = KeyRotation(client, checkpoint, overlap=3600).run(["app-1", "app-2"], wait=False)
+
+    assert summary["added"] == 2
+    assert summary["revoked"] == 0
+    assert summary["pending"] == 2
+    assert summary["next_revocation"] == 4600.0
+    mock_sleep.assert_not_called()
+    client.revoke_api_key.assert_not_called()
+
+    mock_time.return_value = 4600.0
+    later = KeyRotation(client, checkpoint, overlap=0)
+    assert [outcome["status"] for outcome in later.revoke_old_keys()] == ["revoked", "revoked"]
+    assert later.next_revocation() is None
+
+def test_export_file_is_private(mocker, tmp_path):
+    mocker.patch("apigee_sdk.key_rotation.time.sleep")
+    client, _ = make_client(mocker, ["app-1"])
+    export_path = tmp_path / "new-keys.ndjson"
+
+    KeyRotation(client, str(tmp_path / "rotation.jsonl"), overlap=0).run(["app-1"], export_path=str(export_path))
+
+    assert "app-1-new" in export_path.read_text()
+    if os.name == "posix":
+        assert stat.S_IMODE(os.stat(export_path).st_mode) == 0o600
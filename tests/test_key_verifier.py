@@ -0,0 +1,133 @@
+import http.client
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+
+from apigee_sdk.key_verifier import KeyVerifier
+
+APPS = [
+    {"appId": "app-1", "status": "approved", "credentials": [
+        {"consumerKey": "key-1", "status": "approved", "apiProducts": [{"apiproduct": "orders", "status": "approved"},
+                                                                       {"apiproduct": "billing", "status": "revoked"}]},
+        {"consumerKey": "key-old", "status": "revoked", "apiProducts": [{"apiproduct": "orders", "status": "approved"}]},
+    ]},
+    {"appId": "app-2", "status": "revoked", "credentials": [
+        {"consumerKey": "key-2", "status": "approved", "apiProducts": [{"apiproduct": "orders", "status": "approved"}]},
+    ]},
+]
+
+def make_verifier(mocker):
+    client = mocker.Mock()
+    client.iter_app_details.side_effect = lambda max_workers: iter(APPS)
+    verifier = KeyVerifier(client)
+    verifier.refresh()
+    return verifier
+
+def test_verify_only_accepts_approved_keys(mocker):
+    verifier = make_verifier(mocker)
+
+    assert verifier.verify("key-1")
+    assert verifier.verify("key-1", "orders")
+    assert not verifier.verify("key-1", "billing")
+    assert not verifier.verify("key-old")
+    assert not verifier.verify("key-2")
+    assert not verifier.verify("unknown")
+
+def test_verify_rejects_expired_keys_and_inactive_developers(mocker):
+    now = int(time.time() * 1000)
+    client, developers_client = mocker.Mock(), mocker.Mock()
+    client.iter_app_details.side_effect = lambda max_workers: iter([
+        {"appId": "app-1", "developerId": "dev-1", "status": "approved", "credentials": [
+            {"consumerKey": "key-expired", "status": "approved", "expiresAt": now - 1000, "apiProducts": []},
+            {"consumerKey": "key-expiring", "status": "approved", "expiresAt": now + 60000, "apiProducts": []},
+            {"consumerKey": "key-forever", "status": "approved", "expiresAt": -1, "apiProducts": []},
+        ]},
+        {"appId": "app-2", "developerId": "dev-2", "status": "approved", "credentials": [
+            {"consumerKey": "key-inactive", "status": "approved", "apiProducts": []},
+        ]},
+    ])
+    developers_client.iter_developers.return_value = iter([{"developerId": "dev-1", "status": "active"},
+                                                           {"developerId": "dev-2", "status": "inactive"}])
+    verifier = KeyVerifier(client, developers_client)
+
+    assert verifier.refresh() == 2
+    assert not verifier.verify("key-expired")
+    assert not verifier.verify("key-inactive")
+    assert verifier.verify("key-forever")
+    assert verifier.verify("key-expiring")
+    mocker.patch("apigee_sdk.key_verifier.time.time", return_value=now / 1000 + 120)
+    assert not verifier.verify("key-expiring")
+
+def test_failed_refresh_keeps_snapshot(mocker):
+    verifier = make_verifier(mocker)
+    verifier.client.iter_app_details.side_effect = Exception("HTTP error occurred: 503")
+
+    with pytest.raises(Exception):
+        verifier.refresh()
+
+    assert verifier.verify("key-1")
+    assert verifier.refresh_errors == 1
+
+def test_http_server_verifies_keys(mocker):
+    verifier = make_verifier(mocker)
+    server = verifier.make_server("127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        connection.request("GET", "/verify?key=key-1&product=orders")
+        accepted = connection.getresponse()
+        accepted.read()
+        connection.request("GET", "/verify?key=unknown")
+        rejected = connection.getresponse()
+        rejected.read()
+        connection.request("POST", "/verify?product=orders", body="key-1\nunknown\nkey-2")
+        batch = connection.getresponse().read().decode("utf-8")
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert accepted.status == 200
+    assert rejected.status == 403
+    assert batch == "1\n0\n0\n"
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available")
+def test_unix_socket_server(mocker):
+    verifier = make_verifier(mocker)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "verifier.sock")
+        server = verifier.make_server(unix_socket=path)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(path)
+            client.sendall(b"GET /verify?key=key-1 HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+            response = b""
+            while True:
+                chunk = client.recv(4096)
+                if not chunk:
+                    break
+                response += chunk
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    assert response.startswith(b"HTTP/1.1 200")
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available")
+def test_unix_socket_server_keeps_other_files(mocker):
+    verifier = make_verifier(mocker)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "verifier.sock")
+        with open(path, "w") as f:
+            f.write("not a socket")
+
+        with pytest.raises(FileExistsError):
+            verifier.make_server(unix_socket=path)
+
+        assert os.path.exists(path)
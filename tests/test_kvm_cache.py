@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+import requests
+
+from apigee_sdk.kvm_cache import KVMCache
+
+def not_found():
+    response = requests.Response()
+    response.status_code = 404
+    return requests.HTTPError("404 Not Found", response=response)
+
+@pytest.fixture
+def clock(mocker):
+    now = [1000.0]
+    mocker.patch("apigee_sdk.kvm_cache.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+def test_reads_are_served_from_memory(mocker, clock):
+    client = mocker.Mock()
+    client.get_kvm_entry.return_value = {"name": "flag", "value": "on"}
+
+    with KVMCache(client, ttl=60) as cache:
+        values = [cache.get("config", "flag") for _ in range(10)]
+        stats = cache.stats()
+
+    assert values == ["on"] * 10
+    client.get_kvm_entry.assert_called_once_with("config", "flag")
+    assert stats["hits"] == 9
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.9
+
+def test_missing_entries_are_cached(mocker, clock):
+    client = mocker.Mock()
+    client.get_kvm_entry.side_effect = not_found()
+
+    with KVMCache(client, ttl=60, negative_ttl=5) as cache:
+        assert cache.get("config", "absent", default="off") == "off"
+        assert cache.get("config", "absent") is None
+        clock[0] += 6
+        cache.get("config", "absent")
+
+    assert client.get_kvm_entry.call_count == 2
+
+def test_refresh_ahead_serves_cached_value(mocker, clock):
+    refreshed = threading.Event()
+    client = mocker.Mock()
+
+    def get_kvm_entry(kvm_id, name):
+        if client.get_kvm_entry.call_count > 1:
+            refreshed.set()
+            return {"name": name, "value": "new"}
+        return {"name": name, "value": "old"}
+
+    client.get_kvm_entry.side_effect = get_kvm_entry
+    with KVMCache(client, ttl=10, ttls={"config": 100}, refresh_ahead=0.5) as cache:
+        assert cache.get("config", "flag") == "old"
+        clock[0] += 60
+        assert cache.get("config", "flag") == "old"
+        assert refreshed.wait(5)
+    assert cache.get("config", "flag") == "new"
+    assert cache.stats()["refreshes"] == 1
+
+def test_concurrent_cold_reads_share_one_request(mocker, clock):
+    release = threading.Event()
+    client = mocker.Mock()
+
+    def slow_get(kvm_id, name):
+        release.wait(5)
+        return {"name": name, "value": "on"}
+
+    client.get_kvm_entry.side_effect = slow_get
+    results = []
+    with KVMCache(client) as cache:
+        readers = [threading.Thread(target=lambda: results.append(cache.get("config", "flag"))) for _ in range(5)]
+        for thread in readers:
+            thread.start()
+        release.set()
+        for thread in readers:
+            thread.join()
+
+    assert results == ["on"] * 5
+    assert client.get_kvm_entry.call_count == 1
+
+def test_fetch_errors_are_raised(mocker, clock):
+    client = mocker.Mock()
+    client.get_kvm_entry.side_effect = requests.HTTPError("503 Service Unavailable")
+
+    with KVMCache(client) as cache:
+        with pytest.raises(requests.HTTPError):
+            cache.get("config", "flag")
+        assert cache.stats()["errors"] == 1
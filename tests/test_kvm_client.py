@@ -1,5 +1,12 @@
+import csv
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
+
+import requests
+
 from apigee_sdk.kvm_client import KVMClient
 
 class TestKVMClient(unittest.TestCase):
@@ -86,5 +93,152 @@ class TestKVMClient(unittest.TestCase):
         )
         self.assertEqual(response, {"kvm": "updated"})
 
+    @patch("requests.get")
+    def test_iter_kvm_entries_follows_page_tokens(self, mock_get):
+        first, second = MagicMock(status_code=200), MagicMock(status_code=200)
+        first.json.return_value = {"keyValueEntries": [{"name": "a", "value": "1"}], "nextPageToken": "a"}
+        second.json.return_value = {"keyValueEntries": [{"name": "b", "value": "2"}], "nextPageToken": ""}
+        mock_get.side_effect = [first, second]
+
+        entries = list(self.client.iter_kvm_entries("kvm-id", page_size=1))
+
+        self.assertEqual([entry["name"] for entry in entries], ["a", "b"])
+        mock_get.assert_called_with(
+            "https://api.example.com/kvms/kvm-id/entries?pageSize=1&pageToken=a",
+            headers={"Authorization": "Bearer test-token"}
+        )
+
+    def test_sync_kvm_writes_only_changes(self):
+        current = [{"name": f"key-{index}", "value": str(index)} for index in range(100)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "entries.csv")
+            with open(source, "w", newline="", encoding="utf-8") as handle:
+                writer = csv.writer(handle)
+                writer.writerow(["name", "value"])
+                for index in range(1, 100):
+                    writer.writerow([f"key-{index}", "changed" if index == 5 else str(index)])
+                writer.writerow(["key-new", "x"])
+            with patch.object(self.client, "iter_kvm_entries", return_value=iter(current)), \
+                    patch.object(self.client, "create_kvm_entry") as mock_create, \
+                    patch.object(self.client, "update_kvm_entry") as mock_update, \
+                    patch.object(self.client, "delete_kvm_entry") as mock_delete:
+                summary = self.client.sync_kvm("kvm-id", source)
+
+        self.assertEqual(summary, {"inserted": 1, "updated": 1, "deleted": 1, "unchanged": 98, "failed": []})
+        mock_create.assert_called_once_with("kvm-id", "key-new", "x")
+        mock_update.assert_called_once_with("kvm-id", "key-5", "changed")
+        mock_delete.assert_called_once_with("kvm-id", "key-0")
+
+    def test_sync_kvm_dry_run_and_failures(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "entries.json")
+            with open(source, "w", encoding="utf-8") as handle:
+                json.dump({"a": "1", "b": {"nested": True}}, handle)
+            with patch.object(self.client, "iter_kvm_entries", side_effect=lambda kvm_id: iter([{"name": "a", "value": "0"}])), \
+                    patch.object(self.client, "create_kvm_entry", side_effect=Exception("409 Conflict")), \
+                    patch.object(self.client, "update_kvm_entry") as mock_update:
+                dry_run = self.client.sync_kvm("kvm-id", source, dry_run=True)
+                mock_update.assert_not_called()
+                summary = self.client.sync_kvm("kvm-id", source)
+
+        self.assertEqual(dry_run, {"inserted": 1, "updated": 1, "deleted": 0, "unchanged": 0, "failed": []})
+        self.assertEqual(summary["updated"], 1)
+        self.assertEqual(summary["failed"], [{"action": "inserted", "name": "b", "error": "409 Conflict"}])
+        mock_update.assert_called_once_with("kvm-id", "a", "1")
+
+    def test_sync_kvm_deduplicates_source(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "entries.ndjson")
+            with open(source, "w", encoding="utf-8") as handle:
+                for name, value in [("a", "1"), ("b", "2"), ("a", "3")]:
+                    handle.write(json.dumps({"name": name, "value": value}) + "\n")
+            with patch.object(self.client, "iter_kvm_entries", return_value=iter([])), \
+                    patch.object(self.client, "create_kvm_entry") as mock_create, \
+                    patch.object(self.client, "update_kvm_entry") as mock_update:
+                summary = self.client.sync_kvm("kvm-id", source)
+
+        self.assertEqual(summary, {"inserted": 2, "updated": 0, "deleted": 0, "unchanged": 0, "failed": []})
+        self.assertEqual(sorted(call.args for call in mock_create.call_args_list), [("kvm-id", "a", "3"), ("kvm-id", "b", "2")])
+        mock_update.assert_not_called()
+
+    @patch("requests.get")
+    def test_get_kvm_entry(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"name": "a/b", "value": "1"}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        response = self.client.get_kvm_entry("kvm-id", "a/b")
+
+        mock_get.assert_called_once_with(
+            "https://api.example.com/kvms/kvm-id/entries/a%2Fb",
+            headers={"Authorization": "Bearer test-token"}
+        )
+        self.assertEqual(response, {"name": "a/b", "value": "1"})
+
+    def test_export_and_import_kvm(self):
+        entries = [{"name": f"key-{index}", "value": str(index)} for index in range(250)]
+        conflict = requests.HTTPError("409 Conflict", response=MagicMock(status_code=409))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "config.ndjson.gz")
+            with patch.object(self.client, "iter_kvm_entries", return_value=iter(entries)) as mock_iter:
+                exported = self.client.export_kvm("config", path)
+            def create_kvm_entry(kvm_id, name, value):
+                if name == "key-7":
+                    raise conflict
+                return {}
+
+            with patch.object(self.client, "create_kvm_entry", side_effect=create_kvm_entry) as mock_create, \
+                    patch.object(self.client, "update_kvm_entry") as mock_update:
+                failed = self.client.import_kvm("config-copy", path)
+                overwritten = self.client.import_kvm("config-copy", path, overwrite=True)
+
+        self.assertEqual(exported, 250)
+        mock_iter.assert_called_once_with("config", page_size=100)
+        self.assertEqual(failed["imported"], 249)
+        self.assertEqual(failed["failures"], 1)
+        self.assertEqual(failed["failed"][0]["name"], "key-7")
+        self.assertEqual(overwritten, {"imported": 250, "failures": 0, "failed": []})
+        mock_update.assert_called_once_with("config-copy", "key-7", "7")
+        self.assertEqual(mock_create.call_count, 500)
+
+    def test_export_kvm_leaves_no_partial_file(self):
+        def entries():
+            yield {"name": "key-1", "value": "1"}
+            raise requests.HTTPError("500 Server Error")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "config.ndjson")
+            with open(path, "w") as previous:
+                previous.write('{"name": "old", "value": "1"}\n')
+            with patch.object(self.client, "iter_kvm_entries", return_value=entries()):
+                with self.assertRaises(requests.HTTPError):
+                    self.client.export_kvm("config", path)
+
+            self.assertEqual(os.listdir(tmp_dir), ["config.ndjson"])
+            with open(path) as exported:
+                self.assertEqual(exported.read(), '{"name": "old", "value": "1"}\n')
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_export_kvm_is_private(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "config.ndjson.gz")
+            with patch.object(self.client, "iter_kvm_entries", return_value=iter([{"name": "secret", "value": "1"}])):
+                self.client.export_kvm("config", path)
+
+            self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+
+    def test_import_kvm_caps_failed_entries(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "config.ndjson")
+            with open(path, "w") as source:
+                source.writelines(f'{{"name": "key-{index}", "value": "{index}"}}\n' for index in range(25))
+            with patch.object(self.client, "create_kvm_entry", side_effect=requests.HTTPError("400 Client Error")):
+                summary = self.client.import_kvm("config", path, batch_size=4, max_failed=10)
+
+        self.assertEqual(summary["imported"], 0)
+        self.assertEqual(summary["failures"], 25)
+        self.assertEqual(len(summary["failed"]), 10)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
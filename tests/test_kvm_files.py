@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from apigee_sdk.kvm_files import detect_format, read_entries, write_entries
+
+def test_detect_format():
+    assert detect_format("entries.CSV") == "csv"
+    assert detect_format("entries.jsonl") == "ndjson"
+    assert detect_format("entries.json") == "json"
+
+def test_read_ndjson_and_api_response(tmp_path):
+    ndjson = tmp_path / "entries.ndjson"
+    ndjson.write_text('{"name": "a", "value": "1"}\n\n{"name": "b", "value": 2}\n')
+    response = tmp_path / "entries.json"
+    response.write_text(json.dumps({"keyValueEntries": [{"name": "c", "value": "3"}]}))
+
+    assert list(read_entries(str(ndjson))) == [("a", "1"), ("b", "2")]
+    assert list(read_entries(str(response))) == [("c", "3")]
+
+def test_read_rejects_entries_without_name(tmp_path):
+    source = tmp_path / "entries.csv"
+    source.write_text("key,value\na,1\n")
+
+    with pytest.raises(ValueError):
+        list(read_entries(str(source)))
+
+def test_write_and_read_gzip_ndjson(tmp_path):
+    path = str(tmp_path / "entries.ndjson.gz")
+
+    written = write_entries(path, ({"name": f"key-{index}", "value": str(index)} for index in range(1000)))
+
+    assert written == 1000
+    assert detect_format(path) == "ndjson"
+    entries = read_entries(path)
+    assert next(entries) == ("key-0", "0")
+    assert sum(1 for _ in entries) == 999
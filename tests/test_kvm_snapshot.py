@@ -0,0 +1,49 @@
+import pytest
+
+from apigee_sdk.kvm_snapshot import KVMSnapshot, snapshot_kvm, write_snapshot
+
+def test_write_and_lookup(tmp_path):
+    path = str(tmp_path / "config.snapshot")
+    written = write_snapshot(path, [("b", "2"), ("a", "1"), ("ключ", "значение"), ("c", ""), ("a", "one")])
+
+    snapshot = KVMSnapshot(path)
+
+    assert written == 4
+    assert len(snapshot) == 4
+    assert snapshot.get("a") == "one"
+    assert snapshot.get("ключ") == "значение"
+    assert snapshot.get("c") == ""
+    assert snapshot.get("missing", "default") == "default"
+    assert "b" in snapshot and "z" not in snapshot
+    assert list(snapshot.keys()) == ["a", "b", "c", "ключ"]
+    assert bytes(snapshot.view("b")) == b"2"
+
+def test_reload_after_atomic_replace(tmp_path):
+    path = str(tmp_path / "config.snapshot")
+    write_snapshot(path, [("flag", "off")])
+    snapshot = KVMSnapshot(path)
+    old_view = snapshot.view("flag")
+
+    assert snapshot.reload() is False
+    write_snapshot(path, [("flag", "on"), ("other", "x")])
+
+    assert snapshot.reload() is True
+    assert snapshot.get("flag") == "on"
+    assert bytes(old_view) == b"off"
+    assert [name for name in tmp_path.iterdir() if name.name.startswith(".kvm-snapshot-")] == []
+
+def test_snapshot_kvm(mocker, tmp_path):
+    client = mocker.Mock()
+    client.iter_kvm_entries.return_value = iter([{"name": "k", "value": "v"}])
+    path = str(tmp_path / "config.snapshot")
+
+    assert snapshot_kvm(client, "config", path) == 1
+    assert KVMSnapshot(path).get("k") == "v"
+    client.iter_kvm_entries.assert_called_once_with("config")
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-snapshot"
+    path.write_bytes(b"x" * 64)
+
+    with pytest.raises(ValueError):
+        KVMSnapshot(str(path))
@@ -0,0 +1,135 @@
+import threading
+import time
+import urllib.request
+
+from apigee_sdk.metrics_exporter import MetricsExporter
+
+def stats_response(value):
+    return {"environments": [{"name": "prod", "dimensions": [{"name": "orders-api", "metrics": [
+        {"name": "sum(message_count)", "values": [str(value)]}
+    ]}]}]}
+
+def test_refresh_renders_prometheus_text(mocker):
+    client = mocker.Mock()
+    client.get_stats.return_value = stats_response(42)
+    exporter = MetricsExporter(client, "test_org", ["prod"])
+
+    text = exporter.refresh()
+
+    assert "# TYPE apigee_sum_message_count gauge" in text
+    assert 'apigee_sum_message_count{environment="prod",dimension="apis",name="orders-api"} 42.0' in text
+    assert "apigee_exporter_refresh_errors_total 0" in text
+    assert exporter.render() == text
+
+def test_render_does_not_call_api(mocker):
+    client = mocker.Mock()
+    client.get_stats.return_value = stats_response(1)
+    exporter = MetricsExporter(client, "test_org", ["prod", "test"])
+    exporter.refresh()
+
+    for _ in range(5):
+        exporter.render()
+
+    assert client.get_stats.call_count == 2
+
+def test_failed_refresh_keeps_last_metrics(mocker):
+    client = mocker.Mock()
+    client.get_stats.side_effect = [stats_response(7), Exception("HTTP error occurred: 503")]
+    exporter = MetricsExporter(client, "test_org", ["prod"])
+    exporter.refresh()
+
+    text = exporter.refresh()
+
+    assert "} 7.0" in text
+    assert exporter.refresh_errors == 1
+
+def test_overlapping_refreshes_are_coalesced(mocker):
+    started = threading.Event()
+    release = threading.Event()
+    client = mocker.Mock()
+
+    def slow_get_stats(*args):
+        started.set()
+        release.wait(5)
+        return stats_response(3)
+
+    client.get_stats.side_effect = slow_get_stats
+    exporter = MetricsExporter(client, "test_org", ["prod"])
+    leader = threading.Thread(target=exporter.refresh)
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=exporter.refresh) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join()
+
+    assert client.get_stats.call_count == 1
+
+def test_server_serves_metrics(mocker):
+    client = mocker.Mock()
+    client.get_stats.return_value = stats_response(5)
+    exporter = MetricsExporter(client, "test_org", ["prod"])
+    exporter.refresh()
+    server = exporter.make_server("127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+            body = response.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "apigee_sum_message_count" in body
+
+def test_partial_failure_keeps_last_values_of_failed_environment(mocker):
+    client = mocker.Mock()
+    responses = {"prod": [stats_response(7), Exception("HTTP error occurred: 503")], "test": [stats_response(1), stats_response(2)]}
+
+    def get_stats(org, env, dimension, select, time_range):
+        response = responses[env].pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client.get_stats.side_effect = get_stats
+    exporter = MetricsExporter(client, "test_org", ["prod", "test"])
+    exporter.refresh()
+
+    text = exporter.refresh()
+
+    assert 'environment="prod",dimension="apis",name="orders-api"} 7.0' in text
+    assert 'environment="test",dimension="apis",name="orders-api"} 2.0' in text
+    assert exporter.refresh_errors == 1
+
+def test_unusable_values_are_skipped(mocker):
+    client = mocker.Mock()
+    client.get_stats.return_value = stats_response(None)
+    client.get_stats.return_value["environments"][0]["dimensions"][0]["metrics"][0]["values"] = [None]
+    exporter = MetricsExporter(client, "test_org", ["prod"])
+
+    text = exporter.refresh()
+
+    assert "apigee_sum_message_count{" not in text
+    assert "apigee_exporter_refresh_errors_total 0" in text
+
+def test_background_refresher_survives_errors(mocker):
+    client = mocker.Mock()
+    client.get_stats.return_value = stats_response(1)
+    exporter = MetricsExporter(client, "test_org", ["prod"], interval=0.01)
+    exporter.start()
+    calls = []
+
+    def failing_refresh():
+        calls.append(1)
+        raise RuntimeError("render failed")
+
+    mocker.patch.object(exporter, "refresh", side_effect=failing_refresh)
+    time.sleep(0.1)
+    exporter.stop()
+
+    assert len(calls) > 1
+    assert exporter.refresh_errors >= 2
@@ -0,0 +1,26 @@
+from apigee_sdk.pagination import iter_listing, listing_url
+
+def test_listing_url():
+    assert listing_url("https://api.example.com/apps") == "https://api.example.com/apps"
+    assert listing_url("https://api.example.com/apps", expand=True, count=2, start_key="a b", count_param="rows") == \
+        "https://api.example.com/apps?expand=true&rows=2&startKey=a+b"
+
+def test_iter_listing_skips_repeated_start_key(mocker):
+    pages = {
+        None: {"developer": [{"email": "a"}, {"email": "b"}]},
+        "b": {"developer": [{"email": "b"}, {"email": "c"}]},
+        "c": {"developer": [{"email": "c"}]},
+    }
+    list_page = mocker.Mock(side_effect=lambda expand, count, start_key: pages[start_key])
+
+    entries = list(iter_listing(list_page, ("developer",), "email", page_size=2))
+
+    assert [entry["email"] for entry in entries] == ["a", "b", "c"]
+    assert list_page.call_count == 3
+    list_page.assert_any_call(expand=True, count=2, start_key="b")
+
+def test_iter_listing_handles_unexpanded_lists(mocker):
+    list_page = mocker.Mock(return_value=["app-1", "app-2"])
+
+    assert list(iter_listing(list_page, ("app",), "appId", page_size=1000)) == ["app-1", "app-2"]
+    list_page.assert_called_once_with(expand=True, count=1000, start_key=None)
@@ -86,5 +86,18 @@ class TestProductsClient(unittest.TestCase):
         )
         self.assertEqual(response, {"product": "updated"})
 
+    @patch("requests.get")
+    def test_list_products_expanded(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"apiProduct": [{"name": "orders"}]}
+        mock_response.status_code = 200
+        mock_get.return_value = mock_response
+
+        self.assertEqual(list(self.client.iter_products()), [{"name": "orders"}])
+        mock_get.assert_called_once_with(
+            "https://api.example.com/products?expand=true&count=1000",
+            headers={"Authorization": "Bearer test-token"}
+        )
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
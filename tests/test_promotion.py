@@ -0,0 +1,58 @@
+from apigee_sdk.promotion import PromotionPipeline
+
+def make_client(mocker, failing_env=None):
+    client = mocker.Mock()
+
+    def wait_for_deployment(org, env, api, revision, bearer, timeout, interval):
+        if env == failing_env:
+            raise Exception(f"Deployment of {api} revision {revision} to {env} failed")
+        return {"revision": [{"name": revision, "state": "deployed"}]}
+
+    client.wait_for_deployment.side_effect = wait_for_deployment
+    return client
+
+def test_promote_runs_every_stage(mocker):
+    client = make_client(mocker)
+    pipeline = PromotionPipeline(client, "test_token", ["dev", ["uat", "uat-eu"], "prod"], poll_interval=0)
+
+    report = pipeline.promote("test_org", {"api-a": "3", "api-b": "7"})
+
+    assert report["completed"] is True
+    assert [stage["environments"] for stage in report["stages"]] == [["dev"], ["uat", "uat-eu"], ["prod"]]
+    assert len(report["stages"][1]["results"]) == 4
+    assert client.deploy_proxy_revision.call_count == 8
+    assert all(stage["elapsed"] >= 0 for stage in report["stages"])
+
+def test_promote_stops_on_failed_stage(mocker):
+    client = make_client(mocker, failing_env="test")
+    pipeline = PromotionPipeline(client, "test_token", ["dev", "test", "prod"], poll_interval=0)
+
+    report = pipeline.promote("test_org", {"api-a": "3"})
+
+    assert report["completed"] is False
+    assert len(report["stages"]) == 2
+    assert report["stages"][1]["passed"] is False
+    assert "failed" in report["stages"][1]["results"][0]["error"]
+    deployed_envs = [call.args[1] for call in client.deploy_proxy_revision.call_args_list]
+    assert "prod" not in deployed_envs
+
+def test_promote_gate_rejects_next_stage(mocker):
+    client = make_client(mocker)
+    mock_sleep = mocker.patch("apigee_sdk.promotion.time.sleep")
+    gate = mocker.Mock(return_value=False)
+    pipeline = PromotionPipeline(client, "test_token", ["dev", "prod"], gate=gate, gate_delay=30, poll_interval=0)
+
+    report = pipeline.promote("test_org", {"api-a": "3"})
+
+    assert report["completed"] is False
+    assert len(report["stages"]) == 1
+    gate.assert_called_once_with(report["stages"][0])
+    mock_sleep.assert_not_called()
+
+def test_promote_deploys_with_override(mocker):
+    client = make_client(mocker)
+
+    PromotionPipeline(client, "test_token", ["dev"], poll_interval=0).promote("test_org", {"api-a": "3"})
+    PromotionPipeline(client, "test_token", ["dev"], poll_interval=0, override=False).promote("test_org", {"api-a": "3"})
+
+    assert [call.kwargs["override"] for call in client.deploy_proxy_revision.call_args_list] == [True, False]
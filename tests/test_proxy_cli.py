@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 from click.testing import CliRunner
@@ -300,5 +302,182 @@ class TestProxyCLI(unittest.TestCase):
         self.assertIn("list-user-roles", result.output)
         self.assertIn("update-user-role", result.output)
 
+    @patch("apigee_sdk.proxy_client.ProxyClient.rollback_many")
+    def test_proxy_rollback(self, mock_rollback_many):
+        mock_rollback_many.return_value = iter([{"api": "test-api", "result": {"revision": "4"}, "error": None, "elapsed": 0.1}])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            journal = os.path.join(tmp_dir, 'journal.jsonl')
+            result = self.runner.invoke(cli, ['proxy', 'rollback', '--base-url', 'https://api.example.com', '--token', 'test-token', '--org', 'test-org', '--env', 'prod', '--api', 'test-api', '--journal', journal])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn("test-api", result.output)
+        mock_rollback_many.assert_called_once_with('test-org', 'prod', ('test-api',), 'test-token', max_workers=8)
+
+    @patch("apigee_sdk.analytics_store.AnalyticsStore.sync")
+    def test_analytics_sync(self, mock_sync):
+        mock_sync.return_value = 24
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = self.runner.invoke(cli, ['analytics', 'sync', '--base-url', 'https://api.example.com', '--token', 'test-token', '--org', 'test-org', '--env', 'prod', '--select', 'sum(message_count)', '--store', os.path.join(tmp_dir, 'analytics.db')])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn("'written': 24", result.output)
+
+    @patch("apigee_sdk.developer_app_client.DeveloperAppClient.bulk_api_key_action")
+    @patch("apigee_sdk.developer_app_client.DeveloperAppClient.select_api_keys")
+    def test_app_bulk_key_action(self, mock_select_api_keys, mock_bulk_api_key_action):
+        mock_select_api_keys.return_value = [("app-1", "key-1")]
+        mock_bulk_api_key_action.return_value = iter([{"app_id": "app-1", "api_key_id": "key-1", "status": "ok"}])
+
+        result = self.runner.invoke(cli, ['app', 'bulk-key-action', 'revoke', '--base-url', 'https://api.example.com', '--token', 'test-token', '--product', 'orders', '--attribute', 'tier=gold'])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn("1 of 1 keys processed successfully.", result.output)
+        mock_select_api_keys.assert_called_once_with(developer=None, product='orders', attribute=('tier', 'gold'), status=None)
+
+    @patch("apigee_sdk.developer_app_client.DeveloperAppClient.bulk_api_key_action")
+    @patch("apigee_sdk.developer_app_client.DeveloperAppClient.select_api_keys")
+    def test_app_bulk_key_action_requires_selector(self, mock_select_api_keys, mock_bulk_api_key_action):
+        base = ['app', 'bulk-key-action', 'revoke', '--base-url', 'https://api.example.com', '--token', 'test-token']
+
+        result = self.runner.invoke(cli, base)
+        unconfirmed = self.runner.invoke(cli, base + ['--all'])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertNotEqual(unconfirmed.exit_code, 0)
+        self.assertIn("--all together with --yes", result.output)
+        mock_select_api_keys.assert_not_called()
+        mock_bulk_api_key_action.assert_not_called()
+
+        mock_select_api_keys.return_value = [("app-1", "key-1"), ("app-2", "key-2")]
+        result = self.runner.invoke(cli, base + ['--all', '--yes', '--dry-run'])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn("2 keys selected.", result.output)
+        self.assertIn("app-2:key-2", result.output)
+        mock_bulk_api_key_action.assert_not_called()
+
+    @patch("apigee_sdk.developer_app_client.DeveloperAppClient.bulk_api_key_action")
+    @patch("apigee_sdk.developer_app_client.DeveloperAppClient.select_api_keys")
+    def test_app_bulk_key_action_explicit_keys(self, mock_select_api_keys, mock_bulk_api_key_action):
+        mock_bulk_api_key_action.return_value = iter([{"app_id": "app-1", "api_key_id": "key-1", "status": "ok"}])
+
+        result = self.runner.invoke(cli, ['app', 'bulk-key-action', 'approve', '--base-url', 'https://api.example.com', '--token', 'test-token', '--key', 'app-1:key-1'])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn("1 keys selected.", result.output)
+        mock_select_api_keys.assert_not_called()
+        self.assertEqual(mock_bulk_api_key_action.call_args.args, ('approve', [('app-1', 'key-1')]))
+
+    @patch("apigee_sdk.key_rotation.KeyRotation.run")
+    def test_app_rotate_keys(self, mock_run):
+        mock_run.return_value = {"added": 2, "adopted": 0, "skipped": 0, "revoked": 2, "failed": []}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = self.runner.invoke(cli, ['app', 'rotate-keys', '--base-url', 'https://api.example.com', '--token', 'test-token', '--checkpoint', os.path.join(tmp_dir, 'rotation.jsonl'), '--app-id', 'app-1', '--app-id', 'app-2'])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn("'revoked': 2", result.output)
+        mock_run.assert_called_once_with(('app-1', 'app-2'), export_path=None, wait=False)
+
+    @patch("apigee_sdk.developer_app_client.DeveloperAppClient.select_api_keys")
+    def test_app_rotate_keys_requires_selector(self, mock_select_api_keys):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = self.runner.invoke(cli, ['app', 'rotate-keys', '--base-url', 'https://api.example.com', '--token', 'test-token', '--checkpoint', os.path.join(tmp_dir, 'rotation.jsonl')])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("--all", result.output)
+        mock_select_api_keys.assert_not_called()
+
+    @patch("apigee_sdk.key_rotation.KeyRotation.revoke_old_keys")
+    def test_app_revoke_old_keys(self, mock_revoke_old_keys):
+        mock_revoke_old_keys.return_value = iter([{"app_id": "app-1", "status": "revoked", "error": None}])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint = os.path.join(tmp_dir, 'rotation.jsonl')
+            missing = self.runner.invoke(cli, ['app', 'revoke-old-keys', '--base-url', 'https://api.example.com', '--token', 'test-token', '--checkpoint', checkpoint])
+            with open(checkpoint, 'w') as f:
+                f.write('{"event": "added", "app_id": "app-1", "old_keys": ["key-1"], "new_key": "key-2", "at": 0, "overlap": 60}\n')
+            result = self.runner.invoke(cli, ['app', 'revoke-old-keys', '--base-url', 'https://api.example.com', '--token', 'test-token', '--checkpoint', checkpoint])
+        self.assertNotEqual(missing.exit_code, 0)
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn("'status': 'revoked'", result.output)
+        self.assertIn("'pending': 1", result.output)
+
+    @patch("apigee_sdk.key_index.ConsumerKeyIndex.lookup")
+    @patch("apigee_sdk.key_index.ConsumerKeyIndex.refresh")
+    def test_app_lookup_key(self, mock_refresh, mock_lookup):
+        mock_refresh.return_value = {"updated": 1, "unchanged": 0, "removed": 0}
+        mock_lookup.side_effect = lambda key: {"consumer_key": key, "app_id": "app-1"} if key == "key-1" else None
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index = os.path.join(tmp_dir, 'keys.db')
+            result = self.runner.invoke(cli, ['app', 'lookup-key', 'key-1', '--index', index, '--refresh', '--base-url', 'https://api.example.com', '--token', 'test-token'])
+            missing = self.runner.invoke(cli, ['app', 'lookup-key', 'key-2', '--index', index])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn("'app_id': 'app-1'", result.output)
+        self.assertEqual(missing.exit_code, 1)
+        mock_refresh.assert_called_once()
+
+    @patch("apigee_sdk.kvm_client.KVMClient.sync_kvm")
+    def test_sync_kvm(self, mock_sync_kvm):
+        mock_sync_kvm.return_value = {"inserted": 0, "updated": 12, "deleted": 0, "unchanged": 49988, "failed": []}
+
+        result = self.runner.invoke(cli, ['kvm', 'sync-kvm', '--base-url', 'https://api.example.com', '--token', 'test-token', '--kvm-id', 'config', '--source', 'entries.csv', '--no-delete'])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn("'updated': 12", result.output)
+        mock_sync_kvm.assert_called_once_with('config', 'entries.csv', format=None, delete=False, dry_run=False, max_workers=8)
+
+    @patch("apigee_sdk.kvm_snapshot.snapshot_kvm")
+    def test_snapshot_kvm(self, mock_snapshot_kvm):
+        mock_snapshot_kvm.return_value = 3
+
+        result = self.runner.invoke(cli, ['kvm', 'snapshot-kvm', '--base-url', 'https://api.example.com', '--token', 'test-token', '--kvm-id', 'config', '--output', 'config.snapshot'])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn("'entries': 3", result.output)
+
+    @patch("apigee_sdk.kvm_client.KVMClient.import_kvm")
+    @patch("apigee_sdk.kvm_client.KVMClient.export_kvm")
+    def test_export_and_import_kvm(self, mock_export_kvm, mock_import_kvm):
+        mock_export_kvm.return_value = 5
+        mock_import_kvm.return_value = {"imported": 5, "failures": 0, "failed": []}
+
+        exported = self.runner.invoke(cli, ['kvm', 'export-kvm', '--base-url', 'https://api.example.com', '--token', 'test-token', '--kvm-id', 'config', '--output', 'config.ndjson.gz'])
+        imported = self.runner.invoke(cli, ['kvm', 'import-kvm', '--base-url', 'https://api.example.com', '--token', 'test-token', '--kvm-id', 'config', '--source', 'config.ndjson.gz', '--overwrite'])
+        self.assertEqual(exported.exit_code, 0, msg=f"Output: {exported.output}")
+        self.assertIn("'exported': 5", exported.output)
+        self.assertEqual(imported.exit_code, 0, msg=f"Output: {imported.output}")
+        mock_import_kvm.assert_called_once_with('config', 'config.ndjson.gz', overwrite=True, max_workers=8, batch_size=100)
+
+    @patch("apigee_sdk.scopes.ScopedClients.clear_cache_entries")
+    def test_clear_cache_entries(self, mock_clear_cache_entries):
+        mock_clear_cache_entries.return_value = iter([
+            {"environment": "test", "status": "cleared", "error": None, "elapsed": 0.2},
+            {"environment": "prod", "status": "failed", "error": "404 Client Error", "elapsed": 0.1},
+        ])
+
+        result = self.runner.invoke(cli, ['caches', 'clear-entries', '--base-url', 'https://api.example.com', '--token', 'test-token', '--org', 'acme', '--env', 'test', '--env', 'prod', '--cache', 'products'])
+        self.assertEqual(result.exit_code, 1, msg=f"Output: {result.output}")
+        self.assertIn("'environment': 'test'", result.output)
+        mock_clear_cache_entries.assert_called_once_with('acme', ('test', 'prod'), 'products', prefix=None, max_workers=8)
+
+    @patch("apigee_sdk.developer_sync.DeveloperSync.sync")
+    def test_sync_developers(self, mock_sync):
+        mock_sync.return_value = iter([{"event": "deleted", "developer_id": "dev-1", "developer": None}])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = self.runner.invoke(cli, ['developers', 'sync-developers', '--base-url', 'https://api.example.com', '--token', 'test-token', '--state', os.path.join(tmp_dir, 'developers.json')])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn('{"event": "deleted", "developer_id": "dev-1", "developer": null}', result.output)
+
+    @patch("apigee_sdk.user_roles_client.UserRolesClient.list_role_users")
+    @patch("apigee_sdk.users_client.UsersClient.list_users")
+    def test_provision_users_dry_run(self, mock_list_users, mock_list_role_users):
+        mock_list_users.return_value = []
+        mock_list_role_users.return_value = []
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, 'users.csv')
+            with open(source, 'w') as f:
+                f.write("emailId,firstName,roles\nann@example.com,Ann,devadmin\n")
+            result = self.runner.invoke(cli, ['users', 'provision', '--base-url', 'https://api.example.com', '--token', 'test-token', '--source', source, '--dry-run'])
+        self.assertEqual(result.exit_code, 0, msg=f"Output: {result.output}")
+        self.assertIn('"action": "create_user"', result.output)
+        self.assertIn('{"action": "add_role", "user": "ann@example.com", "role": "devadmin"}', result.output)
+        self.assertIn("2 changes planned.", result.output)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -180,4 +180,247 @@ def test_delete_proxy_revision(mocker):
     client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
     response = client.delete_proxy_revision("test_org", "test_api", "1", "test_token")
 
-    assert response["message"] == "Proxy revision deleted successfully"
\ No newline at end of file
+    assert response["message"] == "Proxy revision deleted successfully"
+
+def test_wait_for_deployment(mocker):
+    pending = mocker.Mock()
+    pending.status_code = 200
+    pending.json.return_value = {"revision": [{"name": "2", "state": "deployed"}, {"name": "3", "state": "pending"}]}
+    ready = mocker.Mock()
+    ready.status_code = 200
+    ready.json.return_value = {"revision": [{"name": "3", "state": "deployed"}]}
+    mock_get = mocker.patch("requests.get", side_effect=[pending, ready])
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+    response = client.wait_for_deployment("test_org", "test_env", "test_api", "3", "test_token", interval=0)
+
+    assert mock_get.call_count == 2
+    assert response["revision"][0]["state"] == "deployed"
+
+def test_wait_for_deployment_error(mocker):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"revision": [{"name": "3", "state": "error"}]}
+    mocker.patch("requests.get", return_value=mock_response)
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+    with pytest.raises(Exception, match="failed"):
+        client.wait_for_deployment("test_org", "test_env", "test_api", "3", "test_token", interval=0)
+
+def test_rollback_uses_journal(mocker, tmp_path):
+    from apigee_sdk.deployment_journal import DeploymentJournal
+
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {}
+    mock_post = mocker.patch("requests.post", return_value=mock_response)
+    mock_delete = mocker.patch("requests.delete", return_value=mock_response)
+    mock_get = mocker.patch("requests.get")
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token", journal=DeploymentJournal(str(tmp_path / "journal.jsonl")))
+    client.deploy_proxy_revision("test_org", "prod", "test_api", "4", "test_token")
+    client.deploy_proxy_revision("test_org", "prod", "test_api", "5", "test_token")
+    response = client.rollback("test_org", "prod", "test_api", "test_token")
+
+    assert response == {"api": "test_api", "environment": "prod", "revision": "4", "rolled_back_revision": "5"}
+    assert mock_post.call_args[0][0].endswith("/environments/prod/apis/test_api/revisions/4/deployments?override=true")
+    assert mock_delete.call_args[0][0].endswith("/environments/prod/apis/test_api/revisions/5/deployments")
+    mock_get.assert_not_called()
+    assert client.journal.current_revision("test_org", "prod", "test_api") == "4"
+
+def test_rollback_many(mocker, tmp_path):
+    from apigee_sdk.deployment_journal import DeploymentJournal
+
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {}
+    mocker.patch("requests.post", return_value=mock_response)
+    mocker.patch("requests.delete", return_value=mock_response)
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token", journal=DeploymentJournal(str(tmp_path / "journal.jsonl")))
+    for api in ("api-a", "api-b"):
+        client.deploy_proxy_revision("test_org", "prod", api, "1", "test_token")
+        client.deploy_proxy_revision("test_org", "prod", api, "2", "test_token")
+
+    results = {result["api"]: result for result in client.rollback_many("test_org", "prod", ["api-a", "api-b", "api-c"], "test_token")}
+
+    assert results["api-a"]["result"]["revision"] == "1"
+    assert results["api-b"]["error"] is None
+    assert "No previous revision" in results["api-c"]["error"]
+
+def test_rollback_records_partial_rollback(mocker, tmp_path):
+    import json
+    from apigee_sdk.deployment_journal import DeploymentJournal
+
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {}
+    mocker.patch("requests.post", return_value=mock_response)
+    mocker.patch("requests.delete", side_effect=Exception("connection reset"))
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token", journal=DeploymentJournal(str(tmp_path / "journal.jsonl")))
+    client.deploy_proxy_revision("test_org", "prod", "test_api", "4", "test_token")
+    client.deploy_proxy_revision("test_org", "prod", "test_api", "5", "test_token")
+    with pytest.raises(Exception, match="undeploying revision 5 failed"):
+        client.rollback("test_org", "prod", "test_api", "test_token")
+
+    assert client.journal.current_revision("test_org", "prod", "test_api") == "4"
+    with open(tmp_path / "journal.jsonl") as journal:
+        entry = json.loads(journal.readlines()[-1])
+    assert entry["action"] == "rollback"
+    assert entry["partial"] is True
+    assert "connection reset" in entry["undeploy_error"]
+
+def test_rollback_many_deduplicates_apis(mocker, tmp_path):
+    from apigee_sdk.deployment_journal import DeploymentJournal
+
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {}
+    mocker.patch("requests.post", return_value=mock_response)
+    mock_delete = mocker.patch("requests.delete", return_value=mock_response)
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token", journal=DeploymentJournal(str(tmp_path / "journal.jsonl")))
+    for revision in ("1", "2", "3"):
+        client.deploy_proxy_revision("test_org", "prod", "test_api", revision, "test_token")
+
+    results = list(client.rollback_many("test_org", "prod", ["test_api", "test_api"], "test_token"))
+
+    assert len(results) == 1
+    assert results[0]["result"]["revision"] == "2"
+    assert mock_delete.call_count == 1
+
+def test_latest_revision(mocker):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = ["1", "10", "9"]
+    mocker.patch("requests.get", return_value=mock_response)
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+
+    assert client.latest_revision("test_org", "test_api", "test_token") == "10"
+
+def test_bulk_update_policies(mocker):
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+    mocker.patch.object(client, "list_apis", return_value=["orders-v1", "orders-v2", "payments"])
+    mocker.patch.object(client, "list_proxy_revisions", return_value=["1", "2"])
+    mocker.patch.object(client, "get_proxy_revision_details", side_effect=lambda org, api, revision, bearer: {
+        "policies": ["Verify-API-Key"] if api == "orders-v1" else ["Quota"]
+    })
+    mock_clone = mocker.patch.object(client, "clone_proxy_revision", return_value={"revision": "3"})
+    mock_update = mocker.patch.object(client, "update_proxy_policies", return_value={})
+    mock_deploy = mocker.patch.object(client, "deploy_proxy_revision", return_value={})
+
+    payload = {"name": "Verify-API-Key"}
+    results = {result["api"]: result for result in client.bulk_update_policies(
+        "test_org", payload, "test_token", pattern="orders-*", contains_policy="Verify-API-Key", deploy_env="test"
+    )}
+
+    assert set(results) == {"orders-v1", "orders-v2"}
+    assert results["orders-v1"]["status"] == "updated"
+    assert results["orders-v1"]["base_revision"] == "2"
+    assert results["orders-v1"]["revision"] == "3"
+    assert results["orders-v2"]["status"] == "skipped"
+    mock_clone.assert_called_once_with("test_org", "orders-v1", "2", "test_token")
+    mock_update.assert_called_once_with("test_org", "orders-v1", "3", payload, "test_token")
+    mock_deploy.assert_called_once_with("test_org", "test", "orders-v1", "3", "test_token", override=True)
+
+    list(client.bulk_update_policies("test_org", payload, "test_token", apis=["orders-v1"], deploy_env="test",
+                                     override=False))
+    mock_deploy.assert_called_with("test_org", "test", "orders-v1", "3", "test_token", override=False)
+
+def test_bulk_update_policies_reports_failures(mocker):
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+    mocker.patch.object(client, "list_proxy_revisions", side_effect=Exception("Error 404: not found"))
+
+    results = list(client.bulk_update_policies("test_org", {}, "test_token", apis=["missing-api"]))
+
+    assert results[0]["status"] == "failed"
+    assert "404" in results[0]["error"]
+
+def test_clone_proxy_revision_exports_and_imports_bundle(mocker):
+    exported = mocker.Mock()
+    exported.status_code = 200
+    exported.content = b"PK\x03\x04bundle"
+    imported = mocker.Mock()
+    imported.status_code = 201
+    imported.json.return_value = {"name": "orders", "revision": "4"}
+    mock_get = mocker.patch("requests.get", return_value=exported)
+    mock_post = mocker.patch("requests.post", return_value=imported)
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+    response = client.clone_proxy_revision("test_org", "orders", "3", "test_token")
+
+    assert response["revision"] == "4"
+    mock_get.assert_called_once_with(
+        "https://api.enterprise.apigee.com/v1/organizations/test_org/apis/orders/revisions/3?format=bundle",
+        headers={"Authorization": "Bearer test_token"},
+    )
+    mock_post.assert_called_once_with(
+        "https://api.enterprise.apigee.com/v1/organizations/test_org/apis?action=import&name=orders",
+        headers={"Authorization": "Bearer test_token"},
+        files={"file": ("orders.zip", b"PK\x03\x04bundle", "application/zip")},
+    )
+
+def test_list_debug_transactions(mocker):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = ["tx-1", "tx-2"]
+    mock_get = mocker.patch("requests.get", return_value=mock_response)
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+    response = client.list_debug_transactions("test_org", "test_env", "test_api", "1", "session-1", "test_token")
+
+    assert response == ["tx-1", "tx-2"]
+    assert mock_get.call_args[0][0].endswith("/debugsessions/session-1/data")
+
+def test_get_api_metrics_with_query_parameters(mocker):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"environments": []}
+    mock_get = mocker.patch("requests.get", return_value=mock_response)
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+    client.get_api_metrics("test_org", "test_env", "test_token", select="sum(message_count)", time_unit="hour")
+
+    assert mock_get.call_args.kwargs["params"] == {"select": "sum(message_count)", "timeUnit": "hour"}
+
+def test_list_apis_expanded(mocker):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = [{"name": "api1", "revision": ["1", "2"]}]
+    mock_get = mocker.patch("requests.get", return_value=mock_response)
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+    response = client.list_apis("test_org", "test_token", expand=True)
+
+    assert response == [{"name": "api1", "revision": ["1", "2"]}]
+    assert mock_get.call_args[0][0] == \
+        "https://api.enterprise.apigee.com/v1/organizations/test_org/apis?includeRevisions=true&includeMetaData=true"
+
+def test_bulk_update_policies_uses_revisions_from_listing(mocker):
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+    mocker.patch.object(client, "list_apis", return_value=[{"name": "orders", "revision": ["2", "10"]}])
+    mock_revisions = mocker.patch.object(client, "list_proxy_revisions")
+    mock_clone = mocker.patch.object(client, "clone_proxy_revision", return_value={"revision": "11"})
+    mocker.patch.object(client, "update_proxy_policies", return_value={})
+
+    results = list(client.bulk_update_policies("test_org", {"name": "Quota"}, "test_token"))
+
+    assert results[0]["base_revision"] == "10"
+    mock_clone.assert_called_once_with("test_org", "orders", "10", "test_token")
+    mock_revisions.assert_not_called()
+
+def test_deploy_proxy_revision_with_override(mocker):
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"state": "deployed"}
+    mock_post = mocker.patch("requests.post", return_value=mock_response)
+
+    client = ProxyClient("https://api.enterprise.apigee.com", "test_token")
+    client.deploy_proxy_revision("test_org", "test_env", "test_api", "2", "test_token", override=True)
+
+    mock_post.assert_called_once_with(
+        "https://api.enterprise.apigee.com/v1/organizations/test_org/environments/test_env/apis/test_api/revisions/2/deployments?override=true",
+        headers={"Authorization": "Bearer test_token"},
+    )
@@ -0,0 +1,54 @@
+import pytest
+
+from apigee_sdk.scopes import ScopedClients, scope_url
+
+BASE_URL = "https://api.enterprise.apigee.com"
+
+def test_scope_url():
+    assert scope_url(BASE_URL, "acme") == f"{BASE_URL}/v1/organizations/acme"
+    assert scope_url(BASE_URL, "acme", env="prod") == f"{BASE_URL}/v1/organizations/acme/environments/prod"
+    assert scope_url(BASE_URL, "acme", api="orders") == f"{BASE_URL}/v1/organizations/acme/apis/orders"
+    with pytest.raises(ValueError):
+        scope_url(BASE_URL, "acme", env="prod", api="orders")
+
+def test_clients_share_one_session(mocker):
+    session = mocker.Mock()
+    session.get.return_value.json.return_value = ["config"]
+    clients = ScopedClients(BASE_URL + "/", "test-token", session=session)
+
+    prod, test = clients.kvm("acme", env="prod"), clients.kvm("acme", env="test")
+    prod.list_kvms()
+    clients.kvm("acme", api="orders").fetch_kvm_details("settings")
+    clients.caches("acme", "prod").list_caches()
+
+    assert clients.kvm("acme", env="prod") is prod
+    assert prod is not test
+    assert [call.args[0] for call in session.get.call_args_list] == [
+        f"{BASE_URL}/v1/organizations/acme/environments/prod/keyvaluemaps",
+        f"{BASE_URL}/v1/organizations/acme/apis/orders/keyvaluemaps/settings",
+        f"{BASE_URL}/v1/organizations/acme/environments/prod/caches",
+    ]
+    session.get.assert_called_with(f"{BASE_URL}/v1/organizations/acme/environments/prod/caches",
+                                   headers={"Authorization": "Bearer test-token"})
+
+def test_default_session_is_pooled():
+    with ScopedClients(BASE_URL, "test-token", pool_size=4) as clients:
+        adapter = clients.session.get_adapter(BASE_URL)
+        assert adapter._pool_maxsize == 4
+        assert clients.kvm("acme").session is clients.session
+
+def test_clear_cache_entries_across_environments(mocker):
+    session = mocker.Mock()
+    ok, failed = mocker.Mock(content=b""), mocker.Mock(content=b"")
+    failed.raise_for_status.side_effect = Exception("404 Client Error")
+    session.post.side_effect = lambda url, headers: failed if "/environments/dev/" in url else ok
+    clients = ScopedClients(BASE_URL, "test-token", session=session)
+
+    results = {result["environment"]: result for result in clients.clear_cache_entries("acme", ["dev", "test", "prod"], "products")}
+
+    assert results["prod"]["status"] == "cleared"
+    assert results["dev"]["status"] == "failed"
+    assert "404" in results["dev"]["error"]
+    assert all(result["elapsed"] >= 0 for result in results.values())
+    session.post.assert_any_call(f"{BASE_URL}/v1/organizations/acme/environments/test/caches/products/entries?action=clear",
+                                 headers={"Authorization": "Bearer test-token"})
@@ -0,0 +1,61 @@
+import gzip
+import json
+
+from apigee_sdk import trace_analysis
+from apigee_sdk.trace_analysis import TraceLatencyAnalyzer, analyze_file, parse_transaction
+
+def debug_point(point_id, timestamp, **properties):
+    return {"id": point_id, "results": [{
+        "ActionResult": "DebugInfo",
+        "timestamp": f"19-10-26 10:00:{timestamp}",
+        "properties": {"property": [{"name": name, "value": value} for name, value in properties.items()]},
+    }]}
+
+def make_transaction(policy_ms, backend_ms):
+    return {"point": [
+        debug_point("StateChange", "00:000", To="PROXY_REQ_FLOW"),
+        debug_point("Execution", f"00:{policy_ms:03d}", **{"stepDefinition-name": "Verify-API-Key"}),
+        debug_point("StateChange", f"00:{policy_ms + 1:03d}", To="REQ_SENT"),
+        debug_point("StateChange", f"00:{policy_ms + 1 + backend_ms:03d}", To="RESP_START"),
+        debug_point("StateChange", f"00:{policy_ms + 2 + backend_ms:03d}", To="RESP_SENT"),
+    ]}
+
+def test_parse_transaction():
+    records = parse_transaction({"api": "orders-api", "transaction": make_transaction(5, 40)})
+
+    assert ("policy", "Verify-API-Key", 5.0) in records
+    assert ("flow", "PROXY_REQ_FLOW", 6.0) in records
+    assert ("target", "orders-api", 40.0) in records
+
+def test_report_percentiles():
+    analyzer = TraceLatencyAnalyzer().add_all(make_transaction(ms, 100) for ms in range(1, 101))
+
+    rows = {(row["kind"], row["name"]): row for row in analyzer.report()}
+    policy = rows[("policy", "Verify-API-Key")]
+
+    assert analyzer.transactions == 100
+    assert policy["count"] == 100
+    assert policy["p50"] == 50.5
+    assert round(policy["p99"], 2) == 99.01
+    assert policy["max"] == 100.0
+    assert rows[("target", "target")]["p95"] == 100.0
+
+def test_report_without_numpy(monkeypatch):
+    monkeypatch.setattr(trace_analysis, "numpy", None)
+    analyzer = TraceLatencyAnalyzer().add_all(make_transaction(ms, 10) for ms in (1, 2, 3, 4))
+
+    rows = {(row["kind"], row["name"]): row for row in analyzer.report(percentiles=(50,))}
+
+    assert rows[("policy", "Verify-API-Key")]["p50"] == 2.5
+    assert rows[("policy", "Verify-API-Key")]["mean"] == 2.5
+
+def test_analyze_file_streams_gzip(tmp_path):
+    path = tmp_path / "traces.ndjson.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as output:
+        for ms in (10, 20, 30):
+            output.write(json.dumps({"api": "orders-api", "transaction": make_transaction(ms, 50)}) + "\n")
+
+    rows = {(row["kind"], row["name"]): row for row in analyze_file(str(path))}
+
+    assert rows[("policy", "Verify-API-Key")]["p50"] == 20.0
+    assert rows[("target", "orders-api")]["count"] == 3
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from apigee_sdk.trace_capture import TraceCapture
+
+def make_client(mocker):
+    client = mocker.Mock()
+    polls = {"orders-api": [["tx-1"], ["tx-1", "tx-2"]], "payments-api": [[], ["tx-9"]]}
+
+    def list_debug_transactions(org, env, api, revision, session, bearer):
+        history = polls[api]
+        return history.pop(0) if len(history) > 1 else history[0]
+
+    client.list_debug_transactions.side_effect = list_debug_transactions
+    client.get_debug_transaction.side_effect = lambda org, env, api, revision, session, transaction_id, bearer: {"id": transaction_id}
+    return client
+
+def test_transactions_are_streamed_and_sessions_deleted(mocker):
+    mocker.patch("apigee_sdk.trace_capture.time.sleep")
+    client = make_client(mocker)
+    targets = [("test", "orders-api", "3"), ("prod", "payments-api", "8")]
+
+    with TraceCapture(client, "test_org", targets, "test_token", session="s1", poll_interval=0) as capture:
+        transactions = list(capture.transactions(max_transactions=3))
+
+    assert sorted(transaction["transaction_id"] for transaction in transactions) == ["tx-1", "tx-2", "tx-9"]
+    assert transactions[0]["transaction"] == {"id": transactions[0]["transaction_id"]}
+    assert client.start_debug_session.call_count == 2
+    client.start_debug_session.assert_any_call("test_org", "test", "orders-api", "3", "test_token", session="s1")
+    client.delete_debug_session.assert_any_call("test_org", "prod", "payments-api", "8", "s1", "test_token")
+    assert client.delete_debug_session.call_count == 2
+
+def test_write_ndjson(mocker, tmp_path):
+    mocker.patch("apigee_sdk.trace_capture.time.sleep")
+    client = make_client(mocker)
+    path = tmp_path / "traces.ndjson"
+
+    with TraceCapture(client, "test_org", [("test", "orders-api", "3")], "test_token", poll_interval=0) as capture:
+        count = capture.write_ndjson(str(path), max_transactions=2)
+
+    lines = path.read_text().splitlines()
+    assert count == 2
+    assert [json.loads(line)["transaction_id"] for line in lines] == ["tx-1", "tx-2"]
+
+def test_start_failure_cleans_up_started_sessions(mocker):
+    def start_debug_session(org, env, api, revision, bearer, session):
+        if api == "missing-api":
+            raise Exception("Error 404: not deployed")
+        return {}
+
+    client = mocker.Mock()
+    client.start_debug_session.side_effect = start_debug_session
+    capture = TraceCapture(client, "test_org", [("test", "orders-api", "3"), ("test", "missing-api", "1")], "test_token")
+
+    with pytest.raises(Exception, match="Failed to start debug sessions"):
+        capture.start()
+
+    client.delete_debug_session.assert_called_once()
+    assert capture.started == []
+
+def test_failed_fetches_are_retried_and_reported(mocker):
+    mocker.patch("apigee_sdk.trace_capture.time.sleep")
+    client = mocker.Mock()
+    client.list_debug_transactions.side_effect = [Exception("Error 503: unavailable"), ["tx-1"], ["tx-1"], ["tx-1"]]
+    client.get_debug_transaction.side_effect = [Exception("Error 500: failed"), {"id": "tx-1"}]
+
+    with TraceCapture(client, "test_org", [("test", "orders-api", "3")], "test_token", poll_interval=0) as capture:
+        transactions = list(capture.transactions(max_transactions=1))
+
+    assert [transaction["transaction_id"] for transaction in transactions] == ["tx-1"]
+    assert [(error["transaction_id"], error["error"]) for error in capture.errors] == [
+        (None, "Error 503: unavailable"), ("tx-1", "Error 500: failed")]
+
+def test_fetch_is_given_up_after_max_attempts(mocker):
+    mocker.patch("apigee_sdk.trace_capture.time.sleep")
+    client = mocker.Mock()
+    client.list_debug_transactions.return_value = ["tx-1"]
+    client.get_debug_transaction.side_effect = Exception("Error 500: failed")
+
+    with TraceCapture(client, "test_org", [("test", "orders-api", "3")], "test_token", poll_interval=0,
+                      max_attempts=2) as capture:
+        transactions = list(capture.transactions(duration=0.2))
+
+    assert transactions == []
+    assert client.get_debug_transaction.call_count == 2
+    assert len(capture.errors) == 2
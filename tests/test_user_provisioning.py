@@ -0,0 +1,151 @@
+import pytest
+import requests
+
+from apigee_sdk.user_provisioning import UserProvisioner, read_users
+
+def make_clients(mocker):
+    users_client, roles_client = mocker.Mock(), mocker.Mock()
+    users_client.list_users.return_value = {"user": [{"name": "ann@example.com"}, {"name": "bob@example.com"}]}
+    users_client.fetch_user_details.side_effect = lambda email: {
+        "ann@example.com": {"emailId": "ann@example.com", "firstName": "Ann", "lastName": "Lee"},
+        "bob@example.com": {"emailId": "bob@example.com", "firstName": "Bob", "lastName": "Old"},
+    }[email]
+    roles_client.list_role_users.side_effect = lambda role: {
+        "devadmin": ["ann@example.com", "bob@example.com"],
+        "opsadmin": ["ann@example.com"],
+    }[role]
+    return users_client, roles_client
+
+def test_read_users_from_csv(tmp_path):
+    source = tmp_path / "users.csv"
+    source.write_text("emailId,firstName,lastName,roles\nann@example.com,Ann,,devadmin; opsadmin\nbob@example.com,Bob,Lee,\n")
+
+    assert read_users(str(source)) == [
+        {"emailId": "ann@example.com", "firstName": "Ann", "roles": ["devadmin", "opsadmin"]},
+        {"emailId": "bob@example.com", "firstName": "Bob", "lastName": "Lee", "roles": []},
+    ]
+
+def test_read_users_from_yaml(tmp_path):
+    pytest.importorskip("yaml")
+    source = tmp_path / "users.yaml"
+    source.write_text("users:\n  - emailId: ann@example.com\n    firstName: Ann\n    roles: [devadmin]\n")
+
+    assert read_users(str(source)) == [{"emailId": "ann@example.com", "firstName": "Ann", "roles": ["devadmin"]}]
+
+def test_read_users_rejects_missing_email(tmp_path):
+    source = tmp_path / "users.csv"
+    source.write_text("emailId,firstName\n,Ann\n")
+
+    with pytest.raises(ValueError):
+        read_users(str(source))
+
+def test_plan_only_includes_needed_changes(mocker):
+    users_client, roles_client = make_clients(mocker)
+    users = [
+        {"emailId": "ann@example.com", "firstName": "Ann", "lastName": "Lee", "roles": ["devadmin", "opsadmin"]},
+        {"emailId": "bob@example.com", "firstName": "Bob", "lastName": "New", "roles": ["opsadmin"]},
+        {"emailId": "cat@example.com", "firstName": "Cat", "roles": ["devadmin"]},
+    ]
+
+    changes = UserProvisioner(users_client, roles_client).plan(users)
+
+    assert changes == [
+        {"action": "update_user", "user": "bob@example.com",
+         "payload": {"emailId": "bob@example.com", "firstName": "Bob", "lastName": "New"}},
+        {"action": "add_role", "user": "bob@example.com", "role": "opsadmin"},
+        {"action": "create_user", "user": "cat@example.com", "payload": {"emailId": "cat@example.com", "firstName": "Cat"}},
+        {"action": "add_role", "user": "cat@example.com", "role": "devadmin"},
+    ]
+    users_client.fetch_user_details.assert_has_calls([mocker.call("ann@example.com"), mocker.call("bob@example.com")], any_order=True)
+    assert users_client.fetch_user_details.call_count == 2
+
+def test_plan_removes_roles_when_asked(mocker):
+    users_client, roles_client = make_clients(mocker)
+    users = [
+        {"emailId": "ann@example.com", "roles": ["opsadmin"]},
+        {"emailId": "bob@example.com", "roles": ["opsadmin"]},
+    ]
+
+    changes = UserProvisioner(users_client, roles_client).plan(users, remove_roles=True)
+
+    assert changes == [{"action": "add_role", "user": "bob@example.com", "role": "opsadmin"}]
+
+    users[0]["roles"] = []
+    users[1]["roles"] = ["devadmin", "opsadmin"]
+    changes = UserProvisioner(users_client, roles_client).plan(users, remove_roles=True)
+
+    assert {"action": "remove_role", "user": "ann@example.com", "role": "devadmin"} in changes
+    assert {"action": "remove_role", "user": "ann@example.com", "role": "opsadmin"} in changes
+
+def test_apply_creates_users_before_roles_and_skips_failed_users(mocker):
+    users_client, roles_client = mocker.Mock(), mocker.Mock()
+    calls = []
+    def create_user(payload):
+        calls.append(("create", payload["emailId"]))
+        if payload["emailId"] == "bad@example.com":
+            raise requests.HTTPError("400 Bad Request")
+        return {}
+    users_client.create_user.side_effect = create_user
+    roles_client.add_user_to_role.side_effect = lambda role, user: calls.append(("add", user))
+    changes = [
+        {"action": "add_role", "user": "cat@example.com", "role": "devadmin"},
+        {"action": "add_role", "user": "bad@example.com", "role": "devadmin"},
+        {"action": "create_user", "user": "cat@example.com", "payload": {"emailId": "cat@example.com"}},
+        {"action": "create_user", "user": "bad@example.com", "payload": {"emailId": "bad@example.com"}},
+    ]
+
+    results = list(UserProvisioner(users_client, roles_client, rate=1000).apply(changes))
+
+    statuses = {(result["action"], result["user"]): result["status"] for result in results}
+    assert statuses == {
+        ("create_user", "cat@example.com"): "ok",
+        ("create_user", "bad@example.com"): "failed",
+        ("add_role", "cat@example.com"): "ok",
+        ("add_role", "bad@example.com"): "skipped",
+    }
+    assert calls.index(("add", "cat@example.com")) > calls.index(("create", "cat@example.com"))
+    roles_client.add_user_to_role.assert_called_once_with("devadmin", "cat@example.com")
+
+def test_provision_dry_run_does_not_apply(mocker, tmp_path):
+    users_client, roles_client = make_clients(mocker)
+    source = tmp_path / "users.csv"
+    source.write_text("emailId,firstName,roles\ncat@example.com,Cat,devadmin\n")
+
+    changes = UserProvisioner(users_client, roles_client).provision(str(source), dry_run=True)
+
+    assert [change["action"] for change in changes] == ["create_user", "add_role"]
+    users_client.create_user.assert_not_called()
+    roles_client.add_user_to_role.assert_not_called()
+
+def test_read_users_accepts_a_single_yaml_role(tmp_path):
+    pytest.importorskip("yaml")
+    source = tmp_path / "users.yaml"
+    source.write_text("- emailId: ann@example.com\n  roles: devadmin\n- emailId: bob@example.com\n  roles: {name: x}\n")
+
+    with pytest.raises(ValueError, match="Invalid roles"):
+        read_users(str(source))
+
+    source.write_text("- emailId: ann@example.com\n  roles: devadmin\n")
+    assert read_users(str(source)) == [{"emailId": "ann@example.com", "roles": ["devadmin"]}]
+
+def test_read_users_rejects_duplicate_emails(tmp_path):
+    source = tmp_path / "users.csv"
+    source.write_text("emailId,firstName\nann@example.com,Ann\nANN@example.com,Anne\n")
+
+    with pytest.raises(ValueError, match="Duplicate emailId"):
+        read_users(str(source))
+
+def test_plan_ignores_fields_the_api_does_not_return(mocker):
+    users_client, roles_client = make_clients(mocker)
+    users = [{"emailId": "ann@example.com", "firstName": "Ann", "lastName": "Lee", "password": "s3cret", "roles": []}]
+
+    assert UserProvisioner(users_client, roles_client).plan(users) == []
+
+def test_plan_rejects_duplicate_emails(mocker):
+    users_client, roles_client = make_clients(mocker)
+
+    with pytest.raises(ValueError, match="cat@example.com"):
+        UserProvisioner(users_client, roles_client).plan([{"emailId": "cat@example.com", "roles": []},
+                                                          {"emailId": "Cat@example.com", "roles": []}])
+
+    users_client.create_user.assert_not_called()
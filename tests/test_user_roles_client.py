@@ -86,5 +86,48 @@ class TestUserRolesClient(unittest.TestCase):
         )
         self.assertEqual(response, {"userRole": "updated"})
 
+    @patch("requests.get")
+    def test_list_role_users(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.json.return_value = ["user@example.com"]
+        mock_get.return_value = mock_response
+
+        response = self.client.list_role_users("role-id")
+
+        mock_get.assert_called_once_with(
+            "https://api.example.com/user-roles/role-id/users",
+            headers={"Authorization": "Bearer test-token"}
+        )
+        self.assertEqual(response, ["user@example.com"])
+
+    @patch("requests.post")
+    def test_add_user_to_role(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.content = b'{"name": "role-id"}'
+        mock_response.json.return_value = {"name": "role-id"}
+        mock_post.return_value = mock_response
+
+        response = self.client.add_user_to_role("role-id", "user+ops@example.com")
+
+        mock_post.assert_called_once_with(
+            "https://api.example.com/user-roles/role-id/users?id=user%2Bops%40example.com",
+            headers={"Authorization": "Bearer test-token"}
+        )
+        self.assertEqual(response, {"name": "role-id"})
+
+    @patch("requests.delete")
+    def test_remove_user_from_role(self, mock_delete):
+        mock_response = MagicMock()
+        mock_response.content = b""
+        mock_delete.return_value = mock_response
+
+        response = self.client.remove_user_from_role("role-id", "user@example.com")
+
+        mock_delete.assert_called_once_with(
+            "https://api.example.com/user-roles/role-id/users/user@example.com",
+            headers={"Authorization": "Bearer test-token"}
+        )
+        self.assertEqual(response, {})
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file